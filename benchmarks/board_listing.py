@@ -0,0 +1,135 @@
+"""게시판 목록 벤치마크 (Postgres 전용)
+
+게시판을 대량으로 시드한 뒤 (90% 공개, 0.1%는 측정 사용자 소유)
+기존 `public OR owner_id` 조건 쿼리와 공개/내 비공개 게시판을 각각 인덱스 순서로 읽어
+UNION ALL로 합치는 쿼리를 정렬 방식(id, 게시글 수)과 위치(첫 페이지, 중간 페이지)별로 비교한다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.board_listing [게시판 수, 기본 1000000] [반복 횟수, 기본 50]
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import select, text
+
+from benchmarks.harness import Recorder, database_url, running_app
+import core.database as database
+from core.pagination import BOARDS_BY_ID, BOARDS_BY_POSTS, NEXT, Cursor, keyset_merge, keyset_query
+from models.board import Board
+
+LIMIT = 20
+COLUMNS = (Board.name, Board.public, Board.id, Board.owner_id, Board.post_count)
+
+
+def _or_query(user_id: int, keys, cursor):
+    # 변경 전 구현 (비교 기준)
+    query = select(*COLUMNS).where((Board.public == True) | (Board.owner_id == user_id))
+    return keyset_query(query, keys, cursor, LIMIT)
+
+
+def _merge_query(user_id: int, keys, cursor):
+    return keyset_merge([
+        select(*COLUMNS).where(Board.public == True),
+        select(*COLUMNS).where(Board.owner_id == user_id, Board.public.isnot(True)),
+    ], keys, cursor, LIMIT)
+
+
+async def _seed(total: int) -> None:
+    # 사용자 1: 측정 대상 (게시판 0.1% 소유), 사용자 2: 나머지 소유
+    async with database.get_engine().begin() as conn:
+        await conn.execute(text("SELECT setseed(0.42)"))
+        await conn.execute(text("""
+            INSERT INTO boards (name, public, owner_id, post_count)
+            SELECT 'board-' || g, g % 10 <> 0, CASE WHEN g % 1000 = 0 THEN 1 ELSE 2 END, (random() * 5000)::int
+            FROM generate_series(1, :total) AS g
+        """), {"total": total})
+        await conn.execute(text("ANALYZE boards"))
+
+
+async def _middle_cursor(keys) -> Cursor:
+    """보이는 게시판 중간쯤 위치의 커서"""
+    async with database.AsyncSessionLocal() as db:
+        count = (await db.execute(text("SELECT count(*) FROM boards WHERE public"))).scalar_one()
+        row = (await db.execute(
+            select(*keys).where(Board.public == True).order_by(*(key.desc() for key in keys))
+            .offset(count // 2).limit(1)
+        )).one()
+    return Cursor(tuple(row), NEXT)
+
+
+async def _plan(query) -> str:
+    """실행 계획에서 정렬/인덱스 노드만 요약"""
+    async with database.AsyncSessionLocal() as db:
+        compiled = query.compile(database.get_engine().sync_engine, compile_kwargs={"literal_binds": True})
+        rows = (await db.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    nodes = []
+    for line in rows:
+        node = line.strip().lstrip("->").strip().split("  (")[0]
+        # 조건/정렬 키 등 노드 속성 줄은 제외
+        if ":" in node or node.split(" ")[0] not in ("Sort", "Index", "Seq", "Bitmap", "Merge", "Incremental"):
+            continue
+        nodes.append(node.replace(" on boards", ""))
+    return ", ".join(dict.fromkeys(nodes))
+
+
+async def _time(query, runs: int) -> list[float]:
+    latencies = []
+    async with database.AsyncSessionLocal() as db:
+        for _ in range(runs):
+            started = time.perf_counter()
+            (await db.execute(query)).all()
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def main(total: int, runs: int) -> None:
+    if not database_url().startswith("postgresql"):
+        sys.exit("board listing benchmark requires BENCH_DATABASE_URL pointing to Postgres")
+
+    recorder = Recorder()
+    async with running_app() as client:
+        headers = {}
+        for i in (1, 2):
+            response = await client.post("/auth/signup", json={
+                "fullname": f"Bench User {i}", "email": f"bench{i}@example.com", "password": "benchpassword",
+            })
+            headers[i] = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        started = time.perf_counter()
+        await _seed(total)
+        print(f"seeded {total} boards in {time.perf_counter() - started:.1f}s")
+
+        print(f"{'query':<34}{'OR p50 ms':>11}{'UNION p50 ms':>14}  plan (OR | UNION)")
+        for sort_name, keys, codec in (
+            ("id", [Board.id], BOARDS_BY_ID),
+            ("post_count", [Board.post_count, Board.id], BOARDS_BY_POSTS),
+        ):
+            for position, cursor in (("first page", None), ("middle page", await _middle_cursor(keys))):
+                old, new = _or_query(1, keys, cursor), _merge_query(1, keys, cursor)
+                async with database.AsyncSessionLocal() as db:
+                    # 같은 결과인지 확인
+                    assert (await db.execute(old)).all() == (await db.execute(new)).all()
+                old_ms = statistics.median(await _time(old, runs)) * 1000
+                new_ms = statistics.median(await _time(new, runs)) * 1000
+                print(f"{sort_name + ' ' + position:<34}{old_ms:>11.2f}{new_ms:>14.2f}  "
+                      f"{await _plan(old)} | {await _plan(new)}")
+
+                # API 경유 (커서 페이지는 목록 캐시를 쓰지 않음)
+                if cursor is not None:
+                    token = codec.encode(cursor.values, "1")
+                    for _ in range(runs):
+                        await recorder.call(f"GET /boards {sort_name}", client.get("/boards", params={
+                            "limit": LIMIT, "cursor": token, "sort_by_posts": str(sort_name == "post_count").lower(),
+                        }, headers=headers[1]))
+
+    print()
+    recorder.report()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    ))
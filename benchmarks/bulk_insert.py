@@ -0,0 +1,77 @@
+"""게시글 일괄 작성 처리량(rows/s) 측정
+
+단건 POST /posts 반복과 POST /posts/bulk(JSON 배열, NDJSON)를 비교한다.
+SQLite는 RETURNING 순서를 보장하지 못해 SQLAlchemy가 행 단위 INSERT로 처리하므로
+multi-row INSERT 효과는 BENCH_DATABASE_URL로 Postgres를 지정해 확인한다.
+
+사용법: python -m benchmarks.bulk_insert [게시글 수, 기본 5000] [요청당 게시글 수, 기본 1000]
+"""
+import asyncio
+import json
+import sys
+import time
+
+from benchmarks.harness import running_app
+
+
+def _posts(count: int, board_ids: list[int], prefix: str) -> list[dict]:
+    return [
+        {"title": f"{prefix}-{i}", "content": "bulk benchmark content", "board_id": board_ids[i % len(board_ids)]}
+        for i in range(count)
+    ]
+
+
+async def main(total: int, per_request: int) -> None:
+    async with running_app() as client:
+        response = await client.post("/auth/signup", json={
+            "fullname": "Bench User",
+            "email": "bench@example.com",
+            "password": "benchpassword",
+        })
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        board_ids = []
+        for i in range(4):
+            board = await client.post("/boards", json={"name": f"bulk-{i}", "public": True}, headers=headers)
+            board_ids.append(board.json()["id"])
+
+        results = {}
+
+        # 단건 작성 (비교 기준, 요청 수가 많으므로 1/10만 측정)
+        single = _posts(max(1, total // 10), board_ids, "single")
+        started = time.perf_counter()
+        queries = 0
+        for post in single:
+            response = await client.post("/posts", json=post, headers=headers)
+            response.raise_for_status()
+            queries += int(response.headers.get("x-query-count", 0))
+        results["single POST /posts"] = (len(single), time.perf_counter() - started, queries)
+
+        for name, content_type in (("bulk JSON", "application/json"), ("bulk NDJSON", "application/x-ndjson")):
+            posts = _posts(total, board_ids, name)
+            started = time.perf_counter()
+            queries = 0
+            for offset in range(0, total, per_request):
+                chunk = posts[offset:offset + per_request]
+                if content_type == "application/json":
+                    body = json.dumps(chunk)
+                else:
+                    body = "\n".join(json.dumps(post) for post in chunk)
+                response = await client.post(
+                    "/posts/bulk", content=body, headers={**headers, "content-type": content_type}
+                )
+                response.raise_for_status()
+                assert response.json()["failed"] == 0
+                queries += int(response.headers.get("x-query-count", 0))
+            results[name] = (total, time.perf_counter() - started, queries)
+
+    print(f"{'mode':<24}{'rows':>8}{'seconds':>10}{'rows/s':>12}{'queries':>9}")
+    for name, (rows, elapsed, queries) in results.items():
+        print(f"{name:<24}{rows:>8}{elapsed:>10.2f}{rows / elapsed:>12.1f}{queries:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+    ))
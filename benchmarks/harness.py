@@ -0,0 +1,153 @@
+"""벤치마크용 인프로세스 실행 환경
+
+실제 FastAPI 앱을 httpx.AsyncClient로 직접 호출한다.
+- Redis: fakeredis
+- DB: BENCH_DATABASE_URL (기본값: 임시 SQLite 파일, 로컬 Postgres 사용 권장)
+"""
+import json
+import os
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+# 설정 검증을 통과하는 기본 환경변수 (.env 가 있으면 그 값이 우선)
+_DEFAULT_ENV = {
+    "POSTGRES_USER": "bench",
+    "POSTGRES_PASSWORD": "benchpassword",
+    "POSTGRES_DB": "bench",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "SECRET_KEY": "benchmark-secret-key-at-least-32-characters",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "SESSION_EXPIRE_MINUTES": "60",
+    "QUERY_COUNT_HEADER": "true",
+    "RATE_LIMIT_ENABLED": "false",  # 단일 사용자로 부하를 주므로 비활성화
+}
+for _key, _value in _DEFAULT_ENV.items():
+    os.environ.setdefault(_key, _value)
+
+import httpx
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import core.database as database
+from core.session import session_store
+
+
+# BENCH_DATABASE_URL이 없을 때 사용할 SQLite 파일 (running_app 시작 시 새로 만듦)
+SQLITE_PATH = os.path.join(tempfile.gettempdir(), "hellofastapi_bench.db")
+
+
+def database_url() -> str:
+    return os.getenv("BENCH_DATABASE_URL") or f"sqlite+aiosqlite:///{SQLITE_PATH}"
+
+
+@asynccontextmanager
+async def running_app() -> AsyncIterator[httpx.AsyncClient]:
+    """빈 DB와 fakeredis 위에서 앱을 띄우고 클라이언트를 반환"""
+    from main import app
+
+    if not os.getenv("BENCH_DATABASE_URL") and os.path.exists(SQLITE_PATH):
+        os.remove(SQLITE_PATH)
+    engine = create_async_engine(database_url())
+    database.use_engine(engine)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(database.Base.metadata.drop_all)
+        await conn.run_sync(database.Base.metadata.create_all)
+
+    await session_store.connect(FakeAsyncRedis(decode_responses=True))
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+    await engine.dispose()
+
+
+class Recorder:
+    """작업별 응답 시간과 SQL 문 수 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.queries: Dict[str, List[int]] = {}
+        self.elapsed: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """동시 실행 구간의 벽시계 시간 기록 (처리량 계산에 사용)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.elapsed[name] = self.elapsed.get(name, 0.0) + time.perf_counter() - started
+
+    async def call(self, name: str, request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await request
+        self.latencies.setdefault(name, []).append(time.perf_counter() - started)
+        if "x-query-count" in response.headers:
+            self.queries.setdefault(name, []).append(int(response.headers["x-query-count"]))
+        response.raise_for_status()
+        return response
+
+    def summary(self) -> Dict[str, dict]:
+        result = {}
+        for name, samples in self.latencies.items():
+            ordered = sorted(samples)
+            result[name] = {
+                "count": len(ordered),
+                "p50_ms": statistics.median(ordered) * 1000,
+                "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+                # phase로 감싼 작업은 벽시계 기준, 아니면 순차 실행 기준
+                "ops_per_sec": len(ordered) / self.elapsed.get(name, sum(ordered)),
+                "queries": statistics.mean(self.queries[name]) if name in self.queries else None,
+            }
+        return result
+
+    def report(self) -> None:
+        print(f"{'operation':<24}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'queries':>9}")
+        for name, row in self.summary().items():
+            queries = f"{row['queries']:.1f}" if row["queries"] is not None else "-"
+            print(
+                f"{name:<24}{row['count']:>8}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+                f"{row['ops_per_sec']:>10.1f}{queries:>9}"
+            )
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, config: dict, summary: Dict[str, dict]) -> None:
+    with open(path, "w") as f:
+        json.dump({"config": config, "results": summary}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(summary: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """기준치 대비 회귀 목록 (p99는 변동이 커서 허용 폭 2배, SQL 문 수는 늘면 바로 회귀)"""
+    regressions = []
+    for name, row in summary.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if row["p50_ms"] > base["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {row['p50_ms']:.2f} ms > baseline {base['p50_ms']:.2f} ms")
+        if row["p99_ms"] > base["p99_ms"] * (1 + 2 * tolerance):
+            regressions.append(f"{name}: p99 {row['p99_ms']:.2f} ms > baseline {base['p99_ms']:.2f} ms")
+        if row["ops_per_sec"] < base["ops_per_sec"] / (1 + tolerance):
+            regressions.append(f"{name}: {row['ops_per_sec']:.1f} ops/s < baseline {base['ops_per_sec']:.1f} ops/s")
+        if row["queries"] is not None and base.get("queries") is not None and row["queries"] > base["queries"] + 0.1:
+            regressions.append(f"{name}: {row['queries']:.1f} queries > baseline {base['queries']:.1f}")
+    return regressions
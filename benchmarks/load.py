@@ -0,0 +1,215 @@
+"""주요 API 부하 테스트 (기준치 대비 회귀 시 실패)
+
+사용자/게시판/게시글을 DB에 직접 시드한 뒤 실제 앱을 동시 요청으로 호출해
+작업별 p50/p99 지연 시간, 처리량, 요청당 SQL 문 수를 측정한다.
+- 측정 작업: 회원가입, 로그인, 게시판 목록(최신순/게시글 수순), 게시글 목록, 게시글 작성/조회/수정/삭제
+- 기준치: --save-baseline으로 저장, 이후 실행에서 --tolerance를 넘는 회귀가 있으면 종료 코드 1
+- 기준치는 같은 장비, 같은 DB, 같은 시드 설정에서 만든 것과만 비교
+
+사용법:
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.load --save-baseline
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.load
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import insert, text
+
+from benchmarks.harness import Recorder, compare, database_url, load_baseline, running_app, save_baseline
+import core.database as database
+from core.security import get_password_hash
+from models.board import Board
+from models.post import Post
+from models.user import User
+
+PASSWORD = "loadpassword"
+DEFAULT_BASELINE = "benchmarks/load_baseline.json"
+
+
+async def seed(rng: random.Random, users: int, boards: int, posts: int) -> List[int]:
+    """사용자/게시판/게시글 직접 INSERT (게시판의 20%는 비공개), 공개 게시판 id 목록 반환"""
+    hashed = get_password_hash(PASSWORD)
+    async with database.get_engine().begin() as conn:
+        user_ids = list((await conn.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [{"fullname": f"Load {i}", "email": f"load{i}@example.com", "hashed_password": hashed}
+             for i in range(users)],
+        )).scalars())
+
+        board_rows = [
+            {"name": f"load-{i}", "public": rng.random() >= 0.2, "owner_id": rng.choice(user_ids), "post_count": 0}
+            for i in range(boards)
+        ]
+        post_rows = [
+            {"title": f"load post {i}", "content": f"load content {i} " * 20, "author_id": rng.choice(user_ids),
+             "board_index": rng.randrange(boards)}
+            for i in range(posts)
+        ]
+        for index, count in Counter(row["board_index"] for row in post_rows).items():
+            board_rows[index]["post_count"] = count
+        board_ids = list((await conn.execute(
+            insert(Board).returning(Board.id, sort_by_parameter_order=True), board_rows
+        )).scalars())
+
+        for offset in range(0, posts, 5000):
+            await conn.execute(insert(Post), [
+                {"title": row["title"], "content": row["content"], "author_id": row["author_id"],
+                 "board_id": board_ids[row.pop("board_index")]}
+                for row in post_rows[offset:offset + 5000]
+            ])
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("ANALYZE"))
+    return [board_id for board_id, row in zip(board_ids, board_rows) if row["public"]]
+
+
+async def run_phase(
+    recorder: Recorder,
+    name: str,
+    iterations: int,
+    concurrency: int,
+    operation: Callable[[int], Awaitable[None]]
+) -> None:
+    """operation(0..iterations-1)을 concurrency개 작업자로 나눠 실행"""
+    pending = iter(range(iterations))
+
+    async def worker() -> None:
+        for i in pending:
+            await operation(i)
+
+    with recorder.phase(name):
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def main(args: argparse.Namespace) -> int:
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    config = {
+        "database": database_url().split(":", 1)[0],
+        "users": args.users,
+        "boards": args.boards,
+        "posts": args.posts,
+        "iterations": args.iterations,
+        "concurrency": args.concurrency,
+    }
+
+    async with running_app() as client:
+        started = time.perf_counter()
+        public_board_ids = await seed(rng, args.users, args.boards, args.posts)
+        print(f"seeded {args.users} users, {args.boards} boards, {args.posts} posts "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        # bcrypt 비용이 커서 인증 작업은 반복 횟수를 줄여 측정
+        auth_iterations = max(1, args.iterations // 10)
+
+        async def signup(i: int) -> None:
+            await recorder.call("signup", client.post("/auth/signup", json={
+                "fullname": f"New {i}", "email": f"new{i}@example.com", "password": PASSWORD,
+            }))
+
+        tokens: List[str] = []
+
+        async def login(i: int) -> None:
+            response = await recorder.call("login", client.post("/auth/login", data={
+                "username": f"load{i % args.users}@example.com", "password": PASSWORD,
+            }))
+            tokens.append(response.json()["access_token"])
+
+        await run_phase(recorder, "signup", auth_iterations, args.concurrency, signup)
+        await run_phase(recorder, "login", auth_iterations, args.concurrency, login)
+
+        def headers() -> dict:
+            return {"Authorization": f"Bearer {rng.choice(tokens)}"}
+
+        async def list_boards(i: int) -> None:
+            await recorder.call("list_boards", client.get("/boards", params={"limit": 20}, headers=headers()))
+
+        async def list_boards_by_posts(i: int) -> None:
+            await recorder.call("list_boards_by_posts", client.get(
+                "/boards", params={"limit": 20, "sort_by_posts": "true"}, headers=headers()
+            ))
+
+        # 게시글 작성/수정/삭제는 작성자가 다를 수 있어 첫 로그인 사용자 소유 게시판 하나를 사용
+        writer = {"Authorization": f"Bearer {tokens[0]}"}
+        own_board = (await client.post(
+            "/boards", json={"name": "load-writer", "public": True}, headers=writer
+        )).json()["id"]
+        post_ids: List[int] = []
+
+        async def list_posts(i: int) -> None:
+            await recorder.call("list_posts", client.get(
+                f"/posts/board/{rng.choice(public_board_ids)}", params={"limit": 20}, headers=headers()
+            ))
+
+        async def create_post(i: int) -> None:
+            response = await recorder.call("create_post", client.post("/posts", json={
+                "title": f"crud {i}", "content": "load test content", "board_id": own_board,
+            }, headers=writer))
+            post_ids.append(response.json()["id"])
+
+        async def get_post(i: int) -> None:
+            await recorder.call("get_post", client.get(f"/posts/{post_ids[i]}", headers=writer))
+
+        async def update_post(i: int) -> None:
+            await recorder.call("update_post", client.put(f"/posts/{post_ids[i]}", json={
+                "title": f"crud {i} updated", "content": "load test content updated",
+            }, headers=writer))
+
+        async def delete_post(i: int) -> None:
+            await recorder.call("delete_post", client.delete(f"/posts/{post_ids[i]}", headers=writer))
+
+        for name, operation in (
+            ("list_boards", list_boards),
+            ("list_boards_by_posts", list_boards_by_posts),
+            ("list_posts", list_posts),
+            ("create_post", create_post),
+            ("get_post", get_post),
+            ("update_post", update_post),
+            ("delete_post", delete_post),
+        ):
+            await run_phase(recorder, name, args.iterations, args.concurrency, operation)
+
+    recorder.report()
+    summary = recorder.summary()
+
+    if args.save_baseline:
+        save_baseline(args.baseline, config, summary)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"no baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+    if baseline["config"] != config:
+        print(f"baseline config {baseline['config']} does not match {config}")
+        return 1
+
+    regressions = compare(summary, baseline["results"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 1 if regressions else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--boards", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=500, help="작업별 요청 수 (인증 작업은 1/10)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="p50/처리량 허용 회귀 비율 (p99는 2배)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
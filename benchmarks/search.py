@@ -0,0 +1,94 @@
+"""게시글 전문 검색 벤치마크 (Postgres 전용)
+
+임의 단어로 만든 게시글을 시드한 뒤 검색 API(tsvector + GIN)와
+ILIKE 전체 스캔 쿼리의 지연 시간을 비교한다.
+
+사용법:
+    BENCH_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.search [게시글 수, 기본 50000] [검색 횟수, 기본 200]
+"""
+import asyncio
+import random
+import sys
+import time
+
+from sqlalchemy import desc, or_, select, text
+
+from benchmarks.harness import Recorder, database_url, running_app
+import core.database as database
+from models.post import Post
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+
+
+def _text(rng: random.Random, words: int) -> str:
+    # 앞쪽 단어가 더 자주 나오도록 치우친 분포 (실제 문서의 단어 빈도와 비슷하게)
+    return " ".join(VOCABULARY[int(rng.paretovariate(1.2)) % len(VOCABULARY)] for _ in range(words))
+
+
+async def _ilike(board_id: int, term: str) -> float:
+    started = time.perf_counter()
+    async with database.AsyncSessionLocal() as db:
+        pattern = f"%{term}%"
+        await db.execute(
+            select(Post.id, Post.title)
+            .where(Post.board_id == board_id, or_(Post.title.ilike(pattern), Post.content.ilike(pattern)))
+            .order_by(desc(Post.id))
+            .limit(10)
+        )
+    return time.perf_counter() - started
+
+
+async def main(total: int, searches: int) -> None:
+    if not database_url().startswith("postgresql"):
+        sys.exit("search benchmark requires BENCH_DATABASE_URL pointing to Postgres")
+
+    rng = random.Random(42)
+    recorder = Recorder()
+    async with running_app() as client:
+        response = await client.post("/auth/signup", json={
+            "fullname": "Bench User",
+            "email": "bench@example.com",
+            "password": "benchpassword",
+        })
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        board_ids = []
+        for i in range(4):
+            board = await client.post("/boards", json={"name": f"search-{i}", "public": True}, headers=headers)
+            board_ids.append(board.json()["id"])
+
+        started = time.perf_counter()
+        for offset in range(0, total, 1000):
+            posts = [
+                {"title": _text(rng, 6), "content": _text(rng, 120), "board_id": board_ids[i % len(board_ids)]}
+                for i in range(offset, min(total, offset + 1000))
+            ]
+            (await client.post("/posts/bulk", json=posts, headers=headers)).raise_for_status()
+        async with database.get_engine().begin() as conn:
+            await conn.execute(text("ANALYZE posts"))
+        print(f"seeded {total} posts in {time.perf_counter() - started:.1f}s")
+
+        ilike_latencies = []
+        for _ in range(searches):
+            board_id = rng.choice(board_ids)
+            # 흔한 단어부터 드문 단어까지 고르게 검색
+            term = VOCABULARY[int(rng.random() ** 2 * 2000)]
+            await recorder.call("search", client.get(
+                f"/posts/board/{board_id}/search", params={"q": term}, headers=headers
+            ))
+            ilike_latencies.append(await _ilike(board_id, term))
+
+    recorder.report()
+    ilike_latencies.sort()
+    print(
+        f"{'ilike (baseline)':<24}{len(ilike_latencies):>8}"
+        f"{ilike_latencies[len(ilike_latencies) // 2] * 1000:>10.2f}"
+        f"{ilike_latencies[min(len(ilike_latencies) - 1, int(len(ilike_latencies) * 0.99))] * 1000:>10.2f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    ))
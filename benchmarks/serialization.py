@@ -0,0 +1,99 @@
+"""목록 페이지 직렬화 CPU 시간 비교
+
+- orm: ORM 객체 로딩 → 항목별 model_validate → 응답 모델 재검증 → jsonable_encoder + json.dumps
+- fast: 컬럼만 조회한 dict → orjson.dumps (현재 목록 API 경로)
+
+사용법: python -m benchmarks.serialization [반복 횟수, 기본 200] [페이지 크기, 기본 100]
+"""
+import asyncio
+import json
+import sys
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import desc, select
+
+from benchmarks.harness import running_app
+import core.database as database
+from models.board import Board
+from models.post import Post
+from schemas.board import BoardList, BoardResponse
+from schemas.post import PostList, PostResponse
+
+
+async def _orm_posts(db, board_id: int, limit: int) -> bytes:
+    result = await db.execute(
+        select(Post).where(Post.board_id == board_id).order_by(desc(Post.id)).limit(limit + 1)
+    )
+    items = [PostResponse.model_validate(post) for post in result.scalars().all()[:limit]]
+    page = PostList.model_validate(PostList(items=items, next_cursor=None), from_attributes=True)
+    return json.dumps(jsonable_encoder(page)).encode()
+
+
+async def _fast_posts(db, board_id: int, limit: int) -> bytes:
+    posts, next_cursor, _ = await Post.get_posts_by_board(db, board_id, None, limit)
+    return orjson.dumps({"items": posts, "next_cursor": next_cursor})
+
+
+async def _orm_boards(db, user_id: int, limit: int) -> bytes:
+    result = await db.execute(
+        select(Board).where((Board.public == True) | (Board.owner_id == user_id)).order_by(desc(Board.id)).limit(limit + 1)
+    )
+    items = [BoardResponse.model_validate(board) for board in result.scalars().all()[:limit]]
+    page = BoardList.model_validate(BoardList(items=items, next_cursor=None), from_attributes=True)
+    return json.dumps(jsonable_encoder(page)).encode()
+
+
+async def _fast_boards(db, user_id: int, limit: int) -> bytes:
+    boards, next_cursor, _ = await Board.get_boards(db, user_id, None, limit)
+    return orjson.dumps({"items": boards, "next_cursor": next_cursor})
+
+
+async def _measure(func, key: int, limit: int, iterations: int) -> float:
+    """페이지당 CPU 시간(ms), 매번 새 세션으로 identity map 영향을 제거"""
+    started = time.process_time()
+    for _ in range(iterations):
+        async with database.AsyncSessionLocal() as db:
+            await func(db, key, limit)
+    return (time.process_time() - started) / iterations * 1000
+
+
+async def main(iterations: int, page_size: int) -> None:
+    async with running_app() as client:
+        response = await client.post("/auth/signup", json={
+            "fullname": "Bench User",
+            "email": "bench@example.com",
+            "password": "benchpassword",
+        })
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        board_id = None
+        for i in range(page_size + 1):
+            board = await client.post("/boards", json={"name": f"serialize-{i}", "public": True}, headers=headers)
+            board_id = board.json()["id"]
+        posts = [
+            {"title": f"post-{i}", "content": "본문 " * 200, "board_id": board_id}
+            for i in range(page_size + 1)
+        ]
+        (await client.post("/posts/bulk", json=posts, headers=headers)).raise_for_status()
+
+        cases = {
+            "posts": (_orm_posts, _fast_posts, board_id),
+            "boards": (_orm_boards, _fast_boards, 1),
+        }
+        print(f"{'listing':<10}{'orm ms/page':>14}{'fast ms/page':>14}{'speedup':>10}")
+        for name, (orm, fast, key) in cases.items():
+            # 워밍업 후 측정
+            await _measure(orm, key, page_size, 5)
+            await _measure(fast, key, page_size, 5)
+            orm_ms = await _measure(orm, key, page_size, iterations)
+            fast_ms = await _measure(fast, key, page_size, iterations)
+            print(f"{name:<10}{orm_ms:>14.3f}{fast_ms:>14.3f}{orm_ms / fast_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    ))
@@ -0,0 +1,42 @@
+"""게시판/게시글 쓰기 경로 지연 시간 측정
+
+사용법: python -m benchmarks.write_latency [반복 횟수]
+"""
+import asyncio
+import sys
+
+from benchmarks.harness import Recorder, running_app
+
+
+async def main(iterations: int) -> None:
+    recorder = Recorder()
+    async with running_app() as client:
+        response = await client.post("/auth/signup", json={
+            "fullname": "Bench User",
+            "email": "bench@example.com",
+            "password": "benchpassword",
+        })
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        for i in range(iterations):
+            board = await recorder.call("create_board", client.post(
+                "/boards", json={"name": f"bench-{i}", "public": True}, headers=headers
+            ))
+            board_id = board.json()["id"]
+            post = await recorder.call("create_post", client.post(
+                "/posts", json={"title": "bench", "content": "bench", "board_id": board_id}, headers=headers
+            ))
+            post_id = post.json()["id"]
+            await recorder.call("update_post", client.put(
+                f"/posts/{post_id}", json={"title": "bench2", "content": "bench2"}, headers=headers
+            ))
+            await recorder.call("delete_post", client.delete(f"/posts/{post_id}", headers=headers))
+            await recorder.call("update_board", client.put(
+                f"/boards/{board_id}", json={"name": f"bench-{i}-x", "public": True}, headers=headers
+            ))
+
+    recorder.report()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
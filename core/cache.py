@@ -0,0 +1,268 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Hashable, Optional
+
+import orjson
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from core import metrics
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_listing_lookups = metrics.counter("listing_cache_lookups_total", "Listing cache lookups", ("kind", "result"))
+
+# 캐시 미스 표시 (None도 캐시 가능한 값이므로 별도 객체 사용)
+MISSING = object()
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class TTLCache:
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# 구독 메시지를 기다리는 한 번의 읽기 제한 시간
+# (listen()은 redis-py 버전에 따라 REDIS_SOCKET_TIMEOUT을 적용해 유휴 구독 연결을 끊으므로 명시적 제한 시간으로 반복해서 읽음)
+PUBSUB_POLL_SECONDS = 1.0
+
+
+async def pubsub_messages(pubsub: PubSub) -> AsyncIterator[dict]:
+    while True:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=PUBSUB_POLL_SECONDS)
+        if message is not None:
+            yield message
+
+
+class InvalidationBus:
+    """Redis pub/sub로 워커 간 캐시 무효화를 전파"""
+
+    def __init__(self, channel: str = INVALIDATION_CHANNEL):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._caches: Dict[str, TTLCache] = {}
+        self._client: Optional[Redis] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, cache: TTLCache) -> TTLCache:
+        self._caches[name] = cache
+        return cache
+
+    async def start(self, client: Redis) -> None:
+        if self._task is not None:
+            return
+        self._client = client
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._client = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub_messages(pubsub):
+                    try:
+                        data = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if data.get("origin") == self.origin:
+                        continue
+                    self._apply(data.get("cache"), data.get("key"))
+            except RedisError:
+                # 연결이 끊긴 동안의 무효화 메시지는 유실되므로 전체 비우고 재구독
+                logger.warning("Cache invalidation listener disconnected, retrying")
+                for cache in self._caches.values():
+                    cache.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _apply(self, name: Optional[str], key: Any) -> None:
+        cache = self._caches.get(name)
+        if cache is None:
+            return
+        if key is None:
+            cache.clear()
+        else:
+            cache.delete(key)
+
+    async def invalidate(self, name: str, key: Any = None) -> None:
+        """로컬 캐시를 즉시 비우고 다른 워커에 전파 (key가 None이면 전체)"""
+        self._apply(name, key)
+        if self._client is None:
+            return
+        message = json.dumps({"cache": name, "key": key, "origin": self.origin})
+        try:
+            await self._client.publish(self.channel, message)
+        except RedisError:
+            # 전파 실패 시 다른 워커는 TTL 만료로 수렴
+            logger.warning("Failed to publish cache invalidation for %s:%s", name, key)
+
+
+invalidation_bus = InvalidationBus()
+
+
+# 버전은 ETag로도 쓰이므로 키가 사라진 뒤(flush, eviction) 이전 값을 다시 쓰지 않도록
+# 현재 시각(마이크로초)에서 다시 시작
+_LISTING_VERSION_INIT = """
+local version = redis.call('GET', KEYS[1])
+if not version then
+    version = ARGV[1]
+    redis.call('SET', KEYS[1], version)
+end
+"""
+
+# 버전 키를 읽고 해당 버전의 캐시 항목을 한 번의 왕복으로 조회
+_LISTING_READ_SCRIPT = _LISTING_VERSION_INIT + """
+if ARGV[2] == '' then
+    return {version}
+end
+return {version, redis.call('GET', ARGV[2] .. version)}
+"""
+
+_LISTING_BUMP_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+if version == 1 then
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+def _version_base() -> str:
+    return str(time.time_ns() // 1000)
+
+
+class ListingCache:
+    """목록 첫 페이지 캐시 (Redis, 쓰기 시 버전 키 증가로 무효화)"""
+
+    def __init__(self, prefix: str = "listing"):
+        self.prefix = prefix
+        self._client: Optional[Redis] = None
+        self._read = None
+        self._bump = None
+
+    def bind(self, client: Redis) -> None:
+        self._client = client
+        self._read = client.register_script(_LISTING_READ_SCRIPT)
+        self._bump = client.register_script(_LISTING_BUMP_SCRIPT)
+
+    def unbind(self) -> None:
+        self._client = None
+        self._read = None
+        self._bump = None
+
+    def _version_key(self, kind: str, scope: Any) -> str:
+        return f"{self.prefix}:{kind}:{scope}:ver"
+
+    def _entry_prefix(self, kind: str, scope: Any, variant: Any) -> str:
+        return f"{self.prefix}:{kind}:{scope}:{variant}:v"
+
+    async def get(self, kind: str, scope: Any, variant: Any) -> tuple[Optional[str], Any]:
+        """(버전, 값) 반환. 캐시를 쓸 수 없으면 버전은 None, 미스면 값은 MISSING"""
+        if self._client is None:
+            return None, MISSING
+        try:
+            with metrics.redis_timer("listing_get"):
+                result = await self._read(
+                    keys=[self._version_key(kind, scope)],
+                    args=[_version_base(), self._entry_prefix(kind, scope, variant)],
+                    client=self._client,
+                )
+        except RedisError:
+            logger.warning("Listing cache read failed for %s:%s", kind, scope)
+            return None, MISSING
+
+        version = result[0]
+        if len(result) > 1 and result[1] is not None:
+            _listing_lookups.labels(kind, "hit").inc()
+            return version, orjson.loads(result[1])
+        _listing_lookups.labels(kind, "miss").inc()
+        return version, MISSING
+
+    async def version(self, kind: str, scope: Any) -> Optional[str]:
+        """캐시 항목 없이 현재 버전만 조회 (ETag 용, 사용할 수 없으면 None)"""
+        if self._client is None:
+            return None
+        try:
+            with metrics.redis_timer("listing_version"):
+                result = await self._read(
+                    keys=[self._version_key(kind, scope)],
+                    args=[_version_base(), ""],
+                    client=self._client,
+                )
+        except RedisError:
+            logger.warning("Listing cache version read failed for %s:%s", kind, scope)
+            return None
+        return result[0]
+
+    async def set(self, kind: str, scope: Any, variant: Any, version: Optional[str], value: Any) -> None:
+        if self._client is None or version is None:
+            return
+        key = self._entry_prefix(kind, scope, variant) + version
+        try:
+            with metrics.redis_timer("listing_set"):
+                await self._client.set(key, orjson.dumps(value), ex=get_settings().LISTING_CACHE_TTL_SECONDS)
+        except RedisError:
+            logger.warning("Listing cache write failed for %s:%s", kind, scope)
+
+    async def bump(self, kind: str, scope: Any) -> None:
+        """버전을 올려 해당 범위의 캐시 항목을 모두 무효화"""
+        if self._client is None:
+            return
+        try:
+            with metrics.redis_timer("listing_bump"):
+                await self._bump(keys=[self._version_key(kind, scope)], args=[_version_base()], client=self._client)
+        except RedisError:
+            # 갱신 실패 시 기존 항목은 TTL 만료로 수렴
+            logger.warning("Listing cache bump failed for %s:%s", kind, scope)
+
+
+listing_cache = ListingCache()
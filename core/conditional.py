@@ -0,0 +1,76 @@
+"""조건부 GET (ETag / Last-Modified)
+
+서비스는 응답 검증자(Validators)를 만들고 요청의 조건(Preconditions)과 비교해
+변경이 없으면 304 HTTPException을 발생시킨다. 라우터는 정상 응답에 헤더만 붙인다.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Header, HTTPException, Response, status
+
+
+@dataclass(frozen=True)
+class Preconditions:
+    if_none_match: Optional[str] = None
+    if_modified_since: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.if_none_match or self.if_modified_since)
+
+
+def get_preconditions(
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None)
+) -> Preconditions:
+    return Preconditions(if_none_match, if_modified_since)
+
+
+def _opaque(etag: str) -> str:
+    # If-None-Match는 약한 비교 (W/ 접두사 무시)
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def __post_init__(self):
+        # timezone 정보가 없는 값(SQLite 등)은 UTC로 간주
+        if self.last_modified is not None and self.last_modified.tzinfo is None:
+            object.__setattr__(self, "last_modified", self.last_modified.replace(tzinfo=timezone.utc))
+
+    def headers(self) -> Dict[str, str]:
+        # 저장은 하되 매번 재검증하도록 (폴링 클라이언트가 304로 확인)
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+    def apply(self, response: Response) -> None:
+        response.headers.update(self.headers())
+
+    def is_not_modified(self, preconditions: Optional[Preconditions]) -> bool:
+        if not preconditions:
+            return False
+        if preconditions.if_none_match:
+            # If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110 13.2.2)
+            candidates = [tag.strip() for tag in preconditions.if_none_match.split(",")]
+            return "*" in candidates or _opaque(self.etag) in {_opaque(tag) for tag in candidates}
+        if self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(preconditions.if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def check(self, preconditions: Optional[Preconditions]) -> None:
+        """변경이 없으면 304 응답"""
+        if self.is_not_modified(preconditions):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers())
@@ -1,23 +1,11 @@
-import os
+from functools import lru_cache
 from pathlib import Path
-from pydantic import field_validator, EmailStr, SecretStr
-from pydantic_settings import BaseSettings, SettingsConfigDict
-import secrets
-from sqlalchemy.engine.url import URL
-from dotenv import load_dotenv
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 # 현재 파일의 디렉토리 경로를 기준으로 .env 파일 경로 설정
 env_path = Path(__file__).parent.parent / '.env'
 
-print(f"\nBefore loading .env:")
-print(f"POSTGRES_PORT: {os.getenv('POSTGRES_PORT')}")
-
-# .env 파일 명시적 로드 (override=True로 설정)
-load_dotenv(env_path, override=True)
-
-print(f"\nAfter loading .env:")
-print(f"POSTGRES_PORT: {os.getenv('POSTGRES_PORT')}")
-
 class Settings(BaseSettings):
     # Database
     POSTGRES_USER: str
@@ -25,12 +13,25 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_HOST: str
     POSTGRES_PORT: int
+
+    # Database pool (워커 프로세스당)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statement 캐시 (pgbouncer 사용 시 0)
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0이면 서버 기본값 사용
     
     # Redis
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_DB: int
-    
+    REDIS_POOL_SIZE: int = 20
+    REDIS_POOL_TIMEOUT: float = 5.0
+    REDIS_SOCKET_TIMEOUT: float = 2.0  # 명령 응답 대기 (응답 없는 Redis에서 요청이 멈추지 않도록)
+    REDIS_CONNECT_TIMEOUT: float = 1.0
+
     # JWT
     SECRET_KEY: str
     ALGORITHM: str
@@ -38,13 +39,46 @@ class Settings(BaseSettings):
     
     # Session
     SESSION_EXPIRE_MINUTES: int
+    SESSION_MAX_PER_USER: int = 10  # 초과 시 오래된 세션부터 만료
+
+    # Password hashing
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
+
+    # Startup
+    CREATE_TABLES_ON_STARTUP: bool = False  # alembic 대신 create_all로 테이블 생성
+
+    # Debug
+    QUERY_COUNT_HEADER: bool = False  # 응답에 X-Query-Count 헤더 추가
+
+    # Cache
+    BOARD_CACHE_SIZE: int = 10000
+    BOARD_CACHE_TTL_SECONDS: float = 30.0
+    LISTING_CACHE_TTL_SECONDS: int = 60
+
+    # Rate limiting (token bucket, 분당 허용 수 / 한 번에 몰아서 허용할 수)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_AUTH_PER_MINUTE: int = 20  # 로그인/회원가입/토큰 갱신 (IP 기준)
+    RATE_LIMIT_AUTH_BURST: int = 10
+    RATE_LIMIT_READ_PER_MINUTE: int = 600  # 조회 (사용자 기준)
+    RATE_LIMIT_READ_BURST: int = 100
+    RATE_LIMIT_WRITE_PER_MINUTE: int = 120  # 작성/수정/삭제 (사용자 기준)
+    RATE_LIMIT_WRITE_BURST: int = 30
+
+    # Bulk post creation
+    BULK_POST_MAX_ITEMS: int = 10000  # 요청당 최대 게시글 수
+    BULK_POST_BATCH_SIZE: int = 1000  # INSERT 한 번에 묶을 행 수
+
+    # Feed (Redis 타임라인별 유지할 최신 게시글 수, 더 과거는 DB에서 조회)
+    FEED_TIMELINE_LENGTH: int = 1000
     
     @property
     def DATABASE_URL(self) -> str:
         return (
             f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
-            # "?client_encoding=utf8"
+            f"?prepared_statement_cache_size={self.DB_STATEMENT_CACHE_SIZE}"
+            # "&client_encoding=utf8"
         )
 
     model_config = SettingsConfigDict(
@@ -54,10 +88,17 @@ class Settings(BaseSettings):
         extra='ignore'
     )
 
-    # PostgreSQL 컨테이너의 기본 환경변수 무시
-    @field_validator('POSTGRES_PORT', mode='before')
-    def validate_postgres_port(cls, v: int) -> int:
-        return int(os.getenv('POSTGRES_PORT', '25000'))  # .env 파일의 값 우선 사용
+    # .env 파일의 값을 환경변수보다 우선 사용 (PostgreSQL 컨테이너의 기본 환경변수 무시)
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return init_settings, dotenv_settings, env_settings, file_secret_settings
 
     @field_validator('POSTGRES_PASSWORD')
     def validate_postgres_password(cls, v: str) -> str:
@@ -65,6 +106,18 @@ class Settings(BaseSettings):
             raise ValueError('PostgreSQL password must be at least 8 characters long')
         return v
 
+    @field_validator('DB_POOL_SIZE')
+    def validate_db_pool_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Database pool size must be at least 1')
+        return v
+
+    @field_validator('DB_MAX_OVERFLOW', 'DB_STATEMENT_CACHE_SIZE', 'DB_STATEMENT_TIMEOUT_MS')
+    def validate_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError('Value must be non-negative')
+        return v
+
     # Redis 관련 검증
     @field_validator('REDIS_PORT')
     def validate_redis_port(cls, v: int) -> int:
@@ -78,6 +131,18 @@ class Settings(BaseSettings):
             raise ValueError('Redis DB index must be non-negative')
         return v
 
+    @field_validator('REDIS_POOL_SIZE')
+    def validate_redis_pool_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Redis pool size must be at least 1')
+        return v
+
+    @field_validator('REDIS_SOCKET_TIMEOUT', 'REDIS_CONNECT_TIMEOUT')
+    def validate_redis_timeouts(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError('Redis timeouts must be positive')
+        return v
+
     # JWT 관련 검증
     @field_validator('SECRET_KEY')
     def validate_secret_key(cls, v: str) -> str:
@@ -104,43 +169,48 @@ class Settings(BaseSettings):
             raise ValueError('Session expiration must be between 5 and 1440 minutes')
         return v
 
-print(f"\n.env file path: {env_path}")
-print(f"File exists: {env_path.exists()}")
-
-print("\nEnvironment variables from .env file:")
-print("Database settings:")
-print(f"POSTGRES_USER: {os.getenv('POSTGRES_USER')}")
-print(f"POSTGRES_PASSWORD: {os.getenv('POSTGRES_PASSWORD')}")
-print(f"POSTGRES_DB: {os.getenv('POSTGRES_DB')}")
-print(f"POSTGRES_HOST: {os.getenv('POSTGRES_HOST')}")
-print(f"POSTGRES_PORT: {os.getenv('POSTGRES_PORT')}")
+    @field_validator('SESSION_MAX_PER_USER')
+    def validate_session_max_per_user(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Session limit per user must be at least 1')
+        return v
 
-print("\nRedis settings:")
-print(f"REDIS_HOST: {os.getenv('REDIS_HOST')}")
-print(f"REDIS_PORT: {os.getenv('REDIS_PORT')}")
-print(f"REDIS_DB: {os.getenv('REDIS_DB')}")
+    @field_validator('PASSWORD_HASH_WORKERS')
+    def validate_password_hash_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Password hash workers must be at least 1')
+        return v
 
-# settings 인스턴스 생성
-settings = Settings()
+    @field_validator(
+        'RATE_LIMIT_AUTH_PER_MINUTE', 'RATE_LIMIT_AUTH_BURST',
+        'RATE_LIMIT_READ_PER_MINUTE', 'RATE_LIMIT_READ_BURST',
+        'RATE_LIMIT_WRITE_PER_MINUTE', 'RATE_LIMIT_WRITE_BURST',
+    )
+    def validate_rate_limits(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Rate limits must be at least 1')
+        return v
 
-print("\nLoaded Settings instance:")
-print(f"Database URL: {settings.DATABASE_URL}")
-print(f"Database Host: {settings.POSTGRES_HOST}")
-print(f"Database Port: {settings.POSTGRES_PORT}")
-print(f"Redis Host: {settings.REDIS_HOST}")
-print(f"Redis Port: {settings.REDIS_PORT}")
+    @field_validator('BULK_POST_MAX_ITEMS', 'BULK_POST_BATCH_SIZE')
+    def validate_bulk_post_limits(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Bulk post limits must be at least 1')
+        return v
 
-print("\nEnvironment variables:")
-print(f"Container POSTGRES_PORT: {os.environ.get('POSTGRES_PORT')}")  # PostgreSQL 컨테이너의 값
-print(f"ENV file POSTGRES_PORT: {os.getenv('POSTGRES_PORT')}")       # .env 파일의 값
+    @field_validator('FEED_TIMELINE_LENGTH')
+    def validate_feed_timeline_length(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Feed timeline length must be at least 1')
+        return v
 
-print("\nLoaded Settings:")
-print(f"Final POSTGRES_PORT: {settings.POSTGRES_PORT}")              # 최종 사용되는 값
+    @field_validator('PASSWORD_HASH_QUEUE_LIMIT')
+    def validate_password_hash_queue_limit(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError('Password hash queue limit must be non-negative')
+        return v
 
-print("\nAfter Settings initialization:")
-print(f"Settings POSTGRES_PORT: {settings.POSTGRES_PORT}")
-print(f"Environment POSTGRES_PORT: {os.getenv('POSTGRES_PORT')}")
 
-print("\nFinal settings:")
-print(f"Settings POSTGRES_PORT: {settings.POSTGRES_PORT}")
-print(f"Environment POSTGRES_PORT: {os.getenv('POSTGRES_PORT')}") 
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """설정을 처음 사용할 때 한 번만 생성"""
+    return Settings()
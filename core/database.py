@@ -1,31 +1,148 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import time
+from typing import Any, Awaitable, Callable, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from core.config import settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from core.config import get_settings
+from core import metrics
 
 # Base 클래스 생성
 Base = declarative_base()
 
-# 데이터베이스 엔진 생성
-engine = create_async_engine(settings.DATABASE_URL)
+_pool_checkout_wait = metrics.histogram(
+    "db_pool_checkout_wait_seconds", "Time waiting for a pooled connection", buckets=metrics.FAST_BUCKETS
+)
+_pool_in_use = metrics.gauge("db_pool_in_use", "Checked-out database connections")
+_query_time = metrics.histogram("db_query_seconds", "SQL statement execution time", buckets=metrics.FAST_BUCKETS)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 대기 시간과 사용 중인 커넥션 수를 기록하는 풀"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _pool_checkout_wait.observe(time.perf_counter() - started)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    _pool_in_use.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    _pool_in_use.dec()
+
+
+def create_engine_from_settings() -> AsyncEngine:
+    settings = get_settings()
+    connect_args = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        # 서버 측 statement_timeout (밀리초)
+        connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+    new_engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    event.listen(new_engine.sync_engine.pool, "checkout", _on_checkout)
+    event.listen(new_engine.sync_engine.pool, "checkin", _on_checkin)
+    return new_engine
+
+
+class LazySessionmaker(sessionmaker):
+    """처음 세션을 만들 때 엔진을 생성해 연결 (import 시점에는 설정을 읽지 않음)"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            get_engine()
+        return super().__call__(**local_kw)
+
 
 # 세션 팩토리 생성
-AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-)
+AsyncSessionLocal = LazySessionmaker(class_=AsyncSession, expire_on_commit=False)
+
+_engine: Optional[AsyncEngine] = None
+
+
+def get_engine() -> AsyncEngine:
+    """데이터베이스 엔진 (처음 사용할 때 설정으로 생성)"""
+    if _engine is None:
+        use_engine(create_engine_from_settings())
+    return _engine
+
+
+def use_engine(new_engine: AsyncEngine) -> None:
+    """엔진 교체 (벤치마크/테스트에서 다른 DB 사용), 쿼리 계측과 세션 팩토리 연결 포함"""
+    global _engine
+    _engine = new_engine
+    instrument_engine(new_engine)
+    AsyncSessionLocal.configure(bind=new_engine)
+
+
+async def dispose_engine() -> None:
+    global _engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 실패한 문도 요청의 쿼리 수에 포함
+    metrics.count_stage("db")
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    _query_time.observe(elapsed)
+    metrics.add_stage_time("db", elapsed)
+
+
+def instrument_engine(target: AsyncEngine) -> None:
+    event.listen(target.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
 
 # 데이터베이스 테이블 생성 함수
 async def create_tables():
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+def after_commit(session: AsyncSession, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+    """커밋 성공 후 실행할 작업 등록 (캐시 무효화 등)"""
+    session.info.setdefault("after_commit", []).append((func, args))
+
+
+async def commit(session: AsyncSession) -> None:
+    """요청 단위 트랜잭션을 한 번 커밋하고 등록된 후속 작업 실행"""
+    await session.commit()
+    callbacks = session.info.pop("after_commit", [])
+    for func, args in callbacks:
+        await func(*args)
+
+
 # 데이터베이스 세션 의존성
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            await commit(session)
         except Exception:
+            session.info.pop("after_commit", None)
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
@@ -0,0 +1,142 @@
+"""Prometheus 메트릭 등록과 요청 단계별 시간 집계
+
+- 멀티 워커: PROMETHEUS_MULTIPROC_DIR 환경 변수를 지정하면 워커마다 값을 파일에 기록하고
+  /metrics가 모든 워커의 값을 합산 (프로세스 시작 전에 디렉터리를 비워 둘 것)
+- 요청 단계: 요청 컨텍스트마다 DB, Redis, bcrypt 등 단계별 횟수/소요 시간을 모아 요청 종료 시 기록
+"""
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+# 밀리초 단위 연산용 (SQL 문, Redis 명령, 커넥션 대기)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# 같은 이름으로 다시 요청하면 등록된 메트릭을 반환 (모듈 재import, 여러 인스턴스 대비)
+_registry: Dict[str, object] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(cls, name: str, description: str, labelnames: Sequence[str], **kwargs):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = cls(name, description or name, labelnames=tuple(labelnames), **kwargs)
+            _registry[name] = metric
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} already registered as {type(metric).__name__}")
+        return metric
+
+
+def counter(name: str, description: str = "", labelnames: Sequence[str] = ()) -> Counter:
+    return _get_or_create(Counter, name, description, labelnames)
+
+
+def gauge(
+    name: str,
+    description: str = "",
+    labelnames: Sequence[str] = (),
+    multiprocess_mode: str = "livesum"
+) -> Gauge:
+    """multiprocess_mode: 워커 값 합산 방식 (기본값은 살아 있는 워커 합계)"""
+    return _get_or_create(Gauge, name, description, labelnames, multiprocess_mode=multiprocess_mode)
+
+
+def histogram(
+    name: str,
+    description: str = "",
+    labelnames: Sequence[str] = (),
+    buckets: Tuple[float, ...] = Histogram.DEFAULT_BUCKETS
+) -> Histogram:
+    return _get_or_create(Histogram, name, description, labelnames, buckets=buckets)
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render() -> Tuple[bytes, str]:
+    """노출 형식 본문과 Content-Type (멀티 워커면 모든 워커 값을 합산)"""
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """종료하는 워커의 livesum 게이지 값 제거"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+class RequestTimings:
+    """현재 요청에서 단계별로 실행된 횟수와 소요 시간(초)"""
+
+    def __init__(self):
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.seconds: Dict[str, float] = defaultdict(float)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def track_request() -> Iterator[RequestTimings]:
+    timings = RequestTimings()
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def count_stage(stage: str) -> None:
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.counts[stage] += 1
+
+
+def add_stage_time(stage: str, seconds: float) -> None:
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.seconds[stage] += seconds
+
+
+@contextmanager
+def timed(observer, stage: Optional[str] = None) -> Iterator[None]:
+    """블록 소요 시간을 히스토그램에 기록하고 stage가 있으면 요청 단계에도 합산 (await 포함 가능)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        observer.observe(elapsed)
+        if stage is not None:
+            count_stage(stage)
+            add_stage_time(stage, elapsed)
+
+
+_redis_time = histogram(
+    "redis_command_seconds", "Redis round trip time by operation", ("operation",), buckets=FAST_BUCKETS
+)
+
+
+def redis_timer(operation: str):
+    """Redis 호출 시간 기록 (요청의 redis 단계에도 합산)"""
+    return timed(_redis_time.labels(operation), "redis")
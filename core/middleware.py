@@ -0,0 +1,76 @@
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core import metrics
+from core.config import get_settings
+
+# 라우트를 찾지 못한 요청(404 등)은 하나의 라벨로 묶어 라벨 수가 늘어나지 않도록 함
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 요청 안에서 시간을 나눠 기록하는 단계 (core.database, core.session 등에서 집계)
+STAGES = ("db", "redis", "password_hash")
+
+_request_time = metrics.histogram(
+    "http_request_duration_seconds", "Request latency by route", ("method", "route", "status")
+)
+_stage_time = metrics.histogram(
+    "http_request_stage_seconds", "Time spent per stage within a request", ("method", "route", "stage"),
+    buckets=metrics.FAST_BUCKETS
+)
+_request_queries = metrics.histogram(
+    "http_request_db_queries", "SQL statements executed per request", ("method", "route"),
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+)
+
+
+class RequestMetricsMiddleware:
+    """라우트별 응답 시간, 단계별 시간, 요청당 SQL 문 수 기록
+
+    query_count_header가 켜져 있으면 실행된 SQL 문 수를 X-Query-Count 헤더로도 노출
+    (지정하지 않으면 첫 요청 때 QUERY_COUNT_HEADER 설정을 읽음)
+    """
+
+    header = b"x-query-count"
+
+    def __init__(self, app: ASGIApp, query_count_header: Optional[bool] = None):
+        self.app = app
+        self.query_count_header = query_count_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if self.query_count_header is None:
+            self.query_count_header = get_settings().QUERY_COUNT_HEADER
+
+        status_code = 500
+        started = time.perf_counter()
+        with metrics.track_request() as timings:
+            async def send_with_metrics(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if self.query_count_header:
+                        headers = list(message.get("headers", []))
+                        headers.append((self.header, str(timings.counts["db"]).encode()))
+                        message["headers"] = headers
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_metrics)
+            finally:
+                self._record(scope, status_code, time.perf_counter() - started, timings)
+
+    @staticmethod
+    def _record(scope: Scope, status_code: int, elapsed: float, timings: metrics.RequestTimings) -> None:
+        # 라우터가 매칭한 경로 템플릿 (/posts/{post_id}) 기준으로 집계
+        route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+        if route == "/metrics":
+            return
+        method = scope["method"]
+        _request_time.labels(method, route, str(status_code)).observe(elapsed)
+        for stage in STAGES:
+            _stage_time.labels(method, route, stage).observe(timings.seconds[stage])
+        _request_queries.labels(method, route).observe(timings.counts["db"])
@@ -0,0 +1,139 @@
+"""keyset 페이지네이션 커서
+
+커서 = base64url(버전 | 정렬 태그 | 방향 | 정렬 키 값 | HMAC 8바이트)
+- 정렬 방식마다 태그와 값 형식(struct)이 정해져 있어 다른 목록의 커서는 거부
+- scope(게시판 id, 사용자 id 등)는 커서에 담지 않고 서명에만 포함
+- 위조/손상/불일치 커서는 첫 페이지로 대체하지 않고 400 응답
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import asc, desc, select, tuple_, union_all
+from sqlalchemy.sql import ColumnElement, Select
+
+from core.config import get_settings
+
+VERSION = 1
+NEXT = 0
+PREV = 1
+
+_HEADER = struct.Struct(">BBB")  # version, tag, direction
+_MAC_SIZE = 8
+
+
+@dataclass(frozen=True)
+class Cursor:
+    values: Tuple[Any, ...]
+    direction: int = NEXT
+
+
+@lru_cache
+def _signing_key() -> bytes:
+    # JWT 서명 키와 용도를 분리한 파생 키
+    return hashlib.sha256(b"pagination-cursor:" + get_settings().SECRET_KEY.encode()).digest()
+
+
+def _sign(body: bytes, scope: str) -> bytes:
+    return hmac.new(_signing_key(), body + b"\x00" + scope.encode(), hashlib.sha256).digest()[:_MAC_SIZE]
+
+
+def _invalid(detail: str = "Invalid cursor") -> None:
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class CursorCodec:
+    """정렬 방식 하나에 대한 커서 인코더/디코더"""
+
+    def __init__(self, tag: int, value_format: str):
+        self.tag = tag
+        self._values = struct.Struct(">" + value_format)
+
+    def encode(self, values: Sequence[Any], scope: str = "", direction: int = NEXT) -> str:
+        body = _HEADER.pack(VERSION, self.tag, direction) + self._values.pack(*values)
+        return base64.urlsafe_b64encode(body + _sign(body, scope)).rstrip(b"=").decode()
+
+    def decode(self, token: Optional[str], scope: str = "") -> Optional[Cursor]:
+        """커서가 없으면 None (템플릿 변수가 그대로 전달된 경우 포함)"""
+        if not token or token == "{{cursor}}":
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (ValueError, binascii.Error):
+            _invalid()
+        if len(raw) != _HEADER.size + self._values.size + _MAC_SIZE:
+            _invalid()
+
+        body, mac = raw[:-_MAC_SIZE], raw[-_MAC_SIZE:]
+        if not hmac.compare_digest(mac, _sign(body, scope)):
+            _invalid()
+        version, tag, direction = _HEADER.unpack_from(body)
+        if version != VERSION or tag != self.tag or direction not in (NEXT, PREV):
+            _invalid("Cursor does not match this listing")
+        return Cursor(self._values.unpack_from(body, _HEADER.size), direction)
+
+
+# 정렬 방식별 커서 (태그는 바꾸지 말고 새 방식에 새 번호 부여)
+BOARDS_BY_ID = CursorCodec(1, "q")  # (id,)
+BOARDS_BY_POSTS = CursorCodec(2, "qq")  # (post_count, id)
+POSTS_BY_ID = CursorCodec(3, "q")  # (id,)
+POSTS_BY_RANK = CursorCodec(4, "dq")  # (rank, id)
+POSTS_FEED = CursorCodec(5, "q")  # (id,)
+
+
+def keyset_query(query: Select, keys: Sequence[ColumnElement], cursor: Optional[Cursor], limit: int) -> Select:
+    """keys 내림차순 목록에 커서 조건, 정렬, limit + 1 적용 (이전 페이지는 역순으로 조회)"""
+    backward = cursor is not None and cursor.direction == PREV
+    if cursor is not None:
+        position = tuple_(*cursor.values)
+        query = query.where(tuple_(*keys) > position if backward else tuple_(*keys) < position)
+    order = asc if backward else desc
+    return query.order_by(*(order(key) for key in keys)).limit(limit + 1)
+
+
+def keyset_merge(queries: Sequence[Select], keys: Sequence[ColumnElement], cursor: Optional[Cursor], limit: int) -> Select:
+    """서로 겹치지 않는 조건별 쿼리를 각각 keyset_query로 읽어 UNION ALL 후 다시 정렬
+
+    OR 조건은 정렬 인덱스 하나로 읽을 수 없어 조건을 만족하는 행 전체를 정렬하게 되므로,
+    조건마다 자기 인덱스 순서로 limit + 1개만 읽고 합친 결과에서 다시 limit + 1개를 고름.
+    정렬 키와 커서는 keyset_query와 같아 커서 형식은 바뀌지 않음
+    """
+    # SQLite는 UNION 안의 ORDER BY/LIMIT를 허용하지 않으므로 각 조건을 서브쿼리로 감쌈
+    branches = [select(keyset_query(query, keys, cursor, limit).subquery()) for query in queries]
+    merged = union_all(*branches).subquery()
+    backward = cursor is not None and cursor.direction == PREV
+    order = asc if backward else desc
+    return select(merged).order_by(*(order(merged.c[key.key]) for key in keys)).limit(limit + 1)
+
+
+def build_page(
+    rows: List[Any],
+    limit: int,
+    cursor: Optional[Cursor],
+    codec: CursorCodec,
+    key_of: Callable[[Any], Sequence[Any]],
+    scope: str = ""
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """keyset_query 결과로 (항목, 다음 커서, 이전 커서) 생성"""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    backward = cursor is not None and cursor.direction == PREV
+    if backward:
+        rows.reverse()
+
+    next_cursor = prev_cursor = None
+    if rows:
+        # 이전 페이지로 왔다면 뒤쪽 페이지는 항상 존재
+        has_next = True if backward else has_more
+        has_prev = has_more if backward else cursor is not None
+        if has_next:
+            next_cursor = codec.encode(key_of(rows[-1]), scope, NEXT)
+        if has_prev:
+            prev_cursor = codec.encode(key_of(rows[0]), scope, PREV)
+    return rows, next_cursor, prev_cursor
@@ -0,0 +1,153 @@
+"""라우트 그룹별 요청 수 제한 (token bucket)
+
+- Redis: Lua 스크립트로 확인과 차감을 한 번의 왕복에 원자적으로 처리 (모든 워커가 버킷 공유)
+- Redis 장애 시: 워커 프로세스 내 버킷으로 대체 (워커 수만큼 한도가 늘어나는 대신 계속 동작)
+"""
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Request, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core import metrics
+from core.cache import MISSING, TTLCache
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_PREFIX = "ratelimit:"
+
+# 버킷 = {tokens, ts(ms)}, 경과 시간만큼 채운 뒤 cost만큼 차감
+# 반환: {허용 여부, 재시도까지 남은 초}
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) / 1000 * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(retry_after)}
+"""
+
+_rate_limited = metrics.counter("rate_limited_total", "Requests rejected with 429", ("group",))
+
+# 프로세스 내 대체 버킷 수 (오래 쓰지 않은 것부터 제거)
+LOCAL_BUCKET_LIMIT = 100000
+
+
+@dataclass(frozen=True)
+class Limit:
+    per_minute: int
+    burst: int
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60
+
+
+def get_limit(group: str) -> Limit:
+    settings = get_settings()
+    limits = {
+        "auth": Limit(settings.RATE_LIMIT_AUTH_PER_MINUTE, settings.RATE_LIMIT_AUTH_BURST),
+        "reads": Limit(settings.RATE_LIMIT_READ_PER_MINUTE, settings.RATE_LIMIT_READ_BURST),
+        "writes": Limit(settings.RATE_LIMIT_WRITE_PER_MINUTE, settings.RATE_LIMIT_WRITE_BURST),
+    }
+    return limits[group]
+
+
+class RateLimiter:
+    def __init__(self):
+        self._client: Optional[Redis] = None
+        self._script = None
+        self._local = TTLCache(LOCAL_BUCKET_LIMIT, 3600)
+        self._degraded = False
+
+    def bind(self, client: Redis) -> None:
+        self._client = client
+        self._script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+
+    def unbind(self) -> None:
+        self._client = None
+        self._script = None
+
+    async def hit(self, key: str, limit: Limit, cost: int = 1) -> float:
+        """토큰을 차감하고 허용되면 0, 아니면 재시도까지 남은 초를 반환"""
+        now_ms = int(time.time() * 1000)
+        if self._client is not None:
+            try:
+                with metrics.redis_timer("ratelimit"):
+                    allowed, retry_after = await self._script(
+                        keys=[RATE_LIMIT_PREFIX + key],
+                        args=[limit.rate, limit.burst, now_ms, cost],
+                        client=self._client,
+                    )
+            except RedisError:
+                if not self._degraded:
+                    logger.warning("Rate limiter falling back to in-process buckets")
+                    self._degraded = True
+            else:
+                if self._degraded:
+                    logger.info("Rate limiter using Redis again")
+                    self._degraded = False
+                return 0.0 if int(allowed) else float(retry_after)
+        return self._hit_local(key, limit, cost, now_ms)
+
+    def _hit_local(self, key: str, limit: Limit, cost: int, now_ms: int) -> float:
+        bucket = self._local.get(key)
+        if bucket is MISSING:
+            tokens, ts = float(limit.burst), now_ms
+        else:
+            tokens, ts = bucket
+        tokens = min(limit.burst, tokens + max(0, now_ms - ts) / 1000 * limit.rate)
+
+        retry_after = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            retry_after = (cost - tokens) / limit.rate
+        self._local.set(key, (tokens, now_ms))
+        return retry_after
+
+
+rate_limiter = RateLimiter()
+
+
+async def enforce(group: str, identity: str) -> None:
+    """한도를 넘으면 Retry-After 헤더와 함께 429"""
+    if not get_settings().RATE_LIMIT_ENABLED:
+        return
+    retry_after = await rate_limiter.hit(f"{group}:{identity}", get_limit(group))
+    if retry_after > 0:
+        _rate_limited.labels(group).inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+def limit_by_ip(group: str) -> Callable:
+    """클라이언트 IP 기준 제한 (로그인/회원가입 등 인증 전 요청, 프록시 뒤에서는 uvicorn --proxy-headers 필요)"""
+    async def dependency(request: Request) -> None:
+        host = request.client.host if request.client else "unknown"
+        await enforce(group, f"ip:{host}")
+    return dependency
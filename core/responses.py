@@ -0,0 +1,15 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 바로 직렬화하는 응답
+
+    response_model 검증을 거치지 않으므로 이미 응답 스키마 형태로 만든
+    dict/list(DB 조회 결과 등)에만 사용한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
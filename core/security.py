@@ -1,8 +1,20 @@
+import asyncio
+import base64
+import binascii
+import functools
+import hashlib
+import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from core.config import settings
+from jose import JWTError
+import orjson
+from core.cache import MISSING, TTLCache
+from core.config import get_settings
+from core import metrics
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -11,4 +23,156 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """bcrypt 연산을 이벤트 루프 밖의 제한된 스레드 풀에서 실행"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._queue_depth = metrics.gauge("password_hash_queue_depth", "Pending bcrypt jobs")
+        self._rejected = metrics.counter("password_hash_rejected_total", "bcrypt jobs rejected with 503")
+        self._hash_time = metrics.histogram("password_hash_seconds", "bcrypt execution time")
+        self._wait_time = metrics.histogram("password_hash_wait_seconds", "bcrypt queue wait time")
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=get_settings().PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def capacity(self) -> int:
+        settings = get_settings()
+        return settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_LIMIT
+
+    def _timed(self, func: Callable, *args, submitted_at: float):
+        started = time.perf_counter()
+        self._wait_time.observe(started - submitted_at)
+        try:
+            return func(*args)
+        finally:
+            self._hash_time.observe(time.perf_counter() - started)
+
+    async def _run(self, func: Callable, *args):
+        # 대기열이 가득 차면 지연을 쌓지 않고 즉시 거절
+        if self._pending >= self.capacity:
+            self._rejected.inc()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service busy, retry later",
+                headers={"Retry-After": "1"},
+            )
+
+        self.start()
+        self._pending += 1
+        self._queue_depth.set(self._pending)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            job = functools.partial(self._timed, func, *args, submitted_at=time.perf_counter())
+            return await loop.run_in_executor(self._executor, job)
+        finally:
+            self._pending -= 1
+            self._queue_depth.set(self._pending)
+            # 대기 + 실행 시간을 요청 단계 시간에 합산
+            metrics.count_stage("password_hash")
+            metrics.add_stage_time("password_hash", time.perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+
+password_hasher = PasswordHasher()
+
+
+# 검증을 마친 토큰 캐시 (토큰 문자열 -> claims), 만료 시각은 조회 때마다 다시 확인
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL_SECONDS = 60
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+class TokenVerifier:
+    """HMAC 서명 JWT 검증기
+
+    서명 키와 해시 함수를 한 번만 준비하고, 서명이 확인된 헤더 세그먼트와 검증된 토큰을 캐시해
+    요청마다 python-jose 디코딩 없이 서명(HMAC 한 번)과 만료만 확인
+    """
+
+    def __init__(self):
+        self._cache = TTLCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL_SECONDS)
+        self._key: Optional[bytes] = None
+        self._digest = None
+        self._algorithm: Optional[str] = None
+        self._headers: set = set()
+
+    def _prepare(self) -> None:
+        settings = get_settings()
+        self._key = settings.SECRET_KEY.encode()
+        self._algorithm = settings.ALGORITHM
+        self._digest = _HMAC_DIGESTS[settings.ALGORITHM]
+
+    def _check_header(self, segment: str) -> None:
+        if segment in self._headers:
+            return
+        try:
+            header = orjson.loads(_b64decode(segment))
+        except (ValueError, binascii.Error):
+            raise JWTError("Invalid header")
+        if not isinstance(header, dict) or header.get("alg") != self._algorithm:
+            raise JWTError("Algorithm not allowed")
+
+    def verify(self, token: str) -> dict:
+        """서명과 만료를 확인한 claims 반환 (실패 시 JWTError)"""
+        now = time.time()
+        claims = self._cache.get(token)
+        if claims is not MISSING:
+            if claims["exp"] <= now:
+                self._cache.delete(token)
+                raise JWTError("Signature has expired")
+            return claims
+
+        if self._key is None:
+            self._prepare()
+        try:
+            header, payload, signature = token.split(".")
+        except ValueError:
+            raise JWTError("Not enough segments")
+        self._check_header(header)
+
+        expected = hmac.new(self._key, f"{header}.{payload}".encode(), self._digest).digest()
+        try:
+            valid = hmac.compare_digest(expected, _b64decode(signature))
+            claims = orjson.loads(_b64decode(payload))
+        except (ValueError, binascii.Error):
+            raise JWTError("Invalid token")
+        if not valid:
+            raise JWTError("Signature verification failed")
+        # 서명된 헤더만 기억 (위조 토큰마다 다른 헤더를 보내 캐시를 키우지 못하게)
+        self._headers.add(header)
+        if not isinstance(claims, dict) or not isinstance(claims.get("exp"), (int, float)):
+            raise JWTError("Invalid claims")
+        if claims["exp"] <= now:
+            raise JWTError("Signature has expired")
+
+        self._cache.set(token, claims)
+        return claims
+
+
+token_verifier = TokenVerifier()
@@ -0,0 +1,342 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+from redis.asyncio import Redis, BlockingConnectionPool
+from redis.exceptions import RedisError
+
+from core import metrics
+from core.cache import pubsub_messages
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 세션 키 접두사
+SESSION_PREFIX = "session:"
+# 사용자별 세션 목록 (sorted set: 세션 id -> 만료 시각(ms))
+USER_SESSIONS_PREFIX = "user_sessions:"
+# 폐기된 세션 (sorted set: 세션 id -> 해당 세션의 액세스 토큰이 모두 만료되는 시각(ms))
+REVOKED_SESSIONS_KEY = "revoked_sessions"
+REVOCATION_CHANNEL = "session:revoked"
+
+# 세션 키와 폐기 목록 키를 스크립트 안에서 만들므로 단일 Redis 기준 (클러스터에서는 hash tag 필요)
+# 폐기: 폐기 목록에 추가(만료된 항목 정리) 후 "만료 시각(ms) 세션 id"를 워커들에 전파
+_REVOKE = """
+local function revoke(session_id, now, revoke_until)
+    redis.call('DEL', '""" + SESSION_PREFIX + """' .. session_id)
+    redis.call('ZREMRANGEBYSCORE', '""" + REVOKED_SESSIONS_KEY + """', '-inf', now)
+    redis.call('ZADD', '""" + REVOKED_SESSIONS_KEY + """', revoke_until, session_id)
+    redis.call('PUBLISH', '""" + REVOCATION_CHANNEL + """', revoke_until .. ' ' .. session_id)
+end
+"""
+
+# 세션 목록 추가, 만료된 항목 정리, 상한을 넘으면 오래된 세션부터 폐기 (폐기한 세션 id 반환)
+_SESSION_INDEX_ADD = _REVOKE + """
+local function index_add(index, session_id, ttl, now, cap, revoke_until)
+    redis.call('ZREMRANGEBYSCORE', index, '-inf', now)
+    redis.call('ZADD', index, now + ttl * 1000, session_id)
+    local evicted = {}
+    local excess = redis.call('ZCARD', index) - cap
+    if excess > 0 then
+        evicted = redis.call('ZRANGE', index, 0, excess - 1)
+        for _, id in ipairs(evicted) do
+            revoke(id, now, revoke_until)
+        end
+        redis.call('ZREMRANGEBYRANK', index, 0, excess - 1)
+    end
+    -- 목록은 가장 늦게 만료되는 세션과 함께 만료
+    redis.call('PEXPIRE', index, ttl * 1000)
+    return evicted
+end
+"""
+
+# 세션 저장 + 목록 추가
+# KEYS: 세션 키, 사용자 세션 목록 / ARGV: 사용자 id, TTL(초), 현재 시각(ms), 상한, 폐기 유지 시각(ms), 세션 id
+_CREATE_SCRIPT = _SESSION_INDEX_ADD + """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return index_add(KEYS[2], ARGV[6], tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4]), ARGV[5])
+"""
+
+# 이전 세션 검증 + 새 세션 발급 + 이전 세션 폐기를 한 번의 왕복으로 처리
+# KEYS: 이전 세션 키, 새 세션 키, 사용자 세션 목록 / ARGV: 위와 같음, 이전/새 세션 id
+_ROTATE_SCRIPT = _SESSION_INDEX_ADD + """
+local current = redis.call('GET', KEYS[1])
+if not current or current ~= ARGV[1] then
+    return 0
+end
+local now = tonumber(ARGV[3])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+revoke(ARGV[6], now, ARGV[5])
+redis.call('ZREM', KEYS[3], ARGV[6])
+index_add(KEYS[3], ARGV[7], tonumber(ARGV[2]), now, tonumber(ARGV[4]), ARGV[5])
+return 1
+"""
+
+# 세션 하나 폐기 (로그아웃)
+# KEYS: 사용자 세션 목록(선택) / ARGV: 현재 시각(ms), 폐기 유지 시각(ms), 세션 id
+_DELETE_SCRIPT = _REVOKE + """
+revoke(ARGV[3], tonumber(ARGV[1]), ARGV[2])
+if KEYS[1] then
+    redis.call('ZREM', KEYS[1], ARGV[3])
+end
+return 1
+"""
+
+# 사용자의 모든 세션 폐기 후 목록 삭제, 폐기한 세션 id 반환 (목록 크기는 상한으로 제한됨)
+# KEYS: 사용자 세션 목록 / ARGV: 현재 시각(ms), 폐기 유지 시각(ms)
+_REVOKE_ALL_SCRIPT = _REVOKE + """
+local ids = redis.call('ZRANGE', KEYS[1], 0, -1)
+for _, id in ipairs(ids) do
+    revoke(id, tonumber(ARGV[1]), ARGV[2])
+end
+redis.call('DEL', KEYS[1])
+return ids
+"""
+
+
+def session_key(session_id: str) -> str:
+    return f"{SESSION_PREFIX}{session_id}"
+
+
+def user_sessions_key(user_id: int) -> str:
+    return f"{USER_SESSIONS_PREFIX}{user_id}"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def token_ttl() -> int:
+    """액세스 토큰 유효 시간(초), 세션보다 오래 유효하지 않도록 세션 만료 시간으로 제한"""
+    settings = get_settings()
+    return min(settings.ACCESS_TOKEN_EXPIRE_MINUTES, settings.SESSION_EXPIRE_MINUTES) * 60
+
+
+class RevocationFilter:
+    """폐기된 세션 id 집합 (프로세스 내, Redis pub/sub로 워커 간 동기화)
+
+    인증 요청마다 Redis를 조회하지 않도록 폐기 목록을 메모리에 유지.
+    구독 시작 시 Redis의 폐기 목록을 다시 읽어 구독 전/연결이 끊긴 동안의 폐기도 반영.
+    항목은 해당 세션의 토큰이 모두 만료되면 제거되므로 크기는 토큰 유효 시간 동안의 폐기 수로 제한.
+    """
+
+    def __init__(self, channel: str = REVOCATION_CHANNEL):
+        self.channel = channel
+        self._revoked: Dict[str, float] = {}  # 세션 id -> 폐기 유지 시각(epoch 초)
+        self._prune_at = 1024
+        self._client: Optional[Redis] = None
+        self._task: Optional[asyncio.Task] = None
+        self._synced = False
+
+    @property
+    def synced(self) -> bool:
+        """구독 중이고 Redis 폐기 목록을 반영한 상태인지 (아니면 세션 저장소로 확인해야 함)"""
+        return self._synced
+
+    def add(self, session_id: str, revoke_until_ms: float) -> None:
+        self._revoked[session_id] = revoke_until_ms / 1000
+        if len(self._revoked) >= self._prune_at:
+            self._prune()
+
+    def add_many(self, session_ids: Iterable[str], revoke_until_ms: float) -> None:
+        for session_id in session_ids:
+            self.add(session_id, revoke_until_ms)
+
+    def is_revoked(self, session_id: str) -> bool:
+        revoke_until = self._revoked.get(session_id)
+        return revoke_until is not None and revoke_until > time.time()
+
+    def _prune(self) -> None:
+        now = time.time()
+        self._revoked = {sid: until for sid, until in self._revoked.items() if until > now}
+        # 정리 후 크기의 두 배가 될 때까지 다시 정리하지 않음 (삽입당 상수 비용)
+        self._prune_at = max(1024, len(self._revoked) * 2)
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    async def start(self, client: Redis) -> None:
+        if self._task is not None:
+            return
+        self._client = client
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._client = None
+        self._synced = False
+
+    async def _load(self) -> None:
+        entries = await self._client.zrangebyscore(REVOKED_SESSIONS_KEY, _now_ms(), "+inf", withscores=True)
+        for session_id, revoke_until_ms in entries:
+            self.add(session_id, revoke_until_ms)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                # 구독 후 목록을 읽어 그 사이에 발생한 폐기도 놓치지 않음
+                await pubsub.subscribe(self.channel)
+                await self._load()
+                self._synced = True
+                async for message in pubsub_messages(pubsub):
+                    try:
+                        revoke_until_ms, session_id = message["data"].split(" ", 1)
+                        self.add(session_id, float(revoke_until_ms))
+                    except (AttributeError, ValueError):
+                        continue
+            except RedisError:
+                logger.warning("Session revocation listener disconnected, retrying")
+                self._synced = False
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+class SessionStore:
+    """redis.asyncio 커넥션 풀 기반 세션 저장소"""
+
+    def __init__(self):
+        self._pool: Optional[BlockingConnectionPool] = None
+        self._client: Optional[Redis] = None
+        self._create = None
+        self._rotate = None
+        self._delete = None
+        self._revoke_all = None
+        self.revocations = RevocationFilter()
+
+    async def connect(self, client: Optional[Redis] = None) -> None:
+        """커넥션 풀 생성 (client를 넘기면 해당 클라이언트 사용, 벤치마크 등에서 활용)"""
+        if self._client is not None:
+            return
+        if client is None:
+            settings = get_settings()
+            # 풀 크기를 넘는 요청은 커넥션을 새로 만들지 않고 대기
+            self._pool = BlockingConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                max_connections=settings.REDIS_POOL_SIZE,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+                decode_responses=True,
+            )
+            client = Redis(connection_pool=self._pool)
+        self._client = client
+        self._create = self._client.register_script(_CREATE_SCRIPT)
+        self._rotate = self._client.register_script(_ROTATE_SCRIPT)
+        self._delete = self._client.register_script(_DELETE_SCRIPT)
+        self._revoke_all = self._client.register_script(_REVOKE_ALL_SCRIPT)
+        await self.revocations.start(self._client)
+
+    async def close(self) -> None:
+        if self._client is None:
+            return
+        await self.revocations.stop()
+        await self._client.aclose()
+        if self._pool is not None:
+            await self._pool.aclose()
+        self._client = None
+        self._pool = None
+        self._create = None
+        self._rotate = None
+        self._delete = None
+        self._revoke_all = None
+
+    @property
+    def client(self) -> Redis:
+        if self._client is None:
+            raise RuntimeError("Session store is not connected")
+        return self._client
+
+    @property
+    def ttl(self) -> int:
+        return get_settings().SESSION_EXPIRE_MINUTES * 60  # 분을 초로 변환
+
+    @property
+    def max_per_user(self) -> int:
+        return get_settings().SESSION_MAX_PER_USER
+
+    def _revoke_until(self, now_ms: int) -> int:
+        # 폐기된 세션의 토큰은 지금 발급되었더라도 이 시각 이후에는 만료
+        return now_ms + token_ttl() * 1000
+
+    async def create(self, session_id: str, user_id: int) -> int:
+        """세션 저장 (세션 값으로 사용자 ID를 저장해 인증 시 DB 조회 없이 확인)
+
+        사용자 세션이 상한을 넘으면 오래된 세션부터 폐기하고 폐기한 수를 반환
+        """
+        now = _now_ms()
+        revoke_until = self._revoke_until(now)
+        with metrics.redis_timer("session_create"):
+            evicted = await self._create(
+                keys=[session_key(session_id), user_sessions_key(user_id)],
+                args=[user_id, self.ttl, now, self.max_per_user, revoke_until, session_id],
+                client=self.client,
+            )
+        self.revocations.add_many(evicted, revoke_until)
+        return len(evicted)
+
+    async def get_user_id(self, session_id: str) -> Optional[int]:
+        with metrics.redis_timer("session_get"):
+            value = await self.client.get(session_key(session_id))
+        return int(value) if value is not None else None
+
+    async def is_active(self, session_id: str, user_id: int) -> bool:
+        """폐기 여부를 프로세스 내 목록으로 확인 (동기화되지 않은 동안만 Redis 조회)"""
+        if self.revocations.is_revoked(session_id):
+            return False
+        if self.revocations.synced:
+            return True
+        return await self.get_user_id(session_id) == user_id
+
+    async def rotate(self, old_session_id: str, new_session_id: str, user_id: int) -> bool:
+        """이전 세션이 유효하면 새 세션으로 교체"""
+        now = _now_ms()
+        revoke_until = self._revoke_until(now)
+        with metrics.redis_timer("session_rotate"):
+            rotated = await self._rotate(
+                keys=[session_key(old_session_id), session_key(new_session_id), user_sessions_key(user_id)],
+                args=[
+                    str(user_id), self.ttl, now, self.max_per_user, revoke_until,
+                    old_session_id, new_session_id,
+                ],
+                client=self.client,
+            )
+        if rotated:
+            self.revocations.add(old_session_id, revoke_until)
+        return bool(rotated)
+
+    async def delete(self, session_id: str, user_id: Optional[int] = None) -> None:
+        now = _now_ms()
+        revoke_until = self._revoke_until(now)
+        keys: List[str] = [user_sessions_key(user_id)] if user_id is not None else []
+        with metrics.redis_timer("session_delete"):
+            await self._delete(keys=keys, args=[now, revoke_until, session_id], client=self.client)
+        self.revocations.add(session_id, revoke_until)
+
+    async def revoke_all(self, user_id: int) -> int:
+        """사용자의 모든 세션 폐기 (비밀번호 변경, 계정 탈취 대응), 폐기한 세션 수 반환"""
+        now = _now_ms()
+        revoke_until = self._revoke_until(now)
+        with metrics.redis_timer("session_revoke_all"):
+            revoked = await self._revoke_all(
+                keys=[user_sessions_key(user_id)], args=[now, revoke_until], client=self.client
+            )
+        self.revocations.add_many(revoked, revoke_until)
+        return len(revoked)
+
+
+session_store = SessionStore()
+
+
+def get_session_store() -> SessionStore:
+    return session_store
@@ -0,0 +1,206 @@
+"""게시글 타임라인 (Redis sorted set, member = score = 게시글 id)
+
+- timeline:board:{id}: 게시판별 최신 게시글
+- timeline:public: 모든 공개 게시판의 최신 게시글
+피드는 공개 타임라인과 내 비공개 게시판 타임라인을 합쳐 읽는다.
+
+각 타임라인은 최근 FEED_TIMELINE_LENGTH개만 유지하고, DB에서 채운 타임라인에는 표시 항목(id 0)을 둔다.
+표시 항목이 없는 타임라인(Redis 재시작, 기능 도입 전 게시판, 공개 여부 변경 후)은 아직 채워지지 않은 것으로 보고
+호출 측이 DB에서 다시 채운다. 쓰기는 항상 ZADD로 합치므로 채우는 중에 추가된 게시글도 유지된다.
+"""
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core import metrics
+from core.config import get_settings
+from core.pagination import PREV, Cursor
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_PREFIX = "timeline:"
+PUBLIC = "public"
+_SENTINEL = "0"
+
+# 게시글 추가 후 오래된 항목 정리 (rank 0은 표시 항목이므로 1부터 삭제)
+# KEYS: 타임라인들 / ARGV: 유지 개수, 게시글 id들
+_ADD_SCRIPT = """
+local length = tonumber(ARGV[1])
+for _, key in ipairs(KEYS) do
+    for i = 2, #ARGV do
+        redis.call('ZADD', key, ARGV[i], ARGV[i])
+    end
+    redis.call('ZREMRANGEBYRANK', key, 1, -(length + 1))
+end
+return 1
+"""
+
+# 타임라인별로 기준 id 다음 항목을 limit개씩 조회
+# 채워지지 않은 타임라인은 false, 아니면 {남아 있는 가장 오래된 id(길이에 도달해 잘렸을 수 있을 때만, 아니면 0), id 목록}
+# KEYS: 타임라인들 / ARGV: 방향(0 최신→과거, 1 과거→최신), 기준 id(0이면 처음부터), limit, 유지 개수
+_READ_SCRIPT = """
+local result = {}
+for i, key in ipairs(KEYS) do
+    if not redis.call('ZSCORE', key, '""" + _SENTINEL + """') then
+        result[i] = false
+    else
+        local ids
+        if ARGV[1] == '0' then
+            local max = ARGV[2] == '0' and '+inf' or '(' .. ARGV[2]
+            ids = redis.call('ZREVRANGEBYSCORE', key, max, '(0', 'LIMIT', 0, ARGV[3])
+        else
+            ids = redis.call('ZRANGEBYSCORE', key, '(' .. ARGV[2], '+inf', 'LIMIT', 0, ARGV[3])
+        end
+        local oldest = 0
+        if redis.call('ZCARD', key) > tonumber(ARGV[4]) then
+            oldest = redis.call('ZRANGE', key, 1, 1)[1]
+        end
+        result[i] = {oldest, ids}
+    end
+end
+return result
+"""
+
+
+def board_timeline(board_id: int) -> str:
+    return f"{TIMELINE_PREFIX}board:{board_id}"
+
+
+def public_timeline() -> str:
+    return f"{TIMELINE_PREFIX}{PUBLIC}"
+
+
+@dataclass
+class TimelinePage:
+    ids: List[int]  # 중복 제거 후 커서 방향 순서
+    missing: List[str]  # 채워지지 않은 타임라인
+    truncated: bool  # 잘린 타임라인을 끝까지 읽어 더 오래된 게시글이 DB에만 있을 수 있음
+
+
+class Timeline:
+    def __init__(self):
+        self._client: Optional[Redis] = None
+        self._add = None
+        self._read = None
+
+    def bind(self, client: Redis) -> None:
+        self._client = client
+        self._add = client.register_script(_ADD_SCRIPT)
+        self._read = client.register_script(_READ_SCRIPT)
+
+    def unbind(self) -> None:
+        self._client = None
+        self._add = None
+        self._read = None
+
+    @property
+    def length(self) -> int:
+        return get_settings().FEED_TIMELINE_LENGTH
+
+    async def add(self, entries: Iterable[Tuple[int, bool, int]]) -> None:
+        """(게시판 id, 공개 여부, 게시글 id) 추가 (게시판별로 한 번의 스크립트 호출)"""
+        if self._client is None:
+            return
+        by_board = {}
+        for board_id, public, post_id in entries:
+            by_board.setdefault((board_id, public), []).append(post_id)
+        try:
+            with metrics.redis_timer("timeline_add"):
+                for (board_id, public), post_ids in by_board.items():
+                    keys = [board_timeline(board_id)] + ([public_timeline()] if public else [])
+                    await self._add(keys=keys, args=[self.length, *post_ids[-self.length:]], client=self._client)
+        except RedisError:
+            # 누락된 게시글은 피드에서 빠지지만 게시판 목록에는 보임 (타임라인을 다시 채우면 복구)
+            logger.warning("Timeline write failed for %d board(s)", len(by_board))
+
+    async def remove(self, board_id: int, post_id: int) -> None:
+        if self._client is None:
+            return
+        try:
+            with metrics.redis_timer("timeline_remove"):
+                async with self._client.pipeline(transaction=False) as pipe:
+                    pipe.zrem(board_timeline(board_id), post_id)
+                    pipe.zrem(public_timeline(), post_id)
+                    await pipe.execute()
+        except RedisError:
+            # 남은 항목은 피드 조회 시 DB에서 걸러짐
+            logger.warning("Timeline delete failed for post %s", post_id)
+
+    async def discard(self, keys: Sequence[str], post_ids: Sequence[int]) -> None:
+        """DB에 없는 게시글 제거 (삭제와 타임라인 채우기가 겹쳐 남은 항목)"""
+        if self._client is None:
+            return
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.zrem(key, *post_ids)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Timeline cleanup failed for %d post(s)", len(post_ids))
+
+    async def reset(self, key: str) -> None:
+        """타임라인을 버려 다음 조회 때 DB에서 다시 채우도록 함 (게시판 공개 여부 변경 등)"""
+        if self._client is None:
+            return
+        try:
+            await self._client.delete(key)
+        except RedisError:
+            logger.warning("Timeline reset failed for %s", key)
+
+    async def fill(self, key: str, post_ids: Sequence[int]) -> None:
+        """DB에서 읽은 최신 게시글로 타임라인을 채우고 표시 항목 추가"""
+        if self._client is None:
+            return
+        try:
+            with metrics.redis_timer("timeline_fill"):
+                async with self._client.pipeline(transaction=True) as pipe:
+                    pipe.zadd(key, {_SENTINEL: 0, **{str(post_id): post_id for post_id in post_ids}})
+                    pipe.zremrangebyrank(key, 1, -(self.length + 1))
+                    await pipe.execute()
+        except RedisError:
+            logger.warning("Timeline fill failed for %s", key)
+
+    async def read(self, keys: Sequence[str], cursor: Optional[Cursor], limit: int) -> Optional[TimelinePage]:
+        """여러 타임라인을 커서 다음부터 limit개씩 읽어 합침 (Redis를 쓸 수 없으면 None)"""
+        if self._client is None:
+            return None
+        backward = cursor is not None and cursor.direction == PREV
+        after = cursor.values[0] if cursor else 0
+        try:
+            with metrics.redis_timer("timeline_read"):
+                results = await self._read(
+                    keys=list(keys), args=[int(backward), after, limit, self.length], client=self._client
+                )
+        except RedisError:
+            logger.warning("Timeline read failed for %d timeline(s)", len(keys))
+            return None
+
+        missing, streams, truncated = [], [], False
+        for key, result in zip(keys, results):
+            if result is None:
+                missing.append(key)
+                continue
+            oldest, ids = int(result[0]), [int(post_id) for post_id in result[1]]
+            streams.append(ids)
+            # 잘린 타임라인에서 남은 범위 밖을 읽으면 나머지 게시글은 DB에만 있음
+            if oldest:
+                truncated |= after < oldest if backward else len(ids) < limit
+        merged = heapq.merge(*streams, reverse=not backward)
+        ids = [post_id for post_id, _ in zip(_unique(merged), range(limit))]
+        return TimelinePage(ids, missing, truncated)
+
+
+def _unique(ids: Iterable[int]) -> Iterable[int]:
+    # 정렬된 스트림에서 연속된 중복 제거 (공개 여부가 바뀐 게시판의 게시글이 두 타임라인에 있을 수 있음)
+    previous = None
+    for post_id in ids:
+        if post_id != previous:
+            yield post_id
+        previous = post_id
+
+
+timeline = Timeline()
@@ -0,0 +1,34 @@
+"""게시판별 post_count를 posts 테이블 기준으로 재계산하는 보정 작업
+
+보정된 게시판은 버전이 올라가고, 커밋 후 Redis로 모든 워커의 게시판 캐시와 게시판 목록 캐시를 무효화한다.
+
+사용법: python -m jobs.reconcile_post_counts
+"""
+import asyncio
+
+from core.cache import invalidation_bus, listing_cache
+from core.database import AsyncSessionLocal, commit, dispose_engine
+from core.session import session_store
+from models.user import User  # noqa: F401 (관계 매핑 등록)
+from models.post import Post  # noqa: F401
+from models.board import Board
+
+
+async def main() -> None:
+    await session_store.connect()
+    await invalidation_bus.start(session_store.client)
+    listing_cache.bind(session_store.client)
+    try:
+        async with AsyncSessionLocal() as session:
+            fixed = await Board.reconcile_post_counts(session)
+            await commit(session)
+    finally:
+        listing_cache.unbind()
+        await invalidation_bus.stop()
+        await session_store.close()
+        await dispose_engine()
+    print(f"Reconciled post_count for {len(fixed)} board(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
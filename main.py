@@ -1,12 +1,39 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from routers import auth, board, post
 from core.database import create_tables
+from core.session import session_store
+from core.security import password_hasher
+from core.cache import invalidation_bus, listing_cache
+from core.ratelimit import rate_limiter
+from core.timeline import timeline
+from core import metrics
+from core.config import get_settings
+from core.middleware import RequestMetricsMiddleware
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마는 alembic으로 관리, 필요할 때만 시작 시 테이블 생성
+    if get_settings().CREATE_TABLES_ON_STARTUP:
+        await create_tables()
+    await session_store.connect()
+    await invalidation_bus.start(session_store.client)
+    listing_cache.bind(session_store.client)
+    rate_limiter.bind(session_store.client)
+    timeline.bind(session_store.client)
+    password_hasher.start()
+    yield
+    password_hasher.shutdown()
+    timeline.unbind()
+    rate_limiter.unbind()
+    listing_cache.unbind()
+    await invalidation_bus.stop()
+    await session_store.close()
+    metrics.mark_process_dead()
 
-@app.on_event("startup")
-async def startup_event():
-    await create_tables()
+app = FastAPI(lifespan=lifespan)
+
+app.add_middleware(RequestMetricsMiddleware)
 
 # 라우터 등록
 app.include_router(auth.router)
@@ -17,6 +44,12 @@ app.include_router(post.router)
 async def root():
     return {"message": "Hello World"}
 
+@app.get("/metrics")
+async def get_metrics():
+    # Prometheus 노출 형식
+    body, content_type = metrics.render()
+    return Response(body, media_type=content_type)
+
 # @app.get("/hello/{name}")
 # async def say_hello(name: str):
 #     return {"message": f"Hello {name}"}
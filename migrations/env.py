@@ -0,0 +1,69 @@
+import asyncio
+from logging.config import fileConfig
+
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic import context
+
+from core.config import get_settings
+from core.database import Base
+from models.user import User  # noqa: F401 (메타데이터 등록)
+from models.board import Board  # noqa: F401
+from models.post import Post  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# 모델에 매핑하지 않은 Postgres 전용 객체 (models/post.py의 전문 검색 컬럼)
+UNMAPPED_OBJECTS = {"search_vector", "ix_posts_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """autogenerate가 UNMAPPED_OBJECTS를 삭제 대상으로 잡지 않도록 제외"""
+    return not (reflected and compare_to is None and name in UNMAPPED_OBJECTS)
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트만 출력 (alembic upgrade --sql)"""
+    context.configure(
+        url=get_settings().DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    connectable = create_async_engine(get_settings().DATABASE_URL, poolclass=pool.NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,54 @@
+"""composite indexes for keyset pagination
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Post.get_posts_by_board: WHERE board_id = ? AND id < ? ORDER BY id DESC
+    op.create_index('ix_posts_board_id_id', 'posts', ['board_id', 'id'])
+
+    # Board.get_boards: 공개 게시판 / 내 게시판 각각 정렬 순서대로 스캔
+    op.create_index(
+        'ix_boards_public_post_count_id', 'boards', ['post_count', 'id'],
+        postgresql_where=sa.text('public'),
+    )
+    op.create_index(
+        'ix_boards_public_id', 'boards', ['id'],
+        postgresql_where=sa.text('public'),
+    )
+    op.create_index('ix_boards_owner_id_post_count_id', 'boards', ['owner_id', 'post_count', 'id'])
+    op.create_index('ix_boards_owner_id_id', 'boards', ['owner_id', 'id'])
+
+    # 기본 키 인덱스와 중복되는 인덱스 제거
+    op.drop_index('ix_posts_id', table_name='posts')
+    op.drop_index('ix_boards_id', table_name='boards')
+    op.drop_index('ix_users_id', table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_boards_id', 'boards', ['id'])
+    op.create_index('ix_posts_id', 'posts', ['id'])
+
+    op.drop_index('ix_boards_owner_id_id', table_name='boards')
+    op.drop_index('ix_boards_owner_id_post_count_id', table_name='boards')
+    op.drop_index('ix_boards_public_id', table_name='boards')
+    op.drop_index('ix_boards_public_post_count_id', table_name='boards')
+    op.drop_index('ix_posts_board_id_id', table_name='posts')
@@ -1,22 +1,50 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, desc, select
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, select, update, delete, exists, func, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, aliased
 from fastapi import HTTPException, status
-import base64
-import json
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from core.database import Base
+from core.database import Base, after_commit
+from core.cache import TTLCache, MISSING, invalidation_bus, listing_cache
+from core.pagination import BOARDS_BY_ID, BOARDS_BY_POSTS, build_page, keyset_merge
+from core.timeline import board_timeline, public_timeline, timeline
+from core.config import get_settings
 from schemas.board import BoardCreate, BoardUpdate
 
+# 게시판 메타데이터 캐시 (board_id -> 컬럼 값)
+BOARD_CACHE = "boards"
+
+
+@lru_cache
+def _board_cache() -> TTLCache:
+    """처음 사용할 때 설정 값으로 생성해 무효화 버스에 등록"""
+    settings = get_settings()
+    return invalidation_bus.register(
+        BOARD_CACHE, TTLCache(settings.BOARD_CACHE_SIZE, settings.BOARD_CACHE_TTL_SECONDS)
+    )
+
+
 class Board(Base):
     __tablename__ = "boards"
+    __table_args__ = (
+        # 공개 게시판 목록 (post_count / id 정렬)
+        Index("ix_boards_public_post_count_id", "post_count", "id", postgresql_where=text("public")),
+        Index("ix_boards_public_id", "id", postgresql_where=text("public")),
+        # 내 게시판 목록
+        Index("ix_boards_owner_id_post_count_id", "owner_id", "post_count", "id"),
+        Index("ix_boards_owner_id_id", "owner_id", "id"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, unique=True, nullable=False)
     public = Column(Boolean, default=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     post_count = Column(Integer, default=0)
+    # 변경될 때마다 증가 (ETag), 게시글 수 변경 포함
+    version = Column(Integer, nullable=False, server_default=text("1"))
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     owner = relationship("User", back_populates="boards")
     posts = relationship("Post", back_populates="board")
@@ -37,16 +65,43 @@ class Board(Base):
             owner_id=user_id
         )
         db.add(db_board)
-        await db.commit()
-        await db.refresh(db_board)
+        await db.flush()
+        after_commit(db, cls.invalidate_cache)
         return db_board
 
     @classmethod
-    async def get_board_by_id(cls, db: AsyncSession, board_id: int) -> Optional["Board"]:
+    async def _load_board(cls, db: AsyncSession, board_id: int) -> Optional["Board"]:
         query = select(cls).where(cls.id == board_id)
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @classmethod
+    async def get_board_by_id(cls, db: AsyncSession, board_id: int) -> Optional["Board"]:
+        """캐시를 거쳐 조회 (세션에 연결되지 않은 읽기 전용 객체를 반환할 수 있음)"""
+        cached = _board_cache().get(board_id)
+        if cached is not MISSING:
+            return cls(**cached)
+
+        board = await cls._load_board(db, board_id)
+        if board is not None:
+            _board_cache().set(board_id, {
+                'id': board.id,
+                'name': board.name,
+                'public': board.public,
+                'owner_id': board.owner_id,
+                'post_count': board.post_count,
+                'version': board.version,
+                'updated_at': board.updated_at,
+            })
+        return board
+
+    @classmethod
+    async def invalidate_cache(cls, board_id: Optional[int] = None) -> None:
+        """게시판 캐시와 게시판 목록 캐시 무효화"""
+        if board_id is not None:
+            await invalidation_bus.invalidate(BOARD_CACHE, board_id)
+        await listing_cache.bump("boards", "all")
+
     @classmethod
     async def get_board_by_name(cls, db: AsyncSession, name: str) -> Optional["Board"]:
         query = select(cls).where(cls.name == name)
@@ -54,53 +109,77 @@ class Board(Base):
         return result.scalar_one_or_none()
 
     @classmethod
-    async def update_board(cls, db: AsyncSession, board_id: int, board_data: BoardUpdate, user_id: int) -> "Board":
-        board = await cls.get_board_by_id(db, board_id)
+    async def _raise_not_owner(cls, db: AsyncSession, board_id: int, user_id: int, action: str) -> None:
+        # 조건부 UPDATE/DELETE가 실패한 경우에만 원인 확인 (소유자이면 그대로 반환)
+        board = await cls._load_board(db, board_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Board not found"
             )
         
-        # 소유자 확인
         if board.owner_id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this board"
+                detail=f"Not authorized to {action} this board"
             )
-        
-        # 이름이 변경되었고, 새 이름이 이미 존재하는 경우 확인
-        if board_data.name != board.name and await cls.get_board_by_name(db, board_data.name):
+
+    @classmethod
+    async def update_board(cls, db: AsyncSession, board_id: int, board_data: BoardUpdate, user_id: int) -> "Board":
+        # 소유자 확인과 이름 중복 확인을 WHERE 절에 포함한 UPDATE ... RETURNING
+        other = aliased(cls)
+        query = (
+            update(cls)
+            .where(
+                cls.id == board_id,
+                cls.owner_id == user_id,
+                ~exists().where(other.name == board_data.name, other.id != board_id)
+            )
+            .values(
+                name=board_data.name,
+                public=board_data.public,
+                version=cls.version + 1,
+                updated_at=func.now()
+            )
+            .returning(cls)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            result = await db.execute(query)
+        except IntegrityError:
+            # 동시에 같은 이름으로 변경된 경우
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Board name already exists"
+            )
+        board = result.scalar_one_or_none()
+        if not board:
+            await cls._raise_not_owner(db, board_id, user_id, "update")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Board name already exists"
             )
         
-        # 게시판 업데이트
-        board.name = board_data.name
-        board.public = board_data.public
-        
-        await db.commit()
-        await db.refresh(board)
+        after_commit(db, cls.invalidate_cache, board_id)
+        # 공개 여부가 바뀌었을 수 있으므로 공개 타임라인은 다음 피드 조회 때 다시 채움
+        after_commit(db, timeline.reset, public_timeline())
         return board
 
     @classmethod
     async def delete_board(cls, db: AsyncSession, board_id: int, user_id: int) -> None:
-        board = await cls.get_board_by_id(db, board_id)
-        if not board:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Board not found"
-            )
-        
-        if board.owner_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to delete this board"
-            )
+        # 소유자 확인을 WHERE 절에 포함한 DELETE ... RETURNING
+        query = (
+            delete(cls)
+            .where(cls.id == board_id, cls.owner_id == user_id)
+            .returning(cls.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(query)
+        if result.scalar_one_or_none() is None:
+            await cls._raise_not_owner(db, board_id, user_id, "delete")
         
-        await db.delete(board)
-        await db.commit()
+        after_commit(db, cls.invalidate_cache, board_id)
+        after_commit(db, timeline.reset, board_timeline(board_id))
 
     @classmethod
     async def get_boards(
@@ -110,65 +189,112 @@ class Board(Base):
         cursor: Optional[str] = None,
         limit: int = 10,
         sort_by_posts: bool = False
-    ) -> Tuple[list["Board"], Optional[str]]:
-        # 기본 쿼리
-        query = select(cls).where(
-            (cls.public == True) | (cls.owner_id == user_id)
-        )
-        
-        # 커서 처리
-        if cursor and cursor != "{{cursor}}":  # 템플릿 변수가 그대로 전달된 경우 무시
-            try:
-                cursor_data = json.loads(base64.b64decode(cursor))
-                last_post_count = cursor_data['pc']
-                last_id = cursor_data['id']
-                
-                if sort_by_posts:
-                    query = query.where(
-                        (cls.post_count < last_post_count) |
-                        ((cls.post_count == last_post_count) & (cls.id < last_id))
-                    )
-                else:
-                    query = query.where(cls.id < last_id)
-            except:
-                # 잘못된 커서 형식이면 첫 페이지처럼 처리
-                pass
+    ) -> Tuple[list[dict], Optional[str], Optional[str]]:
+        """게시판 목록 조회 (ORM 객체 대신 응답 형태의 dict 반환)
+
+        공개 게시판과 내 비공개 게시판을 각각 부분 인덱스/소유자 인덱스 순서로 읽어 합침
+        (public OR owner_id 조건은 정렬 인덱스를 쓰지 못해 보이는 게시판 전체를 정렬하게 됨)
+        """
+        columns = (cls.name, cls.public, cls.id, cls.owner_id, cls.post_count)
+        visible = [
+            select(*columns).where(cls.public == True),
+            select(*columns).where(cls.owner_id == user_id, cls.public.isnot(True)),
+        ]
         
-        # 정렬
+        # 정렬 방식별 커서 (다른 사용자의 커서는 서명 검증에서 거부)
         if sort_by_posts:
-            query = query.order_by(desc(cls.post_count), desc(cls.id))
+            codec, keys = BOARDS_BY_POSTS, [cls.post_count, cls.id]
+            key_of = lambda board: (board['post_count'], board['id'])
         else:
-            query = query.order_by(desc(cls.id))
+            codec, keys = BOARDS_BY_ID, [cls.id]
+            key_of = lambda board: (board['id'],)
+        page_cursor = codec.decode(cursor, str(user_id))
         
         # 결과 조회
-        query = query.limit(limit + 1)
-        result = await db.execute(query)
-        boards = result.scalars().all()
-        
-        # 다음 페이지 존재 여부 확인
-        has_next = len(boards) > limit
-        if has_next:
-            boards = boards[:-1]
-        
-        # 다음 커서 생성
-        next_cursor = None
-        if has_next and boards:
-            last_board = boards[-1]
-            cursor_data = {
-                'pc': last_board.post_count,
-                'id': last_board.id
-            }
-            next_cursor = base64.b64encode(
-                json.dumps(cursor_data).encode()
-            ).decode()
+        result = await db.execute(keyset_merge(visible, keys, page_cursor, limit))
+        boards = [dict(row) for row in result.mappings()]
         
-        return boards, next_cursor
+        return build_page(boards, limit, page_cursor, codec, key_of, str(user_id))
 
     @classmethod
     async def get_accessible_board(cls, db: AsyncSession, board_id: int, user_id: int) -> Optional["Board"]:
-        query = select(cls).where(
-            cls.id == board_id,
-            ((cls.public == True) | (cls.owner_id == user_id))
+        # 공개 게시판이거나 본인 소유인 경우만 반환
+        board = await cls.get_board_by_id(db, board_id)
+        if board is None or not (board.public or board.owner_id == user_id):
+            return None
+        return board
+
+    @classmethod
+    async def get_accessible_board_visibility(
+        cls, db: AsyncSession, board_ids: Iterable[int], user_id: int
+    ) -> Dict[int, bool]:
+        """여러 게시판의 접근 가능 여부를 한 번의 쿼리로 확인 (접근 가능한 게시판 id -> 공개 여부)"""
+        board_ids = set(board_ids)
+        if not board_ids:
+            return {}
+        query = select(cls.id, cls.public).where(
+            cls.id.in_(board_ids),
+            (cls.public == True) | (cls.owner_id == user_id)
         )
         result = await db.execute(query)
-        return result.scalar_one_or_none() 
\ No newline at end of file
+        return {board_id: bool(public) for board_id, public in result.all()}
+
+    @classmethod
+    async def get_private_board_ids(cls, db: AsyncSession, user_id: int) -> List[int]:
+        """내 비공개 게시판 id 목록 (피드에서 공개 타임라인과 함께 읽을 게시판)"""
+        result = await db.execute(select(cls.id).where(cls.owner_id == user_id, cls.public.isnot(True)))
+        return list(result.scalars().all())
+
+    @classmethod
+    async def adjust_post_count(cls, db: AsyncSession, board_id: int, delta: int) -> None:
+        # 읽기-수정-쓰기 대신 SQL에서 원자적으로 증감
+        result = await db.execute(
+            update(cls)
+            .where(cls.id == board_id)
+            .values(post_count=cls.post_count + delta, version=cls.version + 1, updated_at=func.now())
+            .returning(cls.post_count, cls.version, cls.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        if row is not None:
+            # 커밋 후 로컬 캐시도 갱신된 값으로 보정 (다른 워커는 TTL 내에서 수렴)
+            after_commit(db, cls._patch_cached_post_count, board_id, *row)
+
+    @classmethod
+    async def _patch_cached_post_count(cls, board_id: int, post_count: int, version: int, updated_at) -> None:
+        cached = _board_cache().get(board_id)
+        # 동시에 커밋된 요청의 콜백 순서가 뒤바뀌어도 더 오래된 값으로 덮어쓰지 않음
+        if cached is not MISSING and (cached['version'] or 0) < version:
+            cached.update(post_count=post_count, version=version, updated_at=updated_at)
+
+    @classmethod
+    async def reconcile_post_counts(cls, db: AsyncSession) -> List[int]:
+        """posts 테이블 기준으로 게시글 수를 재계산하고 보정된 게시판 id 목록을 반환
+
+        보정된 게시판은 버전을 올려(ETag/Last-Modified 변경) 커밋 후 캐시를 무효화
+        """
+        from models.post import Post
+
+        actual = (
+            select(func.count(Post.id))
+            .where(Post.board_id == cls.id)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(cls)
+            .where(cls.post_count.is_distinct_from(actual))
+            .values(post_count=actual, version=cls.version + 1, updated_at=func.now())
+            .returning(cls.id)
+            .execution_options(synchronize_session=False)
+        )
+        board_ids = list(result.scalars().all())
+        if board_ids:
+            after_commit(db, cls._invalidate_reconciled, board_ids)
+        return board_ids
+
+    @classmethod
+    async def _invalidate_reconciled(cls, board_ids: List[int]) -> None:
+        # 게시판별 캐시는 각각, 게시판 목록 캐시는 한 번만 무효화
+        for board_id in board_ids:
+            await invalidation_bus.invalidate(BOARD_CACHE, board_id)
+        await listing_cache.bump("boards", "all")
@@ -1,22 +1,36 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, select, desc
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, DDL, event, literal_column, select, desc, func, insert, update, delete, null, or_, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import relationship
 from fastapi import HTTPException, status
-from typing import Optional, Tuple, List
-import base64
+from typing import AsyncIterator, Dict, Optional, Sequence, Tuple, List
 
-from core.database import Base
+from core.database import Base, after_commit
+from core.cache import listing_cache
+from core.pagination import POSTS_BY_ID, POSTS_BY_RANK, POSTS_FEED, Cursor, build_page, keyset_merge, keyset_query
+from core.timeline import timeline
 from schemas.post import PostCreate, PostUpdate
 from models.board import Board
 
+# 전문 검색 설정 (한국어 형태소 분석기가 없으므로 공백 단위 'simple' 사용)
+SEARCH_CONFIG = "simple"
+
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 게시판별 keyset 페이지네이션 (board_id = ? ORDER BY id DESC)
+        Index("ix_posts_board_id_id", "board_id", "id"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     board_id = Column(Integer, ForeignKey("boards.id"), nullable=False)
+    # 수정될 때마다 증가 (ETag)
+    version = Column(Integer, nullable=False, server_default=text("1"))
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     author = relationship("User", back_populates="posts")
     board = relationship("Board", back_populates="posts")
@@ -30,14 +44,44 @@ class Post(Base):
             board_id=board.id
         )
         
-        # 게시판의 게시글 수 증가
-        board.post_count += 1
-        
         db.add(db_post)
-        await db.commit()
-        await db.refresh(db_post)
+        await db.flush()
+        
+        # 게시판의 게시글 수 증가
+        await Board.adjust_post_count(db, board.id, 1)
+        after_commit(db, cls.invalidate_listing, board.id, True)
+        after_commit(db, timeline.add, [(board.id, board.public, db_post.id)])
         return db_post
 
+    @classmethod
+    async def bulk_create_posts(cls, db: AsyncSession, rows: List[dict], user_id: int) -> List[int]:
+        """접근 확인이 끝난 게시글들을 multi-row INSERT ... RETURNING으로 저장하고 id를 입력 순서대로 반환
+
+        게시글 수 보정, 목록 캐시 무효화, 타임라인 추가는 호출 측에서 게시판별로 한 번씩 처리
+        """
+        if not rows:
+            return []
+        result = await db.execute(
+            insert(cls).returning(cls.id, sort_by_parameter_order=True),
+            [
+                {
+                    "title": row["title"],
+                    "content": row["content"],
+                    "author_id": user_id,
+                    "board_id": row["board_id"],
+                }
+                for row in rows
+            ]
+        )
+        return list(result.scalars().all())
+
+    @classmethod
+    async def invalidate_listing(cls, board_id: int, counts_changed: bool = False) -> None:
+        """게시글 목록 캐시 무효화 (게시글 수가 바뀌면 게시판 목록도 함께)"""
+        await listing_cache.bump("posts", board_id)
+        if counts_changed:
+            await listing_cache.bump("boards", "all")
+
     @classmethod
     async def get_post_by_id(cls, db: AsyncSession, post_id: int) -> Optional["Post"]:
         query = select(cls).where(cls.id == post_id)
@@ -45,49 +89,88 @@ class Post(Base):
         return result.scalar_one_or_none()
 
     @classmethod
-    async def update_post(cls, db: AsyncSession, post_id: int, post_data: PostUpdate, user_id: int) -> "Post":
-        post = await cls.get_post_by_id(db, post_id)
-        if not post:
+    async def get_accessible_post(cls, db: AsyncSession, post_id: int, user_id: int) -> Tuple[Optional["Post"], bool]:
+        """게시글과 게시판 접근 가능 여부를 한 번의 조인 쿼리로 조회"""
+        query = (
+            select(cls, or_(Board.public == True, Board.owner_id == user_id))
+            .join(Board, Board.id == cls.board_id)
+            .where(cls.id == post_id)
+        )
+        result = await db.execute(query)
+        row = result.first()
+        if row is None:
+            return None, False
+        return row[0], bool(row[1])
+
+    @classmethod
+    async def get_accessible_post_version(cls, db: AsyncSession, post_id: int, user_id: int) -> Tuple[Optional[Row], bool]:
+        """본문 없이 (version, updated_at)과 접근 가능 여부만 조회 (조건부 GET 용)"""
+        query = (
+            select(cls.version, cls.updated_at, or_(Board.public == True, Board.owner_id == user_id))
+            .join(Board, Board.id == cls.board_id)
+            .where(cls.id == post_id)
+        )
+        result = await db.execute(query)
+        row = result.first()
+        if row is None:
+            return None, False
+        return row, bool(row[2])
+
+    @classmethod
+    async def _raise_not_author(cls, db: AsyncSession, post_id: int, action: str) -> None:
+        # 조건부 UPDATE/DELETE가 실패한 경우에만 원인 확인
+        if not await cls.get_post_by_id(db, post_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post not found"
             )
-        
-        if post.author_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this post"
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this post"
+        )
+
+    @classmethod
+    async def update_post(cls, db: AsyncSession, post_id: int, post_data: PostUpdate, user_id: int) -> "Post":
+        # 작성자 확인을 WHERE 절에 포함한 UPDATE ... RETURNING
+        query = (
+            update(cls)
+            .where(cls.id == post_id, cls.author_id == user_id)
+            .values(
+                title=post_data.title,
+                content=post_data.content,
+                version=cls.version + 1,
+                updated_at=func.now()
             )
+            .returning(cls)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(query)
+        post = result.scalar_one_or_none()
+        if not post:
+            await cls._raise_not_author(db, post_id, "update")
         
-        post.title = post_data.title
-        post.content = post_data.content
-        
-        await db.commit()
-        await db.refresh(post)
+        after_commit(db, cls.invalidate_listing, post.board_id)
         return post
 
     @classmethod
     async def delete_post(cls, db: AsyncSession, post_id: int, user_id: int) -> None:
-        post = await cls.get_post_by_id(db, post_id)
-        if not post:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Post not found"
-            )
-        
-        if post.author_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to delete this post"
-            )
+        # 작성자 확인을 WHERE 절에 포함한 DELETE ... RETURNING
+        query = (
+            delete(cls)
+            .where(cls.id == post_id, cls.author_id == user_id)
+            .returning(cls.board_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(query)
+        board_id = result.scalar_one_or_none()
+        if board_id is None:
+            await cls._raise_not_author(db, post_id, "delete")
         
         # 게시판의 게시글 수 감소
-        board = await Board.get_board_by_id(db, post.board_id)
-        if board:
-            board.post_count -= 1
+        await Board.adjust_post_count(db, board_id, -1)
         
-        await db.delete(post)
-        await db.commit()
+        after_commit(db, cls.invalidate_listing, board_id, True)
+        after_commit(db, timeline.remove, board_id, post_id)
 
     @classmethod
     async def get_posts_by_board(
@@ -95,35 +178,171 @@ class Post(Base):
         db: AsyncSession,
         board_id: int,
         cursor: Optional[str] = None,
-        limit: int = 10
-    ) -> Tuple[List["Post"], Optional[str]]:
-        # 기본 쿼리
-        query = select(cls).where(cls.board_id == board_id)
-        
-        # 커서 처리
-        if cursor and cursor != "{{cursor}}":
-            try:
-                last_id = int(base64.b64decode(cursor))
-                query = query.where(cls.id < last_id)
-            except:
-                pass
+        limit: int = 10,
+        summary: bool = False,
+        excerpt_length: int = 0
+    ) -> Tuple[list[dict], Optional[str], Optional[str]]:
+        """게시글 목록 조회 (ORM 객체 대신 응답 형태의 dict 반환, summary이면 본문 대신 발췌)"""
+        query = select(*cls._listing_columns(summary, excerpt_length)).where(cls.board_id == board_id)
         
-        # 정렬 및 제한
-        query = query.order_by(desc(cls.id)).limit(limit + 1)
+        # 커서 적용 및 결과 조회
+        page_cursor = POSTS_BY_ID.decode(cursor, str(board_id))
+        result = await db.execute(keyset_query(query, [cls.id], page_cursor, limit))
+        posts = [dict(row) for row in result.mappings()]
         
-        # 결과 조회
+        return build_page(posts, limit, page_cursor, POSTS_BY_ID, lambda post: (post['id'],), str(board_id))
+
+    @classmethod
+    def _listing_columns(cls, summary: bool, excerpt_length: int) -> list:
+        # 컬럼 순서는 응답 스키마(PostResponse/PostSummary) 필드 순서와 동일하게
+        if not summary:
+            return [cls.title, cls.content, cls.id, cls.author_id, cls.board_id]
+        if excerpt_length:
+            # 본문 전체를 전송하지 않도록 DB에서 잘라서 조회
+            excerpt = func.substr(cls.content, 1, excerpt_length).label("excerpt")
+            return [cls.id, cls.title, cls.author_id, cls.board_id, excerpt]
+        return [cls.id, cls.title, cls.author_id, cls.board_id, null().label("excerpt")]
+
+    @classmethod
+    async def get_posts_by_ids(
+        cls,
+        db: AsyncSession,
+        post_ids: Sequence[int],
+        user_id: int,
+        summary: bool = False,
+        excerpt_length: int = 0
+    ) -> Tuple[list[dict], List[int]]:
+        """타임라인의 게시글 id들을 WHERE id IN (...) 한 번으로 조회
+
+        (접근 가능한 게시글을 post_ids 순서대로, 이미 삭제된 게시글 id) 반환
+        """
+        if not post_ids:
+            return [], []
+        accessible = or_(Board.public == True, Board.owner_id == user_id).label("accessible")
+        query = (
+            select(*cls._listing_columns(summary, excerpt_length), accessible)
+            .join(Board, Board.id == cls.board_id)
+            .where(cls.id.in_(post_ids))
+        )
         result = await db.execute(query)
-        posts = result.scalars().all()
+        # 접근할 수 없는 게시글(공개 여부가 바뀐 게시판)은 None
+        found: Dict[int, Optional[dict]] = {}
+        for row in result.mappings():
+            post = dict(row)
+            found[post["id"]] = post if post.pop("accessible") else None
+        posts = [found[post_id] for post_id in post_ids if found.get(post_id)]
+        deleted = [post_id for post_id in post_ids if post_id not in found]
+        return posts, deleted
+
+    @classmethod
+    async def get_feed(
+        cls,
+        db: AsyncSession,
+        user_id: int,
+        private_board_ids: Sequence[int],
+        page_cursor: Optional[Cursor],
+        limit: int = 10,
+        summary: bool = False,
+        excerpt_length: int = 0
+    ) -> Tuple[list[dict], Optional[str], Optional[str]]:
+        """타임라인을 쓸 수 없을 때의 피드 조회 (공개 게시판과 내 비공개 게시판의 게시글을 각각 읽어 합침)"""
+        columns = cls._listing_columns(summary, excerpt_length)
+        visible = [select(*columns).join(Board, Board.id == cls.board_id).where(Board.public == True)]
+        if private_board_ids:
+            visible.append(select(*columns).where(cls.board_id.in_(private_board_ids)))
+        result = await db.execute(keyset_merge(visible, [cls.id], page_cursor, limit))
+        posts = [dict(row) for row in result.mappings()]
         
-        # 다음 페이지 존재 여부 확인
-        has_next = len(posts) > limit
-        if has_next:
-            posts = posts[:-1]
+        return build_page(posts, limit, page_cursor, POSTS_FEED, lambda post: (post['id'],), str(user_id))
+
+    @classmethod
+    async def get_timeline_ids(cls, db: AsyncSession, limit: int, board_id: Optional[int] = None) -> List[int]:
+        """타임라인을 다시 채울 최신 게시글 id (board_id가 없으면 공개 게시판 전체)"""
+        query = select(cls.id)
+        if board_id is None:
+            query = query.join(Board, Board.id == cls.board_id).where(Board.public == True)
+        else:
+            query = query.where(cls.board_id == board_id)
+        result = await db.execute(query.order_by(desc(cls.id)).limit(limit))
+        return list(result.scalars().all())
+
+    @classmethod
+    async def stream_posts_by_board(
+        cls,
+        db: AsyncSession,
+        board_id: int,
+        batch_size: int = 1000
+    ) -> AsyncIterator[dict]:
+        """게시판의 게시글을 목록과 같은 순서(id DESC)로 서버 측 커서를 통해 스트리밍"""
+        query = (
+            select(cls.id, cls.title, cls.content, cls.author_id, cls.board_id)
+            .where(cls.board_id == board_id)
+            .order_by(desc(cls.id))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await db.stream(query)
+        async for row in result.mappings():
+            yield row
+
+    @classmethod
+    async def search_posts(
+        cls,
+        db: AsyncSession,
+        board_id: int,
+        query_text: str,
+        cursor: Optional[str] = None,
+        limit: int = 10
+    ) -> Tuple[list[dict], Optional[str], Optional[str]]:
+        """게시판 내 전문 검색 (관련도 순, (rank, id) keyset 페이지네이션)
+
+        search_vector 컬럼은 Postgres 전용이므로 다른 DB에서는 501
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Full-text search requires PostgreSQL"
+            )
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+        rank = func.ts_rank_cd(search_vector, ts_query)
+        query = (
+            select(
+                cls.id,
+                cls.title,
+                cls.author_id,
+                cls.board_id,
+                func.ts_headline(SEARCH_CONFIG, cls.content, ts_query, "MaxWords=20, MinWords=5").label("excerpt"),
+                rank.label("rank"),
+            )
+            .where(cls.board_id == board_id, search_vector.op("@@")(ts_query))
+        )
         
-        # 다음 커서 생성
-        next_cursor = None
-        if has_next and posts:
-            last_post = posts[-1]
-            next_cursor = base64.b64encode(str(last_post.id).encode()).decode()
+        # 커서는 게시판과 검색어에 묶어서 서명 (다른 검색어의 rank 값으로 페이지를 넘기지 않도록)
+        scope = f"{board_id}:{query_text}"
+        page_cursor = POSTS_BY_RANK.decode(cursor, scope)
+        result = await db.execute(keyset_query(query, [rank, cls.id], page_cursor, limit))
+        posts = [dict(row) for row in result.mappings()]
         
-        return posts, next_cursor 
\ No newline at end of file
+        return build_page(posts, limit, page_cursor, POSTS_BY_RANK, lambda post: (post['rank'], post['id']), scope)
+
+
+# 제목 + 본문 검색용 tsvector (Postgres generated column, 매핑하지 않고 검색 쿼리에서만 참조)
+search_vector = literal_column("posts.search_vector", type_=TSVECTOR)
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || coalesce(content, ''))"
+)
+
+# create_all로 테이블을 만드는 경우에도 검색 컬럼과 GIN 인덱스 생성 (마이그레이션 0003과 동일)
+event.listen(
+    Post.__table__,
+    "after_create",
+    DDL(
+        f"ALTER TABLE posts ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Post.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_posts_search_vector ON posts USING gin (search_vector)").execute_if(dialect="postgresql"),
+)
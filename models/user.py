@@ -2,14 +2,16 @@ from sqlalchemy import Column, Integer, String, DateTime, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 from core.database import Base
-from core.security import get_password_hash, verify_password
+from core.security import password_hasher
 from schemas.user import UserCreate
 from fastapi import HTTPException, status
 
 class User(Base):
     __tablename__ = "users"
+    # created_at 등 서버 기본값을 INSERT ... RETURNING으로 바로 받아옴
+    __mapper_args__ = {"eager_defaults": True}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     fullname = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
@@ -32,11 +34,10 @@ class User(Base):
         db_user = cls(
             fullname=user_data.fullname,
             email=user_data.email,
-            hashed_password=get_password_hash(user_data.password)
+            hashed_password=await password_hasher.hash(user_data.password)
         )
         db.add(db_user)
-        await db.commit()
-        await db.refresh(db_user)
+        await db.flush()
         return db_user
 
     @classmethod
@@ -48,7 +49,7 @@ class User(Base):
     @classmethod
     async def authenticate_user(cls, db: AsyncSession, email: str, password: str) -> "User":
         user = await cls.get_user_by_email(db, email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await password_hasher.verify(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
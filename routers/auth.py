@@ -1,32 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from sqlalchemy.ext.asyncio import AsyncSession
-from redis import Redis
-from jose import JWTError, jwt
-from core.config import settings
+from jose import JWTError
+from redis.exceptions import RedisError
 
 from core.database import get_db
-from core.config import settings
+from core.ratelimit import enforce, limit_by_ip
+from core.security import token_verifier
+from core.session import SessionStore, get_session_store
 from schemas.user import UserCreate, UserLogin, Token
 from services.user import UserService
-from models.user import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-redis_client = Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB
-)
-
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    return UserService(db, redis_client)
+def get_user_service(
+    db: Session = Depends(get_db),
+    session_store: SessionStore = Depends(get_session_store)
+) -> UserService:
+    return UserService(db, session_store)
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
+    session_store: SessionStore = Depends(get_session_store)
 ) -> int:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,20 +30,35 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+        payload = token_verifier.verify(token)
+        user_id = payload.get("uid")
+        session_id = payload.get("session")
+        if user_id is None or session_id is None:
             raise credentials_exception
             
-        user = await User.get_user_by_email(db, email)
-        if user is None:
+        # 로그아웃/갱신/폐기된 세션은 거부 (프로세스 내 폐기 목록으로 확인, Redis 왕복 없음)
+        try:
+            active = await session_store.is_active(session_id, user_id)
+        except RedisError:
+            # 폐기 목록이 동기화되지 않은 동안 Redis도 응답하지 않으면 세션을 확인할 수 없음
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Session store unavailable, retry later",
+                headers={"Retry-After": "1"},
+            )
+        if not active:
             raise credentials_exception
             
-        return user.id
+        return user_id
     except JWTError:
         raise credentials_exception
 
-@router.post("/signup", response_model=Token)
+async def limit_by_user(request: Request, user_id: int = Depends(get_current_user)) -> None:
+    """인증된 사용자 기준 제한 (GET은 reads, 나머지는 writes 한도)"""
+    group = "reads" if request.method in ("GET", "HEAD") else "writes"
+    await enforce(group, f"user:{user_id}")
+
+@router.post("/signup", response_model=Token, dependencies=[Depends(limit_by_ip("auth"))])
 async def signup(
     user_data: UserCreate,
     user_service: UserService = Depends(get_user_service)
@@ -67,27 +78,36 @@ async def logout(
     user_service: UserService = Depends(get_user_service)
 ):
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = token_verifier.verify(token)
         session_id = payload.get("session")
         if not session_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token format"
             )
-        return await user_service.logout_user(session_id)
+        return await user_service.logout_user(session_id, payload.get("uid"))
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
 
-@router.post("/login", response_model=Token)
-@router.post("/token", response_model=Token)
+@router.post("/logout-all", dependencies=[Depends(limit_by_user)])
+async def logout_all(
+    user_id: int = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service)
+):
+    return await user_service.revoke_all_sessions(user_id)
+
+@router.post("/login", response_model=Token, dependencies=[Depends(limit_by_ip("auth"))])
+@router.post("/token", response_model=Token, dependencies=[Depends(limit_by_ip("auth"))])
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service: UserService = Depends(get_user_service)
@@ -97,9 +117,9 @@ async def login_for_access_token(
         password=form_data.password
     ))
 
-@router.post("/refresh", response_model=Token)
+@router.post("/refresh", response_model=Token, dependencies=[Depends(limit_by_ip("auth"))])
 async def refresh_token(
     token: str = Depends(oauth2_scheme),
     user_service: UserService = Depends(get_user_service)
 ):
-    return user_service.refresh_token(token)
\ No newline at end of file
+    return await user_service.refresh_token(token)
\ No newline at end of file
@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from core.conditional import Preconditions, get_preconditions
 from core.database import get_db
+from core.responses import FastJSONResponse
 from services.board import BoardService
 from services.user import UserService
 from schemas.board import BoardCreate, BoardUpdate, BoardResponse, BoardList
-from routers.auth import oauth2_scheme, get_user_service, get_current_user
+from routers.auth import oauth2_scheme, get_user_service, get_current_user, limit_by_user
 
-router = APIRouter(prefix="/boards", tags=["boards"])
+router = APIRouter(prefix="/boards", tags=["boards"], dependencies=[Depends(limit_by_user)])
 
 async def get_board_service(db = Depends(get_db)) -> BoardService:
     return BoardService(db)
@@ -41,23 +43,30 @@ async def delete_board(
 @router.get("/{board_id}", response_model=BoardResponse)
 async def get_board(
     board_id: int,
+    response: Response,
+    preconditions: Preconditions = Depends(get_preconditions),
     board_service: BoardService = Depends(get_board_service),
     current_user_id: int = Depends(get_current_user)
 ) -> BoardResponse:
-    return await board_service.get_board(board_id, current_user_id)
+    board, validators = await board_service.get_board(board_id, current_user_id, preconditions)
+    validators.apply(response)
+    return board
 
 @router.get("", response_model=BoardList)
 async def get_boards(
     cursor: Optional[str] = None,
-    limit: int = 10,
+    limit: int = Query(default=10, ge=1, le=100),
     sort_by_posts: bool = False,
+    preconditions: Preconditions = Depends(get_preconditions),
     board_service: BoardService = Depends(get_board_service),
     current_user_id: int = Depends(get_current_user)
-) -> BoardList:
-    boards, next_cursor = await board_service.get_boards(
-        current_user_id, cursor, limit, sort_by_posts
+) -> FastJSONResponse:
+    boards, next_cursor, prev_cursor, validators = await board_service.get_boards(
+        current_user_id, cursor, limit, sort_by_posts, preconditions
     )
-    return BoardList(
-        items=boards,
-        next_cursor=next_cursor
-    ) 
\ No newline at end of file
+    # 목록은 이미 BoardList 형태이므로 response_model 재검증 없이 바로 직렬화
+    return FastJSONResponse({
+        "items": boards,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor
+    }, headers=validators.headers() if validators else None) 
\ No newline at end of file
@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, status, Query
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Literal, Optional, Union
+import json
 
+from core.conditional import Preconditions, get_preconditions
+from core.config import get_settings
 from core.database import get_db
+from core.ratelimit import enforce
+from core.responses import FastJSONResponse
 from services.post import PostService
-from schemas.post import PostCreate, PostUpdate, PostResponse, PostList
-from routers.auth import get_current_user
+from schemas.post import PostCreate, PostUpdate, PostResponse, PostList, PostSummaryList, PostSearchList, PostBulkResponse
+from routers.auth import get_current_user, limit_by_user
 
-router = APIRouter(prefix="/posts", tags=["posts"])
+router = APIRouter(prefix="/posts", tags=["posts"], dependencies=[Depends(limit_by_user)])
 
 async def get_post_service(db = Depends(get_db)) -> PostService:
     return PostService(db)
@@ -23,6 +29,87 @@ async def create_post(
     except Exception as e:
         raise
 
+async def _iter_ndjson(request: Request) -> AsyncIterator[Any]:
+    # 본문 전체를 메모리에 올리지 않고 줄 단위로 파싱
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _parse_ndjson_line(line)
+    if buffer.strip():
+        yield _parse_ndjson_line(buffer)
+
+def _parse_ndjson_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        # 항목 검증 단계에서 해당 줄만 실패 처리
+        return None
+
+async def _iter_json_array(request: Request) -> AsyncIterator[Any]:
+    try:
+        items = await request.json()
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Request body must be a JSON array of posts"
+        )
+    for item in items:
+        yield item
+
+async def _charge_per_batch(items: AsyncIterator[Any], user_id: int) -> AsyncIterator[Any]:
+    # 요청 자체의 쓰기 토큰(첫 배치)에 더해 BULK_POST_BATCH_SIZE개 배치가 새로 시작될 때마다 쓰기 토큰 하나씩 차감
+    # (한도를 넘으면 커밋 전에 429로 중단되어 아무것도 저장되지 않음)
+    batch_size = get_settings().BULK_POST_BATCH_SIZE
+    count = 0
+    async for item in items:
+        if count and count % batch_size == 0:
+            await enforce("writes", f"user:{user_id}")
+        count += 1
+        yield item
+
+@router.post("/bulk", response_model=PostBulkResponse)
+async def bulk_create_posts(
+    request: Request,
+    post_service: PostService = Depends(get_post_service),
+    current_user_id: int = Depends(get_current_user)
+) -> PostBulkResponse:
+    """JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson) 본문으로 게시글 일괄 작성"""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/x-ndjson"):
+        items = _iter_ndjson(request)
+    else:
+        items = _iter_json_array(request)
+    return await post_service.bulk_create_posts(_charge_per_batch(items, current_user_id), current_user_id)
+
+@router.get("/feed", response_model=Union[PostList, PostSummaryList])
+async def get_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(default=10, ge=1, le=100),
+    view: Literal["full", "summary"] = "full",
+    excerpt: int = Query(default=0, ge=0, le=500, description="summary 보기에서 포함할 본문 앞부분 글자 수"),
+    post_service: PostService = Depends(get_post_service),
+    current_user_id: int = Depends(get_current_user)
+) -> FastJSONResponse:
+    """볼 수 있는 모든 게시판의 최신 게시글 (/{post_id}보다 먼저 등록)"""
+    summary = view == "summary"
+    posts, next_cursor, prev_cursor = await post_service.get_feed(
+        current_user_id,
+        cursor,
+        limit,
+        summary,
+        excerpt if summary else 0
+    )
+    return FastJSONResponse({
+        "items": posts,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor
+    })
+
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
     post_id: int,
@@ -50,30 +137,80 @@ async def delete_post(
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
+    response: Response,
+    preconditions: Preconditions = Depends(get_preconditions),
     post_service: PostService = Depends(get_post_service),
     current_user_id: int = Depends(get_current_user)
 ) -> PostResponse:
-    try:
-        post = await post_service.get_post(post_id, current_user_id)
-        return post
-    except Exception as e:
-        raise
+    post, validators = await post_service.get_post(post_id, current_user_id, preconditions)
+    validators.apply(response)
+    return post
 
-@router.get("/board/{board_id}", response_model=PostList)
+@router.get("/board/{board_id}", response_model=Union[PostList, PostSummaryList])
 async def get_posts(
     board_id: int,
     cursor: Optional[str] = None,
-    limit: int = Query(default=10, le=100),
+    limit: int = Query(default=10, ge=1, le=100),
+    view: Literal["full", "summary"] = "full",
+    excerpt: int = Query(default=0, ge=0, le=500, description="summary 보기에서 포함할 본문 앞부분 글자 수"),
+    preconditions: Preconditions = Depends(get_preconditions),
     post_service: PostService = Depends(get_post_service),
     current_user_id: int = Depends(get_current_user)
-) -> PostList:
-    posts, next_cursor = await post_service.get_posts(
+) -> FastJSONResponse:
+    summary = view == "summary"
+    posts, next_cursor, prev_cursor, validators = await post_service.get_posts(
         board_id,
         current_user_id,
         cursor,
+        limit,
+        summary,
+        excerpt if summary else 0,
+        preconditions
+    )
+    # 목록은 이미 PostList/PostSummaryList 형태이므로 response_model 재검증 없이 바로 직렬화
+    return FastJSONResponse({
+        "items": posts,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor
+    }, headers=validators.headers() if validators else None)
+
+@router.get("/board/{board_id}/search", response_model=PostSearchList)
+async def search_posts(
+    board_id: int,
+    q: str = Query(min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(default=10, ge=1, le=50),
+    post_service: PostService = Depends(get_post_service),
+    current_user_id: int = Depends(get_current_user)
+) -> FastJSONResponse:
+    posts, next_cursor, prev_cursor = await post_service.search_posts(
+        board_id,
+        current_user_id,
+        q,
+        cursor,
         limit
     )
-    return PostList(
-        items=posts,
-        next_cursor=next_cursor
-    ) 
\ No newline at end of file
+    return FastJSONResponse({
+        "items": posts,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor
+    })
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+@router.get("/board/{board_id}/export")
+async def export_posts(
+    board_id: int,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    post_service: PostService = Depends(get_post_service),
+    current_user_id: int = Depends(get_current_user)
+) -> StreamingResponse:
+    chunks = await post_service.export_posts(board_id, current_user_id, format)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="board-{board_id}-posts.{format}"'}
+    )
@@ -18,4 +18,5 @@ class BoardResponse(BoardCreate):
 
 class BoardList(BaseModel):
     items: List[BoardResponse]
-    next_cursor: Optional[str] = None 
\ No newline at end of file
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None 
\ No newline at end of file
@@ -21,4 +21,41 @@ class PostResponse(PostBase):
 
 class PostList(BaseModel):
     items: List[PostResponse]
-    next_cursor: Optional[str] = None 
\ No newline at end of file
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class PostSummary(BaseModel):
+    """목록용 요약 (본문 제외, 선택적으로 앞부분 발췌)"""
+    id: int
+    title: str
+    author_id: int
+    board_id: int
+    excerpt: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+class PostSummaryList(BaseModel):
+    items: List[PostSummary]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class PostSearchResult(PostSummary):
+    """검색 결과 (excerpt는 검색어가 강조된 본문 일부)"""
+    rank: float
+
+class PostSearchList(BaseModel):
+    items: List[PostSearchResult]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class PostBulkItemResult(BaseModel):
+    index: int
+    status: int
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+class PostBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[PostBulkItemResult]
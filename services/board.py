@@ -1,4 +1,7 @@
 from sqlalchemy.orm import Session
+from core.cache import MISSING, listing_cache
+from core.conditional import Preconditions, Validators
+from core.database import commit
 from models.board import Board
 from schemas.board import BoardCreate, BoardUpdate, BoardResponse, BoardList
 from typing import Optional, Tuple, List
@@ -10,16 +13,24 @@ class BoardService:
     
     async def create_board(self, board_data: BoardCreate, user_id: int) -> BoardResponse:
         board = await Board.create_board(self.db, board_data, user_id)
+        await commit(self.db)
         return BoardResponse.model_validate(board)
     
     async def update_board(self, board_id: int, board_data: BoardUpdate, user_id: int) -> BoardResponse:
         board = await Board.update_board(self.db, board_id, board_data, user_id)
+        await commit(self.db)
         return BoardResponse.model_validate(board)
     
     async def delete_board(self, board_id: int, user_id: int) -> None:
         await Board.delete_board(self.db, board_id, user_id)
+        await commit(self.db)
     
-    async def get_board(self, board_id: int, user_id: int) -> BoardResponse:
+    async def get_board(
+        self,
+        board_id: int,
+        user_id: int,
+        preconditions: Optional[Preconditions] = None
+    ) -> Tuple[BoardResponse, Validators]:
         board = await Board.get_accessible_board(self.db, board_id, user_id)
         if not board:
             raise HTTPException(
@@ -32,21 +43,48 @@ class BoardService:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this board"
             )
-            
-        return BoardResponse.model_validate(board)
+        
+        # 게시판 캐시 적중 시 DB 조회 없이 304 응답
+        validators = Validators(f'"b{board.id}.{board.version}"', board.updated_at)
+        validators.check(preconditions)
+        return BoardResponse.model_validate(board), validators
     
     async def get_boards(
         self, 
         user_id: int, 
         cursor: Optional[str] = None,
         limit: int = 10,
-        sort_by_posts: bool = False
-    ) -> Tuple[List[BoardResponse], Optional[str]]:
-        boards, next_cursor = await Board.get_boards(
+        sort_by_posts: bool = False,
+        preconditions: Optional[Preconditions] = None
+    ) -> Tuple[List[dict], Optional[str], Optional[str], Optional[Validators]]:
+        """게시판 목록 (DB 조회 결과가 이미 BoardResponse 형태이므로 검증 없이 dict 그대로 반환)"""
+        # 첫 페이지는 목록 캐시 사용 (비공개 게시판이 포함되므로 사용자별 키)
+        variant = f"{user_id}:{'posts' if sort_by_posts else 'id'}:{limit}"
+        if not cursor:
+            version, cached = await listing_cache.get("boards", "all", variant)
+        else:
+            version, cached = await listing_cache.version("boards", "all"), MISSING
+        
+        # 목록 캐시 버전이 ETag (목록이 바뀔 때마다 증가), 변경이 없으면 DB 조회 없이 304
+        validators = None
+        if version is not None:
+            validators = Validators(f'W/"b{user_id}.{version}"')
+            validators.check(preconditions)
+        
+        if cached is not MISSING:
+            return cached["items"], cached["next_cursor"], None, validators
+        
+        boards, next_cursor, prev_cursor = await Board.get_boards(
             self.db, 
             user_id, 
             cursor, 
             limit,
             sort_by_posts
         )
-        return [BoardResponse.model_validate(board) for board in boards], next_cursor 
\ No newline at end of file
+        
+        if not cursor:
+            await listing_cache.set("boards", "all", variant, version, {
+                "items": boards,
+                "next_cursor": next_cursor,
+            })
+        return boards, next_cursor, prev_cursor, validators 
\ No newline at end of file
@@ -1,10 +1,25 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from typing import Optional, Tuple, List
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, Tuple, List
+import csv
+import io
+import json
+from collections import Counter
+from pydantic import ValidationError
 
+from core.cache import MISSING, listing_cache
+from core.conditional import Preconditions, Validators
+from core.config import get_settings
+from core.database import AsyncSessionLocal, after_commit, commit
+from core.pagination import POSTS_FEED, build_page
+from core.timeline import board_timeline, public_timeline, timeline
 from models.post import Post
 from models.board import Board
-from schemas.post import PostCreate, PostUpdate, PostResponse
+from schemas.post import PostCreate, PostUpdate, PostResponse, PostBulkItemResult, PostBulkResponse
+
+EXPORT_FIELDS = ["id", "title", "content", "author_id", "board_id"]
+EXPORT_CHUNK_SIZE = 64 * 1024  # 응답 청크 크기 (bytes)
+
 
 class PostService:
     def __init__(self, db: AsyncSession):
@@ -20,42 +35,131 @@ class PostService:
                 )
             
             post = await Post.create_post(self.db, post_data, user_id, board)
+            await commit(self.db)
             return PostResponse.model_validate(post)
         except Exception as e:
             raise
     
+    async def bulk_create_posts(self, items: AsyncIterable[Any], user_id: int) -> PostBulkResponse:
+        """게시글 일괄 작성 (항목별 결과 반환, 전체를 한 트랜잭션으로 커밋)"""
+        settings = get_settings()
+        results: List[PostBulkItemResult] = []
+        batch: List[Tuple[int, PostCreate]] = []
+        accessible: Dict[int, bool] = {}  # 게시판별 접근 가능 여부 (게시판당 한 번만 확인)
+        public: Dict[int, bool] = {}  # 접근 가능한 게시판의 공개 여부 (타임라인 선택)
+        created_per_board: Counter = Counter()
+        timeline_entries: List[Tuple[int, bool, int]] = []
+        
+        async def flush_batch() -> None:
+            unknown = {post.board_id for _, post in batch} - accessible.keys()
+            if unknown:
+                allowed = await Board.get_accessible_board_visibility(self.db, unknown, user_id)
+                for board_id in unknown:
+                    accessible[board_id] = board_id in allowed
+                public.update(allowed)
+            
+            rows = []
+            for index, post in batch:
+                if accessible[post.board_id]:
+                    rows.append((index, post))
+                else:
+                    results.append(PostBulkItemResult(
+                        index=index,
+                        status=status.HTTP_404_NOT_FOUND,
+                        detail="Board not found or not accessible"
+                    ))
+            
+            ids = await Post.bulk_create_posts(self.db, [post.model_dump() for _, post in rows], user_id)
+            for (index, post), post_id in zip(rows, ids):
+                created_per_board[post.board_id] += 1
+                timeline_entries.append((post.board_id, public[post.board_id], post_id))
+                results.append(PostBulkItemResult(index=index, status=status.HTTP_201_CREATED, id=post_id))
+            batch.clear()
+        
+        index = 0
+        async for item in items:
+            if index >= settings.BULK_POST_MAX_ITEMS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Too many items (max {settings.BULK_POST_MAX_ITEMS})"
+                )
+            try:
+                batch.append((index, PostCreate.model_validate(item)))
+            except ValidationError as e:
+                results.append(PostBulkItemResult(
+                    index=index,
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="; ".join(
+                        f"{'.'.join(str(loc) for loc in error['loc']) or 'body'}: {error['msg']}"
+                        for error in e.errors()
+                    )
+                ))
+            index += 1
+            if len(batch) >= settings.BULK_POST_BATCH_SIZE:
+                await flush_batch()
+        if batch:
+            await flush_batch()
+        
+        # 게시판별로 게시글 수를 한 번만 보정하고 목록 캐시 무효화
+        for board_id, count in created_per_board.items():
+            await Board.adjust_post_count(self.db, board_id, count)
+            after_commit(self.db, Post.invalidate_listing, board_id, True)
+        if timeline_entries:
+            after_commit(self.db, timeline.add, timeline_entries)
+        await commit(self.db)
+        
+        results.sort(key=lambda result: result.index)
+        created = sum(created_per_board.values())
+        return PostBulkResponse(created=created, failed=len(results) - created, results=results)
+    
     async def update_post(self, post_id: int, post_data: PostUpdate, user_id: int) -> PostResponse:
         post = await Post.update_post(self.db, post_id, post_data, user_id)
+        await commit(self.db)
         return PostResponse.model_validate(post)
     
     async def delete_post(self, post_id: int, user_id: int) -> None:
         await Post.delete_post(self.db, post_id, user_id)
+        await commit(self.db)
     
-    async def get_post(self, post_id: int, user_id: int) -> PostResponse:
-        post = await Post.get_post_by_id(self.db, post_id)
+    async def get_post(
+        self,
+        post_id: int,
+        user_id: int,
+        preconditions: Optional[Preconditions] = None
+    ) -> Tuple[PostResponse, Validators]:
+        # 조건부 요청이면 본문을 읽기 전에 버전만 확인
+        if preconditions:
+            meta, accessible = await Post.get_accessible_post_version(self.db, post_id, user_id)
+            if meta is not None and accessible:
+                Validators(f'"p{post_id}.{meta.version}"', meta.updated_at).check(preconditions)
+        
+        # 게시글 조회와 게시판 접근 권한 확인을 한 번에 처리
+        post, accessible = await Post.get_accessible_post(self.db, post_id, user_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post not found"
             )
         
-        # 게시판 접근 권한 확인
-        board = await Board.get_accessible_board(self.db, post.board_id, user_id)
-        if not board:
+        if not accessible:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this post"
             )
-            
-        return PostResponse.model_validate(post)
+        
+        return PostResponse.model_validate(post), Validators(f'"p{post.id}.{post.version}"', post.updated_at)
     
     async def get_posts(
         self,
         board_id: int,
         user_id: int,
         cursor: Optional[str] = None,
-        limit: int = 10
-    ) -> Tuple[List[PostResponse], Optional[str]]:
+        limit: int = 10,
+        summary: bool = False,
+        excerpt_length: int = 0,
+        preconditions: Optional[Preconditions] = None
+    ) -> Tuple[List[dict], Optional[str], Optional[str], Optional[Validators]]:
+        """게시글 목록 (PostResponse/PostSummary 형태의 dict를 검증 없이 그대로 반환)"""
         # 게시판 접근 권한 확인
         board = await Board.get_accessible_board(self.db, board_id, user_id)
         if not board:
@@ -64,10 +168,130 @@ class PostService:
                 detail="Board not found or not accessible"
             )
         
-        posts, next_cursor = await Post.get_posts_by_board(
+        variant = f"summary:{excerpt_length}:{limit}" if summary else limit
+        
+        # 첫 페이지는 목록 캐시 사용
+        if not cursor:
+            version, cached = await listing_cache.get("posts", board_id, variant)
+        else:
+            version, cached = await listing_cache.version("posts", board_id), MISSING
+        
+        # 게시판의 목록 캐시 버전이 ETag (게시글 작성/수정/삭제 시 증가), 변경이 없으면 DB 조회 없이 304
+        validators = None
+        if version is not None:
+            validators = Validators(f'W/"p{board_id}.{version}"')
+            validators.check(preconditions)
+        
+        if cached is not MISSING:
+            return cached["items"], cached["next_cursor"], None, validators
+        
+        posts, next_cursor, prev_cursor = await Post.get_posts_by_board(
             self.db,
             board_id,
             cursor,
-            limit
+            limit,
+            summary,
+            excerpt_length
+        )
+        
+        if not cursor:
+            await listing_cache.set("posts", board_id, variant, version, {
+                "items": posts,
+                "next_cursor": next_cursor,
+            })
+        return posts, next_cursor, prev_cursor, validators
+    
+    async def get_feed(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        summary: bool = False,
+        excerpt_length: int = 0
+    ) -> Tuple[List[dict], Optional[str], Optional[str]]:
+        """볼 수 있는 모든 게시판의 최신 게시글
+
+        공개 타임라인과 내 비공개 게시판 타임라인을 합쳐 id를 고른 뒤 WHERE id IN (...) 한 번으로 조회.
+        Redis를 쓸 수 없거나 타임라인에 남아 있는 범위를 벗어난 페이지는 DB에서 같은 순서로 조회
+        """
+        page_cursor = POSTS_FEED.decode(cursor, str(user_id))
+        private_board_ids = await Board.get_private_board_ids(self.db, user_id)
+        sources = {public_timeline(): None, **{board_timeline(board_id): board_id for board_id in private_board_ids}}
+        keys = list(sources)
+        
+        page = await timeline.read(keys, page_cursor, limit + 1)
+        if page is not None and page.missing:
+            # 채워지지 않은 타임라인은 DB의 최신 게시글로 채운 뒤 다시 읽음
+            for key in page.missing:
+                await timeline.fill(key, await Post.get_timeline_ids(self.db, timeline.length, sources[key]))
+            page = await timeline.read(keys, page_cursor, limit + 1)
+        
+        if page is not None and not page.missing and not page.truncated:
+            posts, deleted = await Post.get_posts_by_ids(self.db, page.ids, user_id, summary, excerpt_length)
+            if deleted:
+                await timeline.discard(keys, deleted)
+            # 빠진 게시글이 없을 때만 사용 (있으면 페이지가 짧아지므로 DB에서 다시 조회)
+            if len(posts) == len(page.ids):
+                return build_page(posts, limit, page_cursor, POSTS_FEED, lambda post: (post['id'],), str(user_id))
+        
+        return await Post.get_feed(
+            self.db,
+            user_id,
+            private_board_ids,
+            page_cursor,
+            limit,
+            summary,
+            excerpt_length
         )
-        return [PostResponse.model_validate(post) for post in posts], next_cursor 
\ No newline at end of file
+    
+    async def search_posts(
+        self,
+        board_id: int,
+        user_id: int,
+        query_text: str,
+        cursor: Optional[str] = None,
+        limit: int = 10
+    ) -> Tuple[List[dict], Optional[str], Optional[str]]:
+        # 목록 조회와 같은 게시판 접근 규칙 적용
+        board = await Board.get_accessible_board(self.db, board_id, user_id)
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found or not accessible"
+            )
+        
+        return await Post.search_posts(self.db, board_id, query_text, cursor, limit)
+    
+    async def export_posts(self, board_id: int, user_id: int, fmt: str = "ndjson") -> AsyncIterator[str]:
+        # 게시판 접근 권한은 내보내기 시작 전에 한 번만 확인
+        board = await Board.get_accessible_board(self.db, board_id, user_id)
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found or not accessible"
+            )
+        return self._export_chunks(board_id, fmt)
+    
+    async def _export_chunks(self, board_id: int, fmt: str) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = None
+        if fmt == "csv":
+            writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+        
+        # 응답 스트리밍은 요청 세션 종료 후에도 이어지므로 별도 세션 사용
+        async with AsyncSessionLocal() as session:
+            async for row in Post.stream_posts_by_board(session, board_id):
+                if writer is not None:
+                    writer.writerow(row)
+                else:
+                    buffer.write(json.dumps(dict(row), ensure_ascii=False))
+                    buffer.write("\n")
+                
+                if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+        
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -1,8 +1,6 @@
 from typing import Optional
 from datetime import timedelta, datetime
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
-from redis import Redis
 from jose import jwt, JWTError
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,66 +8,50 @@ import redis
 
 from models.user import User
 from schemas.user import UserCreate, UserLogin, Token
-from core.config import settings
+from core.config import get_settings
+from core.security import token_verifier
+from core.session import SessionStore, token_ttl
+from core.database import commit
 
 
 class UserService:
-    def __init__(self, db: AsyncSession, redis_client: Redis):
+    def __init__(self, db: AsyncSession, session_store: SessionStore):
         self.db = db
-        self.redis_client = redis_client
+        self.session_store = session_store
 
     def _create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
+        settings = get_settings()
         to_encode = data.copy()
-        expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+        # 세션보다 오래 유효하지 않도록 세션 만료 시간으로 제한 (폐기 목록 유지 기간과 동일)
+        expire = datetime.utcnow() + (expires_delta or timedelta(seconds=token_ttl()))
         to_encode.update({"exp": expire})
         return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
-    def _verify_and_refresh_session(self, session_id: str, email: str) -> bool:
-        """세션 유효성 검사 및 갱신"""
-        session_key = f"session:{session_id}"
-        session_email = self.redis_client.get(session_key)
-        
-        if not session_email or session_email.decode() != email:
-            return False
-            
-        # 세션 만료 시간 갱신
-        self.redis_client.expire(session_key, settings.SESSION_EXPIRE_MINUTES * 60)  # 분을 초로 변환
-        return True
-
-    def refresh_token(self, token: str) -> Token:
+    async def refresh_token(self, token: str) -> Token:
         """토큰 갱신"""
         try:
-            payload = jwt.decode(
-                token, 
-                settings.SECRET_KEY, 
-                algorithms=[settings.ALGORITHM]
-            )
+            payload = token_verifier.verify(token)
             email = payload.get("sub")
             session_id = payload.get("session")
+            user_id = payload.get("uid")
             
-            if not email or not session_id:
+            if not email or not session_id or user_id is None:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid token content"
                 )
                 
-            # 세션 유효성 검사 및 갱신
-            if not self._verify_and_refresh_session(session_id, email):
+            # 세션 유효성 검사 후 새 세션으로 교체 (한 번의 Redis 왕복)
+            new_session_id = str(uuid.uuid4())
+            if not await self.session_store.rotate(session_id, new_session_id, user_id):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Session expired or invalid"
                 )
             
-            # 새로운 토큰 생성
-            new_session_id = str(uuid.uuid4())
-            self.redis_client.setex(f"session:{new_session_id}", 1800, email)
-            
-            # 이전 세션 삭제
-            self.redis_client.delete(f"session:{session_id}")
-            
             # 새 토큰 발급
             access_token = self._create_access_token(
-                data={"sub": email, "session": new_session_id}
+                data={"sub": email, "uid": user_id, "session": new_session_id}
             )
             return Token(access_token=access_token)
             
@@ -82,19 +64,15 @@ class UserService:
     async def create_user(self, user_data: UserCreate) -> Token:
         # 사용자 생성
         user = await User.create_user(self.db, user_data)
+        await commit(self.db)
         
         # 세션 ID 생성 및 Redis에 저장
         session_id = str(uuid.uuid4())
-        session_key = f"session:{session_id}"
-        self.redis_client.setex(
-            session_key,
-            settings.SESSION_EXPIRE_MINUTES * 60,  # 분을 초로 변환
-            user.email
-        )
+        await self.session_store.create(session_id, user.id)
         
         # 액세스 토큰 생성
         access_token = self._create_access_token(
-            data={"sub": user.email, "session": session_id}
+            data={"sub": user.email, "uid": user.id, "session": session_id}
         )
         
         return Token(access_token=access_token, token_type="bearer")
@@ -109,46 +87,27 @@ class UserService:
         
         # 세션 생성 및 Redis에 저장
         session_id = str(uuid.uuid4())
-        self.redis_client.setex(
-            f"session:{session_id}", 
-            settings.SESSION_EXPIRE_MINUTES * 60,  # 분을 초로 변환
-            user.email
-        )
+        await self.session_store.create(session_id, user.id)
         
         access_token = self._create_access_token(
-            data={"sub": user.email, "session": session_id}
+            data={"sub": user.email, "uid": user.id, "session": session_id}
         )
         return Token(access_token=access_token)
 
     def verify_token(self, token: str) -> dict:
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            return payload
+            return token_verifier.verify(token)
         except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token"
             )
 
-    async def logout_user(self, session_id: str) -> dict:
+    async def logout_user(self, session_id: str, user_id: Optional[int] = None) -> dict:
         """사용자 로그아웃 처리"""
         try:
-            session_key = f"session:{session_id}"
-            
-            # Redis 연결 확인
-            if not self.redis_client.ping():
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Session service unavailable"
-                )
-            
-            # 세션 존재 여부 확인
-            if not self.redis_client.exists(session_key):
-                # 세션이 없어도 성공적으로 로그아웃 처리
-                return {"message": "Successfully logged out"}
-            
-            # 세션 삭제
-            self.redis_client.delete(session_key)
+            # 세션 삭제 (세션이 없어도 성공적으로 로그아웃 처리)
+            await self.session_store.delete(session_id, user_id)
             
             return {"message": "Successfully logged out"}
             
@@ -157,3 +116,14 @@ class UserService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Session service error"
             )
+
+    async def revoke_all_sessions(self, user_id: int) -> dict:
+        """사용자의 모든 세션 로그아웃 (한 번의 Redis 호출)"""
+        try:
+            revoked = await self.session_store.revoke_all(user_id)
+            return {"message": "All sessions revoked", "revoked": revoked}
+        except redis.RedisError:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Session service error"
+            )
@@ -0,0 +1,55 @@
+import os
+from typing import AsyncIterator
+
+# 설정 검증을 통과하는 테스트용 환경변수 (이미 설정된 값이 우선)
+_TEST_ENV = {
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "testpassword",
+    "POSTGRES_DB": "test",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "SECRET_KEY": "test-secret-key-at-least-32-characters-long",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "SESSION_EXPIRE_MINUTES": "60",
+    "QUERY_COUNT_HEADER": "true",
+    "RATE_LIMIT_ENABLED": "false",
+}
+for _key, _value in _TEST_ENV.items():
+    os.environ.setdefault(_key, _value)
+
+import httpx
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import core.database as database
+from core.cache import invalidation_bus
+from core.session import session_store
+from models.board import BOARD_CACHE
+
+
+@pytest_asyncio.fixture
+async def client(tmp_path) -> AsyncIterator[httpx.AsyncClient]:
+    """빈 SQLite DB와 fakeredis 위에서 앱을 띄운 클라이언트"""
+    from main import app
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    database.use_engine(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(database.Base.metadata.create_all)
+
+    await session_store.connect(FakeAsyncRedis(decode_responses=True))
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                yield client
+    finally:
+        # 테스트마다 DB가 새로 만들어지므로 프로세스 내 게시판 캐시도 비움
+        await invalidation_bus.invalidate(BOARD_CACHE)
+        await session_store.close()
+        await database.dispose_engine()
@@ -0,0 +1,113 @@
+"""게시글 일괄 작성 (POST /posts/bulk)"""
+import httpx
+import orjson
+
+from core.config import get_settings
+
+
+async def _user(client: httpx.AsyncClient, i: int) -> dict:
+    response = await client.post("/auth/signup", json={
+        "fullname": f"Bulk User {i}", "email": f"bulk{i}@example.com", "password": "bulkpassword",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _board(client: httpx.AsyncClient, headers: dict, name: str, public: bool = True) -> int:
+    response = await client.post("/boards", json={"name": name, "public": public}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+async def _post_count(client: httpx.AsyncClient, headers: dict, board_id: int) -> int:
+    return (await client.get(f"/boards/{board_id}", headers=headers)).json()["post_count"]
+
+
+async def test_mixed_items_report_per_item_results(client):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    board_id = await _board(client, owner, "mine")
+    private_id = await _board(client, other, "theirs", public=False)
+    items = [
+        {"title": "a", "content": "c", "board_id": board_id},
+        {"title": "missing content", "board_id": board_id},
+        {"title": "b", "content": "c", "board_id": private_id},
+        {"title": "c", "content": "c", "board_id": 999},
+        "not an object",
+        {"title": "d", "content": "c", "board_id": board_id},
+    ]
+
+    response = await client.post("/posts/bulk", json=items, headers=owner)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 4)
+    assert [(result["index"], result["status"]) for result in body["results"]] == [
+        (0, 201), (1, 422), (2, 404), (3, 404), (4, 422), (5, 201),
+    ]
+    assert "content" in body["results"][1]["detail"]
+
+    # 작성된 게시글은 입력 순서대로 id를 받고 조회 가능
+    created = [result["id"] for result in body["results"] if result["status"] == 201]
+    assert created == sorted(created)
+    for post_id in created:
+        assert (await client.get(f"/posts/{post_id}", headers=owner)).status_code == 200
+
+
+async def test_post_count_grows_by_created_items(client, monkeypatch):
+    # 배치 경계를 여러 번 넘도록 작은 배치 사용
+    monkeypatch.setattr(get_settings(), "BULK_POST_BATCH_SIZE", 3)
+    headers = await _user(client, 1)
+    first, second = await _board(client, headers, "first"), await _board(client, headers, "second")
+    await client.post("/posts", json={"title": "existing", "content": "c", "board_id": first}, headers=headers)
+
+    items = [{"title": f"t{i}", "content": "c", "board_id": first if i % 3 else second} for i in range(10)]
+    items.insert(4, {"title": "invalid", "board_id": first})
+    response = await client.post("/posts/bulk", json=items, headers=headers)
+    assert response.json()["created"] == 10
+
+    assert await _post_count(client, headers, first) == 1 + 6
+    assert await _post_count(client, headers, second) == 4
+    listing = (await client.get(f"/posts/board/{second}", params={"limit": 100}, headers=headers)).json()
+    assert len(listing["items"]) == 4
+
+
+async def test_ndjson_body(client):
+    headers = await _user(client, 1)
+    board_id = await _board(client, headers, "ndjson")
+    lines = [
+        orjson.dumps({"title": "a", "content": "c", "board_id": board_id}),
+        b"{not json",
+        b"",
+        orjson.dumps({"title": "b", "content": "c", "board_id": board_id}),
+    ]
+    response = await client.post(
+        "/posts/bulk",
+        content=b"\n".join(lines),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    # 빈 줄은 항목으로 세지 않음
+    assert [(result["index"], result["status"]) for result in body["results"]] == [(0, 201), (1, 422), (2, 201)]
+    assert await _post_count(client, headers, board_id) == 2
+
+
+async def test_body_must_be_an_array(client):
+    headers = await _user(client, 1)
+    for body in ({"title": "a"}, "text"):
+        response = await client.post("/posts/bulk", json=body, headers=headers)
+        assert response.status_code == 422
+    response = await client.post("/posts/bulk", content=b"not json", headers={**headers, "Content-Type": "application/json"})
+    assert response.status_code == 422
+
+
+async def test_too_many_items_is_413_and_creates_nothing(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "BULK_POST_MAX_ITEMS", 3)
+    monkeypatch.setattr(get_settings(), "BULK_POST_BATCH_SIZE", 2)
+    headers = await _user(client, 1)
+    board_id = await _board(client, headers, "limit")
+    items = [{"title": f"t{i}", "content": "c", "board_id": board_id} for i in range(4)]
+
+    response = await client.post("/posts/bulk", json=items, headers=headers)
+    assert response.status_code == 413
+    assert await _post_count(client, headers, board_id) == 0
+    assert (await client.get(f"/posts/board/{board_id}", headers=headers)).json()["items"] == []
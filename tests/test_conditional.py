@@ -0,0 +1,128 @@
+"""조건부 GET (ETag / Last-Modified): 변경이 없으면 304, 쓰기 후에는 새 ETag와 200"""
+import httpx
+import pytest
+from sqlalchemy import text
+
+import core.database as database
+from models.board import Board
+
+
+async def _user(client: httpx.AsyncClient, i: int = 1) -> dict:
+    response = await client.post("/auth/signup", json={
+        "fullname": f"Cond User {i}", "email": f"cond{i}@example.com", "password": "condpassword",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _setup(client: httpx.AsyncClient) -> tuple[dict, int, int]:
+    headers = await _user(client)
+    board_id = (await client.post("/boards", json={"name": "cond", "public": True}, headers=headers)).json()["id"]
+    response = await client.post("/posts", json={"title": "t", "content": "c", "board_id": board_id}, headers=headers)
+    return headers, board_id, response.json()["id"]
+
+
+async def _assert_changed(client: httpx.AsyncClient, path: str, headers: dict, etag: str) -> str:
+    """이전 ETag로 요청하면 200과 새 ETag"""
+    response = await client.get(path, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["etag"] != etag
+    return response.headers["etag"]
+
+
+async def _assert_not_modified(client: httpx.AsyncClient, path: str, headers: dict, etag: str, if_none_match: str = None) -> None:
+    response = await client.get(path, headers={**headers, "If-None-Match": if_none_match or etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("kind", ["board", "post"])
+async def test_item_not_modified_by_etag_and_date(client, kind):
+    headers, board_id, post_id = await _setup(client)
+    path = f"/boards/{board_id}" if kind == "board" else f"/posts/{post_id}"
+
+    response = await client.get(path, headers=headers)
+    assert response.status_code == 200
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    await _assert_not_modified(client, path, headers, etag)
+    # 약한 비교, 여러 값 중 하나, *
+    await _assert_not_modified(client, path, headers, etag, f'"other", W/{etag}')
+    assert (await client.get(path, headers={**headers, "If-None-Match": "*"})).status_code == 304
+
+    response = await client.get(path, headers={**headers, "If-Modified-Since": last_modified})
+    assert response.status_code == 304
+    response = await client.get(path, headers={**headers, "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})
+    assert response.status_code == 200
+    # If-None-Match가 있으면 If-Modified-Since는 무시
+    response = await client.get(path, headers={**headers, "If-None-Match": '"other"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+
+async def test_post_etag_changes_after_update(client):
+    headers, _, post_id = await _setup(client)
+    etag = (await client.get(f"/posts/{post_id}", headers=headers)).headers["etag"]
+
+    await client.put(f"/posts/{post_id}", json={"title": "t2", "content": "c2"}, headers=headers)
+    new_etag = await _assert_changed(client, f"/posts/{post_id}", headers, etag)
+    await _assert_not_modified(client, f"/posts/{post_id}", headers, new_etag)
+
+
+async def test_board_etag_changes_after_board_and_post_writes(client):
+    headers, board_id, post_id = await _setup(client)
+    path = f"/boards/{board_id}"
+    etag = (await client.get(path, headers=headers)).headers["etag"]
+
+    await client.put(path, json={"name": "renamed", "public": True}, headers=headers)
+    etag = await _assert_changed(client, path, headers, etag)
+
+    # 게시글 수가 바뀌면 게시판 표현도 바뀜
+    await client.delete(f"/posts/{post_id}", headers=headers)
+    response = await client.get(path, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["post_count"] == 0
+
+
+async def test_listing_etags_change_after_writes(client):
+    headers, board_id, post_id = await _setup(client)
+    posts_path = f"/posts/board/{board_id}"
+    boards_etag = (await client.get("/boards", headers=headers)).headers["etag"]
+    posts_etag = (await client.get(posts_path, headers=headers)).headers["etag"]
+    await _assert_not_modified(client, "/boards", headers, boards_etag)
+    await _assert_not_modified(client, posts_path, headers, posts_etag)
+
+    await client.put(f"/posts/{post_id}", json={"title": "t2", "content": "c2"}, headers=headers)
+    posts_etag = await _assert_changed(client, posts_path, headers, posts_etag)
+
+    await client.post("/posts", json={"title": "t3", "content": "c", "board_id": board_id}, headers=headers)
+    await _assert_changed(client, posts_path, headers, posts_etag)
+    boards_etag = await _assert_changed(client, "/boards", headers, boards_etag)
+
+    await client.post("/boards", json={"name": "another", "public": True}, headers=headers)
+    await _assert_changed(client, "/boards", headers, boards_etag)
+
+
+async def test_etags_change_after_post_count_reconcile(client):
+    headers, board_id, _ = await _setup(client)
+    board_etag = (await client.get(f"/boards/{board_id}", headers=headers)).headers["etag"]
+    boards_etag = (await client.get("/boards", headers=headers)).headers["etag"]
+
+    # 어긋난 post_count를 보정 작업으로 바로잡으면 이전 ETag는 더 이상 맞지 않음
+    async with database.AsyncSessionLocal() as session:
+        await session.execute(text("UPDATE boards SET post_count = 5 WHERE id = :id"), {"id": board_id})
+        await database.commit(session)
+    async with database.AsyncSessionLocal() as session:
+        assert await Board.reconcile_post_counts(session) == [board_id]
+        await database.commit(session)
+
+    await _assert_changed(client, f"/boards/{board_id}", headers, board_etag)
+    await _assert_changed(client, "/boards", headers, boards_etag)
+    assert (await client.get(f"/boards/{board_id}", headers=headers)).json()["post_count"] == 1
+
+
+async def test_private_board_is_not_revealed_by_preconditions(client):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    board_id = (await client.post("/boards", json={"name": "secret", "public": False}, headers=owner)).json()["id"]
+    response = await client.get(f"/boards/{board_id}", headers={**other, "If-None-Match": "*"})
+    assert response.status_code in (403, 404)
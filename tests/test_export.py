@@ -0,0 +1,84 @@
+"""게시판 게시글 내보내기 (GET /posts/board/{board_id}/export)"""
+import csv
+import io
+import json
+
+import httpx
+import pytest
+
+import services.post as post_service
+
+CONTENTS = ["plain", 'comma, "quoted"', "multi\nline, text", "한글 본문"]
+
+
+async def _user(client: httpx.AsyncClient, i: int) -> dict:
+    response = await client.post("/auth/signup", json={
+        "fullname": f"Export User {i}", "email": f"export{i}@example.com", "password": "exportpassword",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _board_with_posts(client: httpx.AsyncClient, headers: dict) -> tuple[int, list[int]]:
+    board_id = (await client.post("/boards", json={"name": "export", "public": False}, headers=headers)).json()["id"]
+    post_ids = []
+    for i, content in enumerate(CONTENTS):
+        response = await client.post("/posts", json={"title": f"t{i}", "content": content, "board_id": board_id}, headers=headers)
+        post_ids.append(response.json()["id"])
+    return board_id, post_ids
+
+
+def _expected(board_id: int, post_ids: list[int], author_id: int) -> list[dict]:
+    # 목록과 같은 순서 (id DESC)
+    rows = [
+        {"id": post_id, "title": f"t{i}", "content": content, "author_id": author_id, "board_id": board_id}
+        for i, (post_id, content) in enumerate(zip(post_ids, CONTENTS))
+    ]
+    return rows[::-1]
+
+
+async def test_export_ndjson(client):
+    headers = await _user(client, 1)
+    board_id, post_ids = await _board_with_posts(client, headers)
+
+    response = await client.get(f"/posts/board/{board_id}/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert f'board-{board_id}-posts.ndjson' in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == _expected(board_id, post_ids, 1)
+
+
+async def test_export_csv_escapes_commas_quotes_and_newlines(client):
+    headers = await _user(client, 1)
+    board_id, post_ids = await _board_with_posts(client, headers)
+
+    response = await client.get(f"/posts/board/{board_id}/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text, newline="")))
+    expected = [{key: str(value) for key, value in row.items()} for row in _expected(board_id, post_ids, 1)]
+    assert rows == expected
+
+
+@pytest.mark.parametrize("format", ["ndjson", "csv"])
+async def test_export_spans_multiple_chunks(client, monkeypatch, format):
+    monkeypatch.setattr(post_service, "EXPORT_CHUNK_SIZE", 16)
+    headers = await _user(client, 1)
+    board_id, post_ids = await _board_with_posts(client, headers)
+
+    response = await client.get(f"/posts/board/{board_id}/export", params={"format": format}, headers=headers)
+    if format == "csv":
+        rows = list(csv.DictReader(io.StringIO(response.text, newline="")))
+        assert [int(row["id"]) for row in rows] == post_ids[::-1]
+    else:
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == post_ids[::-1]
+
+
+async def test_export_inaccessible_board_is_404(client):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    board_id, _ = await _board_with_posts(client, owner)
+
+    for board in (board_id, 999):
+        response = await client.get(f"/posts/board/{board}/export", headers=other)
+        assert response.status_code == 404
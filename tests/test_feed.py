@@ -0,0 +1,148 @@
+"""피드: 작성/삭제 반영, 게시판 공개 여부 변경, 타임라인이 없거나 잘렸을 때 DB 조회, 다른 사용자의 커서 거부"""
+import httpx
+import pytest
+
+from core.config import get_settings
+from core.session import session_store
+from core.timeline import TIMELINE_PREFIX, timeline
+from models.post import Post
+
+
+async def _user(client: httpx.AsyncClient, i: int) -> dict:
+    response = await client.post("/auth/signup", json={
+        "fullname": f"Feed User {i}", "email": f"feed{i}@example.com", "password": "feedpassword",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _board(client: httpx.AsyncClient, headers: dict, public: bool) -> int:
+    response = await client.post("/boards", json={"name": f"feed-{public}", "public": public}, headers=headers)
+    return response.json()["id"]
+
+
+async def _post(client: httpx.AsyncClient, headers: dict, board_id: int) -> int:
+    response = await client.post("/posts", json={"title": "t", "content": "c", "board_id": board_id}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+async def _feed_ids(client: httpx.AsyncClient, headers: dict, limit: int = 100) -> list:
+    """다음 페이지를 끝까지 따라가며 읽은 게시글 id"""
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/posts/feed", params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        ids += [post["id"] for post in body["items"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+
+
+@pytest.fixture
+def db_feed_calls(monkeypatch):
+    """DB 조회(Post.get_feed)로 처리한 피드 요청 수"""
+    calls = []
+    get_feed = Post.get_feed.__func__
+
+    async def counting(cls, *args, **kwargs):
+        calls.append(args)
+        return await get_feed(cls, *args, **kwargs)
+
+    monkeypatch.setattr(Post, "get_feed", classmethod(counting))
+    return calls
+
+
+async def test_posts_fan_out_to_feeds_and_are_removed_on_delete(client, db_feed_calls):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    public_board, private_board = await _board(client, owner, True), await _board(client, owner, False)
+    assert await _feed_ids(client, other) == []
+
+    public_post = await _post(client, owner, public_board)
+    private_post = await _post(client, owner, private_board)
+    assert await _feed_ids(client, owner) == [private_post, public_post]
+    assert await _feed_ids(client, other) == [public_post]
+
+    await client.delete(f"/posts/{public_post}", headers=owner)
+    await client.delete(f"/posts/{private_post}", headers=owner)
+    assert await _feed_ids(client, owner) == []
+    assert await _feed_ids(client, other) == []
+    # 모두 타임라인에서 처리
+    assert db_feed_calls == []
+
+
+async def test_board_visibility_change_updates_feeds(client):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    board_id = await _board(client, owner, True)
+    post_ids = [await _post(client, owner, board_id) for _ in range(3)][::-1]
+    assert await _feed_ids(client, other) == post_ids
+
+    await client.put(f"/boards/{board_id}", json={"name": "feed", "public": False}, headers=owner)
+    assert await _feed_ids(client, other) == []
+    assert await _feed_ids(client, owner) == post_ids
+
+    await client.put(f"/boards/{board_id}", json={"name": "feed", "public": True}, headers=owner)
+    assert await _feed_ids(client, other) == post_ids
+    assert await _feed_ids(client, owner) == post_ids
+
+
+async def test_feed_falls_back_to_db_without_timelines(client, db_feed_calls):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    public_board, private_board = await _board(client, owner, True), await _board(client, owner, False)
+    for i in range(6):
+        await _post(client, owner, public_board if i % 2 else private_board)
+    expected = await _feed_ids(client, owner, limit=4)
+    expected_other = await _feed_ids(client, other, limit=2)
+    assert len(expected) == 6 and len(expected_other) == 3 and db_feed_calls == []
+
+    # 타임라인 키가 사라지면 DB에서 다시 채움
+    keys = [key async for key in session_store.client.scan_iter(f"{TIMELINE_PREFIX}*")]
+    await session_store.client.delete(*keys)
+    assert await _feed_ids(client, owner, limit=4) == expected
+    assert db_feed_calls == []
+
+    # Redis를 쓸 수 없으면 DB에서 같은 순서로 조회
+    timeline.unbind()
+    try:
+        assert await _feed_ids(client, owner, limit=4) == expected
+        assert await _feed_ids(client, other, limit=2) == expected_other
+    finally:
+        timeline.bind(session_store.client)
+    assert db_feed_calls
+
+
+async def test_truncated_timeline_pages_come_from_db(client, db_feed_calls, monkeypatch):
+    monkeypatch.setattr(get_settings(), "FEED_TIMELINE_LENGTH", 3)
+    owner = await _user(client, 1)
+    board_id = await _board(client, owner, True)
+    post_ids = [await _post(client, owner, board_id) for _ in range(8)][::-1]
+
+    # 첫 페이지는 타임라인, 타임라인에 남지 않은 과거 페이지는 DB
+    assert await _feed_ids(client, owner, limit=2) == post_ids
+    assert 0 < len(db_feed_calls) < 4
+
+    # 이전 페이지도 같은 순서로 되돌아감
+    response = await client.get("/posts/feed", params={"limit": 2}, headers=owner)
+    pages = [response.json()]
+    while pages[-1]["next_cursor"]:
+        response = await client.get("/posts/feed", params={"limit": 2, "cursor": pages[-1]["next_cursor"]}, headers=owner)
+        pages.append(response.json())
+    for page, previous in zip(pages[:0:-1], pages[-2::-1]):
+        response = await client.get("/posts/feed", params={"limit": 2, "cursor": page["prev_cursor"]}, headers=owner)
+        assert [post["id"] for post in response.json()["items"]] == [post["id"] for post in previous["items"]]
+
+
+async def test_cursor_from_another_user_is_rejected(client):
+    owner, other = await _user(client, 1), await _user(client, 2)
+    board_id = await _board(client, owner, True)
+    for _ in range(3):
+        await _post(client, owner, board_id)
+    cursor = (await client.get("/posts/feed", params={"limit": 1}, headers=owner)).json()["next_cursor"]
+    assert cursor
+
+    response = await client.get("/posts/feed", params={"limit": 1, "cursor": cursor}, headers=other)
+    assert response.status_code == 400
+    response = await client.get("/posts/feed", params={"limit": 1, "cursor": cursor}, headers=owner)
+    assert response.status_code == 200
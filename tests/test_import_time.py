@@ -0,0 +1,41 @@
+"""앱 콜드 스타트(import main) 시간과 import 부작용 확인
+
+python -X importtime 결과에서 main 모듈의 누적 import 시간을 읽어 예산(IMPORT_TIME_BUDGET_MS, 기본 2000ms)과 비교한다.
+예산은 느린 CI 장비에서도 흔들리지 않을 값으로, 장비에 맞춰 좁혀서 사용한다.
+설정 환경변수를 모두 뺀 상태로 import하므로 import 중 Settings/엔진을 만들면 검증 오류로 실패한다.
+"""
+import os
+import subprocess
+import sys
+
+from core.config import Settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+
+def _import_main() -> tuple[float, subprocess.CompletedProcess]:
+    env = {key: value for key, value in os.environ.items() if key not in Settings.model_fields}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    # "import time: self [us] | cumulative | imported package"
+    elapsed_ms = float("inf")
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "main":
+            elapsed_ms = int(parts[1]) / 1000
+    return elapsed_ms, result
+
+
+def test_import_main_needs_no_settings_and_prints_nothing():
+    _, result = _import_main()
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout == ""
+
+
+def test_import_main_within_budget():
+    # 첫 실행은 바이트코드 컴파일이 포함되므로 여러 번 중 가장 빠른 값 사용
+    elapsed_ms = min(_import_main()[0] for _ in range(3))
+    assert elapsed_ms <= BUDGET_MS, f"import main took {elapsed_ms:.1f} ms (budget {BUDGET_MS:.0f} ms)"
@@ -0,0 +1,53 @@
+"""목록 첫 페이지 캐시 무효화와 목록 크기 제한"""
+import httpx
+import pytest
+
+
+async def _signup(client: httpx.AsyncClient) -> dict:
+    response = await client.post("/auth/signup", json={
+        "fullname": "Listing User", "email": "listing@example.com", "password": "listingpassword",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _post_counts(client: httpx.AsyncClient, headers: dict, **params) -> dict:
+    response = await client.get("/boards", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return {board["id"]: board["post_count"] for board in response.json()["items"]}
+
+
+@pytest.mark.parametrize("sort_by_posts", [False, True], ids=["by_id", "by_posts"])
+async def test_board_listing_reflects_post_writes(client, sort_by_posts):
+    headers = await _signup(client)
+    board = (await client.post("/boards", json={"name": "cached", "public": True}, headers=headers)).json()
+    params = {"sort_by_posts": str(sort_by_posts).lower()}
+    assert (await _post_counts(client, headers, **params))[board["id"]] == 0
+
+    response = await client.post("/posts", json={"title": "t", "content": "c", "board_id": board["id"]}, headers=headers)
+    post_id = response.json()["id"]
+    assert (await _post_counts(client, headers, **params))[board["id"]] == 1
+
+    await client.delete(f"/posts/{post_id}", headers=headers)
+    assert (await _post_counts(client, headers, **params))[board["id"]] == 0
+
+
+async def test_post_update_keeps_board_listing_cached(client):
+    headers = await _signup(client)
+    board = (await client.post("/boards", json={"name": "cached", "public": True}, headers=headers)).json()
+    response = await client.post("/posts", json={"title": "t", "content": "c", "board_id": board["id"]}, headers=headers)
+    post_id = response.json()["id"]
+    etag = (await client.get("/boards", headers=headers)).headers["etag"]
+
+    await client.put(f"/posts/{post_id}", json={"title": "t2", "content": "c2"}, headers=headers)
+    response = await client.get("/boards", headers=headers)
+    assert response.headers["etag"] == etag
+    assert response.headers["x-query-count"] == "0"
+
+
+@pytest.mark.parametrize("path", ["/boards", "/posts/board/1"])
+@pytest.mark.parametrize("limit", [0, -1, 101])
+async def test_listing_limit_is_bounded(client, path, limit):
+    headers = await _signup(client)
+    response = await client.get(path, params={"limit": limit}, headers=headers)
+    assert response.status_code == 422
@@ -0,0 +1,139 @@
+"""게시판/게시글 목록 쿼리가 정렬 인덱스를 타는지 실행 계획으로 확인 (Postgres 필요)
+
+TEST_DATABASE_URL(postgresql+asyncpg://...)이 없으면 건너뛴다. 테이블을 지우고 다시 만들므로 테스트 전용 DB를 사용한다.
+모델 메서드가 실제로 실행하는 쿼리를 가로채 EXPLAIN (FORMAT JSON)으로 계획을 얻고,
+테이블을 읽는 노드가 모두 기대한 인덱스의 Index Scan/Index Only Scan이며 테이블을 읽은 뒤 정렬하지 않는지 검사한다.
+게시판 목록은 조건별로 limit + 1개씩 읽어 합치므로 합친 결과(Append) 위의 정렬만 허용한다.
+"""
+import os
+from typing import Iterator, List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.database import Base
+from core.pagination import BOARDS_BY_ID, BOARDS_BY_POSTS, POSTS_BY_ID, NEXT, PREV
+from models.user import User  # noqa: F401 (관계 매핑 등록)
+from models.board import Board
+from models.post import Post
+
+DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+pytestmark = [
+    pytest.mark.skipif(not DATABASE_URL.startswith("postgresql"), reason="TEST_DATABASE_URL (Postgres) is not set"),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+BOARDS = 20000
+POSTS = 100000
+# 사용자 1: 측정 대상 (게시판 0.1% 소유, 절반은 비공개), 사용자 2: 나머지 소유
+USER_ID = 1
+POSTS_BOARD_ID = 7
+LIMIT = 10
+
+SCAN_TYPES = ("Index Scan", "Index Only Scan")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    engine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("SELECT setseed(0.42)"))
+        await conn.execute(text("""
+            INSERT INTO users (fullname, email, hashed_password)
+            SELECT 'user-' || g, 'user' || g || '@example.com', 'x' FROM generate_series(1, 2) AS g
+        """))
+        await conn.execute(text("""
+            INSERT INTO boards (name, public, owner_id, post_count)
+            SELECT 'board-' || g,
+                   CASE WHEN g % 1000 = 0 THEN g % 2000 <> 0 ELSE g % 10 <> 0 END,
+                   CASE WHEN g % 1000 = 0 THEN 1 ELSE 2 END,
+                   (random() * 5000)::int
+            FROM generate_series(1, :boards) AS g
+        """), {"boards": BOARDS})
+        await conn.execute(text("""
+            INSERT INTO posts (title, content, author_id, board_id)
+            SELECT 'post-' || g, 'content ' || g, 2, g % 100 + 1
+            FROM generate_series(1, :posts) AS g
+        """), {"posts": POSTS})
+        await conn.execute(text("ANALYZE"))
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db(engine):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def _plans(db: AsyncSession, call) -> List[dict]:
+    """모델 메서드가 실행한 SELECT마다 실행 계획(JSON)을 반환"""
+    statements = []
+
+    def capture(state):
+        if state.is_select:
+            statements.append(state.statement)
+
+    event.listen(db.sync_session, "do_orm_execute", capture)
+    try:
+        await call
+    finally:
+        event.remove(db.sync_session, "do_orm_execute", capture)
+
+    plans = []
+    for statement in statements:
+        compiled = statement.compile(db.bind.sync_engine, compile_kwargs={"literal_binds": True})
+        plans.append((await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))).scalar_one()[0]["Plan"])
+    assert plans, "no query was executed"
+    return plans
+
+
+def _walk(node: dict, parents: tuple = ()) -> Iterator[tuple[dict, tuple]]:
+    yield node, parents
+    for child in node.get("Plans", []):
+        yield from _walk(child, parents + (node,))
+
+
+def _assert_index_plan(plan: dict, indexes: set) -> None:
+    used = set()
+    for node, parents in _walk(plan):
+        if "Relation Name" in node:
+            assert node["Node Type"] in SCAN_TYPES, f"{node['Node Type']} on {node['Relation Name']}"
+            used.add(node["Index Name"])
+        if node["Node Type"] in ("Sort", "Incremental Sort"):
+            # 조건별로 읽은 limit + 1개를 합친 결과의 정렬만 허용
+            assert node["Plans"][0]["Node Type"] == "Append", f"sort over {node['Plans'][0]['Node Type']}"
+    assert used == indexes, f"used {used}, expected {indexes}"
+
+
+def _cursor(codec, values, direction) -> str:
+    return codec.encode(values, str(USER_ID), direction)
+
+
+@pytest.mark.parametrize("cursor", [None, (BOARDS // 2, NEXT), (BOARDS // 2, PREV)], ids=["first", "next", "prev"])
+async def test_boards_by_id_use_id_indexes(db, cursor):
+    token = _cursor(BOARDS_BY_ID, cursor[:1], cursor[1]) if cursor else None
+    (plan,) = await _plans(db, Board.get_boards(db, USER_ID, token, LIMIT))
+    _assert_index_plan(plan, {"ix_boards_public_id", "ix_boards_owner_id_id"})
+
+
+@pytest.mark.parametrize("cursor", [None, (2500, BOARDS // 2, NEXT), (2500, BOARDS // 2, PREV)], ids=["first", "next", "prev"])
+async def test_boards_by_post_count_use_post_count_indexes(db, cursor):
+    token = _cursor(BOARDS_BY_POSTS, cursor[:2], cursor[2]) if cursor else None
+    (plan,) = await _plans(db, Board.get_boards(db, USER_ID, token, LIMIT, sort_by_posts=True))
+    _assert_index_plan(plan, {"ix_boards_public_post_count_id", "ix_boards_owner_id_post_count_id"})
+
+
+@pytest.mark.parametrize("summary", [False, True], ids=["full", "summary"])
+@pytest.mark.parametrize("cursor", [None, (POSTS // 2, NEXT), (POSTS // 2, PREV)], ids=["first", "next", "prev"])
+async def test_posts_by_board_use_board_id_index(db, cursor, summary):
+    token = POSTS_BY_ID.encode(cursor[:1], str(POSTS_BOARD_ID), cursor[1]) if cursor else None
+    (plan,) = await _plans(db, Post.get_posts_by_board(db, POSTS_BOARD_ID, token, LIMIT, summary, 100 if summary else 0))
+    _assert_index_plan(plan, {"ix_posts_board_id_id"})
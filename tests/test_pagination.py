@@ -0,0 +1,111 @@
+"""keyset 페이지네이션 커서 (core.pagination)와 목록 API의 이전/다음 페이지 왕복"""
+import base64
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from core.pagination import BOARDS_BY_ID, BOARDS_BY_POSTS, NEXT, POSTS_BY_ID, POSTS_BY_RANK, PREV, Cursor, build_page
+
+
+def _assert_invalid(codec, token, scope=""):
+    with pytest.raises(HTTPException) as error:
+        codec.decode(token, scope)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize("codec, values", [
+    (BOARDS_BY_ID, (42,)),
+    (BOARDS_BY_POSTS, (7, 42)),
+    (POSTS_BY_RANK, (0.125, 42)),
+])
+@pytest.mark.parametrize("direction", [NEXT, PREV])
+def test_round_trip(codec, values, direction):
+    token = codec.encode(values, "scope", direction)
+    assert codec.decode(token, "scope") == Cursor(values, direction)
+
+
+def test_missing_cursor_is_first_page():
+    assert POSTS_BY_ID.decode(None) is None
+    assert POSTS_BY_ID.decode("") is None
+
+
+def test_tampered_cursor_is_rejected():
+    raw = bytearray(base64.urlsafe_b64decode(POSTS_BY_ID.encode((42,), "1") + "=="))
+    for position in range(len(raw)):
+        tampered = bytearray(raw)
+        tampered[position] ^= 0x01
+        _assert_invalid(POSTS_BY_ID, base64.urlsafe_b64encode(bytes(tampered)).rstrip(b"=").decode(), "1")
+
+
+def test_truncated_or_garbage_cursor_is_rejected():
+    token = POSTS_BY_ID.encode((42,), "1")
+    for bad in (token[:-1], token[:-4], token[:4], token + "AA", "!!!", "a"):
+        _assert_invalid(POSTS_BY_ID, bad, "1")
+
+
+def test_cursor_is_bound_to_scope():
+    # 다른 게시판/사용자의 커서
+    _assert_invalid(POSTS_BY_ID, POSTS_BY_ID.encode((42,), "1"), "2")
+
+
+def test_cursor_from_other_listing_is_rejected():
+    # 같은 값 형식이어도 태그가 다르면 거부, 형식이 다르면 길이에서 거부
+    _assert_invalid(POSTS_BY_ID, BOARDS_BY_ID.encode((42,), "1"), "1")
+    _assert_invalid(BOARDS_BY_POSTS, BOARDS_BY_ID.encode((42,), "1"), "1")
+    _assert_invalid(POSTS_BY_RANK, BOARDS_BY_POSTS.encode((1, 42), "1"), "1")
+
+
+def test_build_page_links():
+    rows = [{"id": i} for i in (5, 4, 3)]
+    key_of = lambda row: (row["id"],)
+
+    # 첫 페이지: 다음만 있음
+    items, next_cursor, prev_cursor = build_page(list(rows), 2, None, POSTS_BY_ID, key_of)
+    assert [row["id"] for row in items] == [5, 4]
+    assert POSTS_BY_ID.decode(next_cursor) == Cursor((4,), NEXT)
+    assert prev_cursor is None
+
+    # 이전 페이지로 이동한 결과는 역순으로 조회되므로 뒤집고, 다음 페이지는 항상 있음
+    items, next_cursor, prev_cursor = build_page([{"id": 6}], 2, Cursor((5,), PREV), POSTS_BY_ID, key_of)
+    assert [row["id"] for row in items] == [6]
+    assert POSTS_BY_ID.decode(next_cursor) == Cursor((6,), NEXT)
+    assert prev_cursor is None
+
+
+async def test_post_listing_prev_next_round_trip(client):
+    response = await client.post("/auth/signup", json={
+        "fullname": "Page User", "email": "page@example.com", "password": "pagepassword",
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    board_id = (await client.post("/boards", json={"name": "pages", "public": True}, headers=headers)).json()["id"]
+    post_ids = []
+    for i in range(7):
+        response = await client.post("/posts", json={"title": f"t{i}", "content": "c", "board_id": board_id}, headers=headers)
+        post_ids.append(response.json()["id"])
+
+    async def page(cursor=None) -> dict:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(f"/posts/board/{board_id}", params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    # 다음 페이지로 끝까지
+    pages = [await page()]
+    while pages[-1]["next_cursor"]:
+        pages.append(await page(pages[-1]["next_cursor"]))
+    assert [[post["id"] for post in p["items"]] for p in pages] == [post_ids[::-1][i:i + 3] for i in (0, 3, 6)]
+    assert pages[0]["prev_cursor"] is None
+
+    # 이전 페이지로 처음까지
+    back = [pages[-1]]
+    while back[-1]["prev_cursor"]:
+        back.append(await page(back[-1]["prev_cursor"]))
+    assert [p["items"] for p in back] == [p["items"] for p in reversed(pages)]
+
+    # 다른 게시판이나 다른 목록의 커서는 400
+    other_id = (await client.post("/boards", json={"name": "other", "public": True}, headers=headers)).json()["id"]
+    response = await client.get(f"/posts/board/{other_id}", params={"cursor": pages[0]["next_cursor"]}, headers=headers)
+    assert response.status_code == 400
+    response = await client.get("/boards", params={"cursor": pages[0]["next_cursor"]}, headers=headers)
+    assert response.status_code == 400
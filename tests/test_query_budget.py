@@ -0,0 +1,56 @@
+"""엔드포인트별 SQL 문 수 예산 (X-Query-Count 헤더로 확인)
+
+인증은 Redis 세션으로 처리하므로 DB 조회에 포함되지 않는다.
+"""
+import httpx
+
+
+async def _signup(client: httpx.AsyncClient) -> dict:
+    response = await client.post("/auth/signup", json={
+        "fullname": "Budget User", "email": "budget@example.com", "password": "budgetpassword",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _create_board(client: httpx.AsyncClient, headers: dict) -> int:
+    response = await client.post("/boards", json={"name": "budget", "public": True}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+async def _create_post(client: httpx.AsyncClient, headers: dict, board_id: int) -> int:
+    response = await client.post("/posts", json={"title": "t", "content": "c", "board_id": board_id}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _query_count(response: httpx.Response) -> int:
+    return int(response.headers["x-query-count"])
+
+
+async def test_get_post_uses_one_query(client):
+    headers = await _signup(client)
+    post_id = await _create_post(client, headers, await _create_board(client, headers))
+
+    response = await client.get(f"/posts/{post_id}", headers=headers)
+    assert response.status_code == 200
+    assert _query_count(response) == 1
+
+
+async def test_update_board_uses_one_query(client):
+    headers = await _signup(client)
+    board_id = await _create_board(client, headers)
+
+    response = await client.put(f"/boards/{board_id}", json={"name": "renamed", "public": True}, headers=headers)
+    assert response.status_code == 200
+    assert _query_count(response) == 1
+
+
+async def test_delete_post_uses_two_queries(client):
+    headers = await _signup(client)
+    post_id = await _create_post(client, headers, await _create_board(client, headers))
+
+    response = await client.delete(f"/posts/{post_id}", headers=headers)
+    assert response.status_code == 204
+    assert _query_count(response) == 2
@@ -0,0 +1,101 @@
+"""요청 수 제한 (token bucket): 429와 Retry-After, IP 기준 인증 한도, Redis 장애 시 프로세스 내 버킷, 일괄 작성 차감"""
+import httpx
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import RedisError
+
+from core.config import get_settings
+from core.ratelimit import Limit, RateLimiter
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    """작은 한도로 요청 수 제한 활성화 (분당 1회 보충이라 테스트 중에는 거의 채워지지 않음)"""
+    settings = get_settings()
+    values = {
+        "RATE_LIMIT_ENABLED": True,
+        "RATE_LIMIT_AUTH_PER_MINUTE": 1, "RATE_LIMIT_AUTH_BURST": 3,
+        "RATE_LIMIT_READ_PER_MINUTE": 1, "RATE_LIMIT_READ_BURST": 100,
+        "RATE_LIMIT_WRITE_PER_MINUTE": 1, "RATE_LIMIT_WRITE_BURST": 5,
+    }
+    for name, value in values.items():
+        monkeypatch.setattr(settings, name, value)
+    return settings
+
+
+def _signup_body(i: int) -> dict:
+    return {"fullname": f"User {i}", "email": f"user{i}@example.com", "password": "ratelimitpassword"}
+
+
+def _client_from(client: httpx.AsyncClient, host: str) -> httpx.AsyncClient:
+    """같은 앱에 다른 클라이언트 IP로 요청하는 클라이언트"""
+    from main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app, client=(host, 50000)), base_url=client.base_url)
+
+
+async def test_auth_routes_are_limited_per_ip_with_retry_after(client, limits):
+    async with _client_from(client, "10.0.0.1") as first, _client_from(client, "10.0.0.2") as second:
+        for i in range(limits.RATE_LIMIT_AUTH_BURST):
+            assert (await first.post("/auth/signup", json=_signup_body(i))).status_code == 200
+
+        response = await first.post("/auth/token", data={"username": "user0@example.com", "password": "ratelimitpassword"})
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+
+        # 다른 IP는 자기 버킷을 사용
+        response = await second.post("/auth/token", data={"username": "user0@example.com", "password": "ratelimitpassword"})
+        assert response.status_code == 200
+
+
+async def test_writes_are_limited_per_user(client, limits):
+    async with _client_from(client, "10.0.0.3") as other:
+        token = (await client.post("/auth/signup", json=_signup_body(1))).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        for i in range(limits.RATE_LIMIT_WRITE_BURST):
+            response = await client.post("/boards", json={"name": f"b{i}", "public": True}, headers=headers)
+            assert response.status_code == 201
+
+        response = await client.post("/boards", json={"name": "over", "public": True}, headers=headers)
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+        # 사용자 기준이므로 IP가 달라도 같은 버킷
+        response = await other.post("/boards", json={"name": "over", "public": True}, headers=headers)
+        assert response.status_code == 429
+        # 조회는 별도 한도
+        assert (await client.get("/boards", headers=headers)).status_code == 200
+
+
+async def test_bulk_create_charges_one_write_per_batch(client, limits, monkeypatch):
+    monkeypatch.setattr(limits, "BULK_POST_BATCH_SIZE", 2)
+    token = (await client.post("/auth/signup", json=_signup_body(1))).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    board_id = (await client.post("/boards", json={"name": "bulk", "public": True}, headers=headers)).json()["id"]
+    items = lambda n: [{"title": f"t{i}", "content": "c", "board_id": board_id} for i in range(n)]
+
+    # 게시판 작성 1 + 2개 배치 2번 = 2 -> 남은 쓰기 토큰 2
+    response = await client.post("/posts/bulk", json=items(4), headers=headers)
+    assert response.status_code == 200
+    assert response.json()["created"] == 4
+
+    # 3개 배치 = 3 > 2 -> 커밋 전에 거부되어 아무것도 저장되지 않음
+    response = await client.post("/posts/bulk", json=items(6), headers=headers)
+    assert response.status_code == 429
+    board = (await client.get(f"/boards/{board_id}", headers=headers)).json()
+    assert board["post_count"] == 4
+
+
+async def test_falls_back_to_local_buckets_when_redis_fails():
+    limiter = RateLimiter()
+    limiter.bind(FakeAsyncRedis(decode_responses=True))
+
+    async def failing_script(**kwargs):
+        raise RedisError("connection refused")
+
+    limiter._script = failing_script
+    limit = Limit(per_minute=1, burst=2)
+    assert await limiter.hit("writes:user:1", limit) == 0
+    assert await limiter.hit("writes:user:1", limit) == 0
+    assert await limiter.hit("writes:user:1", limit) > 0
+    # 다른 키는 자기 버킷
+    assert await limiter.hit("writes:user:2", limit) == 0
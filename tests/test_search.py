@@ -0,0 +1,122 @@
+"""게시판 내 전문 검색 (GET /posts/board/{board_id}/search)
+
+관련도 순 (rank, id) keyset 페이지 확인은 Postgres가 필요하므로 TEST_DATABASE_URL(postgresql+asyncpg://...)이 없으면 건너뛴다.
+테이블을 지우고 다시 만들므로 테스트 전용 DB를 사용한다.
+"""
+import os
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.database import Base
+from models.user import User  # noqa: F401 (관계 매핑 등록)
+from models.board import Board  # noqa: F401
+from models.post import Post
+
+DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+requires_postgres = pytest.mark.skipif(
+    not DATABASE_URL.startswith("postgresql"), reason="TEST_DATABASE_URL (Postgres) is not set"
+)
+
+BOARD_ID = 1
+# 검색어가 나오는 횟수로 관련도를 다르게 하고, 같은 본문으로 동점도 만듦
+CONTENTS = [
+    "apple", "apple apple", "apple apple apple", "banana", "apple banana",
+    "apple", "apple apple", "cherry", "apple apple apple apple", "apple",
+] * 3
+
+
+async def test_search_on_sqlite_is_501(client):
+    response = await client.post("/auth/signup", json={
+        "fullname": "Search User", "email": "search@example.com", "password": "searchpassword",
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    board_id = (await client.post("/boards", json={"name": "search", "public": True}, headers=headers)).json()["id"]
+    await client.post("/posts", json={"title": "t", "content": "apple", "board_id": board_id}, headers=headers)
+
+    response = await client.get(f"/posts/board/{board_id}/search", params={"q": "apple"}, headers=headers)
+    assert response.status_code == 501
+    assert response.json()["detail"] == "Full-text search requires PostgreSQL"
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    engine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("INSERT INTO users (fullname, email, hashed_password) VALUES ('u', 'u@example.com', 'x')"))
+        await conn.execute(text("INSERT INTO boards (name, public, owner_id) VALUES ('search', true, 1), ('other', true, 1)"))
+        await conn.execute(
+            text("INSERT INTO posts (title, content, author_id, board_id) VALUES (:title, :content, 1, :board_id)"),
+            [{"title": f"post {i}", "content": content, "board_id": BOARD_ID} for i, content in enumerate(CONTENTS)]
+            + [{"title": "other board", "content": "apple", "board_id": 2}],
+        )
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db(engine):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def _all_pages(db: AsyncSession, query_text: str, limit: int) -> list[list[dict]]:
+    pages, cursor = [], None
+    while True:
+        posts, cursor, _ = await Post.search_posts(db, BOARD_ID, query_text, cursor, limit)
+        pages.append(posts)
+        if cursor is None:
+            return pages
+
+
+@requires_postgres
+@pytest.mark.asyncio(loop_scope="module")
+async def test_search_pages_by_rank_then_id(db):
+    pages = await _all_pages(db, "apple", 4)
+    posts = [post for page in pages for post in page]
+    expected = sum(1 for content in CONTENTS if "apple" in content)
+    assert len(posts) == expected
+    assert len({post["id"] for post in posts}) == expected
+    assert all(post["board_id"] == BOARD_ID for post in posts)
+    # 관련도 내림차순, 동점이면 id 내림차순
+    keys = [(post["rank"], post["id"]) for post in posts]
+    assert keys == sorted(keys, reverse=True)
+    assert len({post["rank"] for post in posts}) > 1
+    assert all("apple" in post["excerpt"] for post in posts)
+
+
+@requires_postgres
+@pytest.mark.asyncio(loop_scope="module")
+async def test_search_prev_cursor_returns_previous_page(db):
+    first, next_cursor, prev_cursor = await Post.search_posts(db, BOARD_ID, "apple", None, 5)
+    assert prev_cursor is None
+    second, _, prev_cursor = await Post.search_posts(db, BOARD_ID, "apple", next_cursor, 5)
+    assert prev_cursor is not None
+    back, _, _ = await Post.search_posts(db, BOARD_ID, "apple", prev_cursor, 5)
+    assert [post["id"] for post in back] == [post["id"] for post in first]
+    assert {post["id"] for post in first}.isdisjoint(post["id"] for post in second)
+
+
+@requires_postgres
+@pytest.mark.asyncio(loop_scope="module")
+async def test_search_cursor_is_bound_to_query(db):
+    _, next_cursor, _ = await Post.search_posts(db, BOARD_ID, "apple", None, 2)
+    with pytest.raises(HTTPException) as error:
+        await Post.search_posts(db, BOARD_ID, "banana", next_cursor, 2)
+    assert error.value.status_code == 400
+
+
+@requires_postgres
+@pytest.mark.asyncio(loop_scope="module")
+async def test_search_websearch_syntax(db):
+    posts = [post for page in await _all_pages(db, "apple -banana", 50) for post in page]
+    assert len(posts) == sum(1 for content in CONTENTS if "apple" in content and "banana" not in content)
+    posts = [post for page in await _all_pages(db, "cherry", 50) for post in page]
+    assert len(posts) == CONTENTS.count("cherry")
@@ -0,0 +1,92 @@
+"""세션 상한, 전체 로그아웃, 토큰 갱신 시 사용자별 세션 목록 유지 확인"""
+import httpx
+import pytest
+from jose import jwt
+
+from core.config import get_settings
+from core.session import session_store, user_sessions_key
+
+EMAIL = "session@example.com"
+PASSWORD = "sessionpassword"
+
+
+@pytest.fixture
+def session_cap(monkeypatch):
+    monkeypatch.setattr(get_settings(), "SESSION_MAX_PER_USER", 3)
+    return 3
+
+
+async def _signup(client: httpx.AsyncClient) -> str:
+    response = await client.post("/auth/signup", json={"fullname": "Session User", "email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+async def _login(client: httpx.AsyncClient) -> str:
+    response = await client.post("/auth/token", data={"username": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+async def _status(client: httpx.AsyncClient, token: str) -> int:
+    return (await client.get("/boards", headers={"Authorization": f"Bearer {token}"})).status_code
+
+
+def _claims(token: str) -> dict:
+    return jwt.get_unverified_claims(token)
+
+
+async def _indexed_sessions(user_id: int) -> list:
+    return await session_store.client.zrange(user_sessions_key(user_id), 0, -1)
+
+
+async def test_oldest_sessions_are_evicted_over_cap(client, session_cap):
+    tokens = [await _signup(client)]
+    for _ in range(session_cap + 1):
+        tokens.append(await _login(client))
+
+    # 상한(3)을 넘은 가장 오래된 두 세션은 폐기되고 최근 세션만 유효
+    assert [await _status(client, token) for token in tokens] == [401, 401, 200, 200, 200]
+    user_id = _claims(tokens[0])["uid"]
+    assert sorted(await _indexed_sessions(user_id)) == sorted(_claims(t)["session"] for t in tokens[-session_cap:])
+
+
+async def test_logout_all_revokes_every_session(client, session_cap):
+    tokens = [await _signup(client), await _login(client), await _login(client)]
+    assert all([await _status(client, token) == 200 for token in tokens])
+
+    response = await client.post("/auth/logout-all", headers={"Authorization": f"Bearer {tokens[0]}"})
+    assert response.status_code == 200, response.text
+    assert response.json()["revoked"] == len(tokens)
+    assert [await _status(client, token) for token in tokens] == [401] * len(tokens)
+    assert await _indexed_sessions(_claims(tokens[0])["uid"]) == []
+
+    # 전체 로그아웃 후 새로 로그인하면 다시 사용 가능
+    assert await _status(client, await _login(client)) == 200
+
+
+async def test_refresh_rotates_session_in_index(client, session_cap):
+    other = await _signup(client)
+    old = await _login(client)
+    user_id = _claims(old)["uid"]
+
+    response = await client.post("/auth/refresh", headers={"Authorization": f"Bearer {old}"})
+    assert response.status_code == 200, response.text
+    new = response.json()["access_token"]
+
+    assert await _status(client, old) == 401
+    assert await _status(client, new) == 200
+    assert await _status(client, other) == 200
+    # 이전 세션은 목록에서 빠지고 새 세션으로 교체되어 세션 수는 그대로
+    assert sorted(await _indexed_sessions(user_id)) == sorted([_claims(other)["session"], _claims(new)["session"]])
+
+    # 이미 교체된 세션으로는 다시 갱신할 수 없음
+    response = await client.post("/auth/refresh", headers={"Authorization": f"Bearer {old}"})
+    assert response.status_code == 401
+
+    # 갱신된 세션도 상한 계산에 포함: 두 번 더 로그인하면 가장 오래된 세션(other)부터 폐기
+    for _ in range(2):
+        await _login(client)
+    assert await _status(client, other) == 401
+    assert await _status(client, new) == 200
+    assert len(await _indexed_sessions(user_id)) == session_cap
@@ -0,0 +1,158 @@
+"""액세스 토큰 검증(TokenVerifier)과 워커 간 세션 폐기 전파 확인"""
+import asyncio
+import base64
+import time
+
+import orjson
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from jose import JWTError, jwt
+from redis.exceptions import RedisError
+
+import core.security as security
+from core.config import get_settings
+from core.security import TokenVerifier
+from core.session import SessionStore
+
+
+def _token(claims: dict = None, key: str = None, algorithm: str = None) -> str:
+    settings = get_settings()
+    claims = {"uid": 1, "session": "s1", "exp": int(time.time()) + 60, **(claims or {})}
+    return jwt.encode(claims, key or settings.SECRET_KEY, algorithm=algorithm or settings.ALGORITHM)
+
+
+def _segment(value: dict) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(value)).rstrip(b"=").decode()
+
+
+def test_valid_token_returns_claims():
+    verifier = TokenVerifier()
+    claims = verifier.verify(_token())
+    assert claims["uid"] == 1 and claims["session"] == "s1"
+    # 캐시된 토큰도 같은 claims
+    assert verifier.verify(_token()) == claims
+
+
+def test_tampered_signature_is_rejected():
+    token = _token()
+    header, payload, signature = token.split(".")
+    tampered_payload = _segment({"uid": 2, "session": "s1", "exp": int(time.time()) + 60})
+    flipped = signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")
+
+    verifier = TokenVerifier()
+    for forged in (f"{header}.{tampered_payload}.{signature}", f"{header}.{payload}.{flipped}"):
+        with pytest.raises(JWTError):
+            verifier.verify(forged)
+
+
+def test_token_signed_with_other_key_is_rejected():
+    with pytest.raises(JWTError):
+        TokenVerifier().verify(_token(key="another-secret-key-at-least-32-characters"))
+
+
+def test_algorithm_mismatch_is_rejected():
+    assert get_settings().ALGORITHM != "HS512"
+    with pytest.raises(JWTError, match="Algorithm not allowed"):
+        TokenVerifier().verify(_token(algorithm="HS512"))
+
+
+def test_alg_none_is_rejected():
+    header = _segment({"alg": "none", "typ": "JWT"})
+    payload = _segment({"uid": 1, "session": "s1", "exp": int(time.time()) + 60})
+    verifier = TokenVerifier()
+    for token in (f"{header}.{payload}.", f"{header}.{payload}.{_token().split('.')[2]}"):
+        with pytest.raises(JWTError, match="Algorithm not allowed"):
+            verifier.verify(token)
+
+
+def test_expired_token_is_rejected():
+    with pytest.raises(JWTError, match="expired"):
+        TokenVerifier().verify(_token({"exp": int(time.time()) - 1}))
+
+
+def test_cached_token_expires(monkeypatch):
+    verifier = TokenVerifier()
+    token = _token({"exp": int(time.time()) + 5})
+    verifier.verify(token)
+
+    monkeypatch.setattr(security.time, "time", lambda: 1e12)
+    with pytest.raises(JWTError, match="expired"):
+        verifier.verify(token)
+
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c.d"])
+def test_wrong_number_of_segments_is_rejected(token):
+    with pytest.raises(JWTError):
+        TokenVerifier().verify(token)
+
+
+def test_unsigned_headers_are_not_remembered():
+    verifier = TokenVerifier()
+    payload = _segment({"uid": 1, "session": "s1", "exp": int(time.time()) + 60})
+    for i in range(100):
+        # 허용된 알고리즘이지만 서명되지 않은 헤더를 매번 다르게 보내도 기억하지 않음
+        header = _segment({"alg": get_settings().ALGORITHM, "kid": str(i)})
+        with pytest.raises(JWTError):
+            verifier.verify(f"{header}.{payload}.c2lnbmF0dXJl")
+    assert len(verifier._headers) == 0
+
+    verifier.verify(_token())
+    assert len(verifier._headers) == 1
+
+
+async def _wait_for(condition, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def test_revocation_reaches_other_workers_via_pubsub():
+    server = FakeServer()
+    # 같은 Redis를 쓰는 두 워커
+    worker_a, worker_b = SessionStore(), SessionStore()
+    await worker_a.connect(FakeAsyncRedis(server=server, decode_responses=True))
+    await worker_b.connect(FakeAsyncRedis(server=server, decode_responses=True))
+    try:
+        await _wait_for(lambda: worker_a.revocations.synced and worker_b.revocations.synced)
+        await worker_a.create("s1", 1)
+        assert await worker_b.is_active("s1", 1)
+
+        await worker_a.delete("s1", 1)
+        assert not await worker_a.is_active("s1", 1)
+        # worker_b는 Redis를 조회하지 않고 구독 메시지로 폐기를 알게 됨
+        await _wait_for(lambda: worker_b.revocations.is_revoked("s1"))
+        assert not await worker_b.is_active("s1", 1)
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+async def _signup(client) -> str:
+    response = await client.post("/auth/signup", json={
+        "fullname": "Token User", "email": "token@example.com", "password": "tokenpassword",
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+async def test_logout_with_invalid_token_is_401(client):
+    for token in ("a.b.c", _token({"session": None})):
+        response = await client.post("/auth/logout", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401, response.text
+
+
+async def test_unsynced_session_check_without_redis_is_503(client, monkeypatch):
+    from core.session import session_store
+
+    token = await _signup(client)
+    # 폐기 목록 구독이 끊긴 상태에서 Redis 조회도 실패
+    await session_store.revocations.stop()
+
+    async def unavailable(session_id):
+        raise RedisError("connection refused")
+
+    monkeypatch.setattr(session_store, "get_user_id", unavailable)
+    response = await client.get("/boards", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"